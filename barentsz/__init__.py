@@ -1,12 +1,34 @@
+from barentsz._attribute_table import AttributeTable, discover_attribute_table
+from barentsz._describe import to_descriptors
+from barentsz._descriptor import Descriptor
 from barentsz._discover import (
     discover,
     discover_attributes,
     discover_classes,
+    discover_decorated,
     discover_functions,
     discover_module_names,
     discover_modules,
     discover_packages,
     discover_paths,
 )
+from barentsz._events import subscribe, unsubscribe
+from barentsz._filters import (
+    Filter,
+    decorated_with,
+    has_attribute,
+    in_module,
+    is_abstract,
+    name_matches,
+    predicate,
+)
+from barentsz._graph import ImportGraph, discover_import_graph
 from barentsz._here import here
+from barentsz._importing import clear_failed_imports, failed_imports
 from barentsz._meta import __version__
+from barentsz._query import Query
+from barentsz._registry import Registry
+from barentsz._report import Report
+from barentsz._session import Session
+from barentsz._walker import Walker
+from barentsz._warmup import warmup
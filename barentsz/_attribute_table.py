@@ -0,0 +1,196 @@
+import re
+import sys
+from array import array
+from fnmatch import fnmatch
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from barentsz._attribute import Attribute
+from barentsz._discover import _discover_attributes_in_module
+from barentsz._modules import _get_modules_from_source
+from barentsz._typings import Source
+from barentsz._walker import Walker
+
+
+class AttributeTable:
+    """
+    Attributes in columns rather than as Attribute objects: parallel arrays
+    of names, module names, line numbers, hints and types. Strings are
+    interned, so repeated module names and hints are stored once. Attribute
+    objects are only created upon iteration or indexing.
+
+    Example:
+        table = discover_attribute_table('my_package')
+        table.where(name='^[A-Z_]+$', module='my_package.settings*')
+    """
+
+    def __init__(
+            self,
+            names: Iterable[str] = (),
+            module_names: Iterable[str] = (),
+            line_nrs: Iterable[int] = (),
+            hints: Iterable[Optional[str]] = (),
+            types: Iterable[type] = ()):
+        """
+        Constructor.
+        :param names: the names of the attributes.
+        :param module_names: the names of the modules of the attributes.
+        :param line_nrs: the line numbers of the attributes.
+        :param hints: the hinted types of the attributes (or None).
+        :param types: the actual types of the attributes.
+        """
+        self.names = [sys.intern(name) for name in names]
+        self.module_names = [sys.intern(name) for name in module_names]
+        self.line_nrs = array('l', line_nrs)
+        self.hints = [hint and sys.intern(hint) for hint in hints]
+        self.types = list(types)
+
+    def where(
+            self,
+            name: Optional[str] = None,
+            module: Optional[str] = None,
+            hint: Optional[str] = None) -> 'AttributeTable':
+        """
+        Return the rows of this table that match all given criteria. Each
+        criterion is evaluated once per distinct value in its column.
+        :param name: a regular expression that names must match.
+        :param module: a glob pattern that module names must match.
+        :param hint: the hint that attributes must have.
+        :return: a new AttributeTable.
+        """
+        indices: Sequence[int] = range(len(self))
+        if name is not None:
+            regex = re.compile(name)
+            indices = _matching(self.names, indices,
+                                lambda value: bool(regex.match(value)))
+        if module is not None:
+            indices = _matching(self.module_names, indices,
+                                lambda value: fnmatch(value, module))
+        if hint is not None:
+            indices = _matching(self.hints, indices,
+                                lambda value: value == hint)
+        return self._take(indices)
+
+    def __getitem__(self, index: int) -> Attribute:
+        """
+        Return the attribute in the given row, which is created from the
+        module of the attribute.
+        :param index: the index of a row.
+        :return: an Attribute.
+        """
+        return _attributes_per_line(self.module_names[index])[
+            self.line_nrs[index], self.names[index]]
+
+    def __iter__(self) -> Iterator[Attribute]:
+        """
+        Iterate over the attributes in this table, which are created one at a
+        time. Every module is examined once per iteration.
+        :return: an iterator of Attributes.
+        """
+        attributes_per_module: Dict[str, Dict[Tuple[int, str],
+                                              Attribute]] = {}
+        for module_name, line_nr, name in zip(self.module_names,
+                                              self.line_nrs, self.names):
+            if module_name not in attributes_per_module:
+                attributes_per_module[module_name] = _attributes_per_line(
+                    module_name)
+            yield attributes_per_module[module_name][line_nr, name]
+
+    def __len__(self) -> int:
+        """
+        Return the number of rows in this table.
+        :return: the number of attributes.
+        """
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        """
+        Return a representation of this table.
+        :return: a string representation.
+        """
+        return 'AttributeTable({} attributes in {} modules)'.format(
+            len(self), len(set(self.module_names)))
+
+    def _take(self, indices: Iterable[int]) -> 'AttributeTable':
+        # Return a new table with the rows at the given indices.
+        indices = list(indices)
+        return AttributeTable([self.names[i] for i in indices],
+                              [self.module_names[i] for i in indices],
+                              [self.line_nrs[i] for i in indices],
+                              [self.hints[i] for i in indices],
+                              [self.types[i] for i in indices])
+
+
+def discover_attribute_table(
+        source: Source,
+        signature: type = Any,  # type: ignore
+        include_privates: bool = False,
+        in_private_modules: bool = False,
+        raise_on_fail: bool = False,
+        walker: Optional[Walker] = None) -> AttributeTable:
+    """
+    Discover any attributes within the given source like discover_attributes,
+    but return them in a columnar AttributeTable. The Attribute objects of one
+    module at a time are created and dropped after they were added.
+
+    Args:
+        source: the source in which is searched for any attributes.
+        signature: only attributes that are subtypes of this signature are
+        included.
+        include_privates: if True, private attributes are included as well.
+        in_private_modules: if True, private modules are explored as well.
+        raise_on_fail: if True, raises an ImportError upon the first import
+        failure.
+        walker: a Walker that determines which directories are walked.
+
+    Returns: an AttributeTable, sorted by attribute name.
+
+    """
+    rows: List[Tuple[str, str, int, Optional[str], type]] = []
+    modules = _get_modules_from_source(source, in_private_modules,
+                                       raise_on_fail, walker, stream=True)
+    for module in modules:
+        rows.extend((attribute.name, module.__name__, attribute.line_nr,
+                     attribute.hint, attribute.type_) for attribute
+                    in _discover_attributes_in_module(module, signature,
+                                                      include_privates))
+    rows.sort(key=itemgetter(0))
+    # The rows are transposed into the columns of the table.
+    return AttributeTable(*zip(*rows))
+
+
+def _matching(
+        column: Sequence[Any],
+        indices: Iterable[int],
+        predicate: Callable[[Any], bool]) -> List[int]:
+    # Return the indices of which the value in column passes predicate, which
+    # is evaluated once per distinct value.
+    verdicts: Dict[Any, bool] = {}
+    result = []
+    for index in indices:
+        value = column[index]
+        if value not in verdicts:
+            verdicts[value] = predicate(value)
+        if verdicts[value]:
+            result.append(index)
+    return result
+
+
+def _attributes_per_line(
+        module_name: str) -> Dict[Tuple[int, str], Attribute]:
+    # Examine the (imported) module and index its attributes by line number
+    # and name, as multiple attributes may be assigned on one line.
+    attributes = _discover_attributes_in_module(sys.modules[module_name], Any,
+                                                True)
+    return {(attribute.line_nr, attribute.name): attribute
+            for attribute in attributes}
@@ -0,0 +1,52 @@
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar('T')
+
+
+class MtimeCache(Generic[T]):
+    """
+    A cache of values that are derived from files, keyed by the path and the
+    modification time of each file. A value is computed again once its file
+    is modified, in which case the outdated value is replaced. Concurrent
+    callers may both compute a missing value; the last one is kept.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self._values: Dict[str, Tuple[Optional[float], T]] = {}
+
+    def get(
+            self,
+            path: str,
+            mtime: Optional[float],
+            compute: Callable[[], T]) -> T:
+        """
+        Return the value for the given path and mtime, which is computed if
+        it is not in the cache (anymore).
+        :param path: the path to the file from which the value is derived.
+        :param mtime: the current modification time of that file.
+        :param compute: a callable that derives the value from the file.
+        :return: the (cached) value.
+        """
+        cached = self._values.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        value = compute()
+        self._values[path] = (mtime, value)
+        return value
+
+    def clear(self) -> None:
+        """
+        Remove all values from this cache.
+        :return: None.
+        """
+        self._values.clear()
@@ -0,0 +1,63 @@
+from inspect import isclass, signature
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+)
+
+from barentsz._attribute import Attribute
+from barentsz._descriptor import (
+    ATTRIBUTE,
+    CLASS,
+    FUNCTION,
+    Descriptor,
+)
+from barentsz._static import static_descriptor
+
+
+def to_descriptors(elements: Iterable[Any]) -> List[Descriptor]:
+    """
+    Turn the given discovered elements (classes, functions or attributes) into
+    Descriptors, which can be pickled and sent to other processes. Use
+    Descriptor.rehydrate to obtain an element again.
+    Args:
+        elements: the results of discover_classes, discover_functions or
+        discover_attributes.
+
+    Returns: a list of Descriptors in the same order as elements.
+
+    """
+    return [_to_descriptor(elem) for elem in elements]
+
+
+def _to_descriptor(elem: Any) -> Descriptor:
+    """
+    Turn the given class, function or attribute into a Descriptor.
+    Args:
+        elem: a class, function or Attribute.
+
+    Returns: a Descriptor.
+
+    """
+    if isinstance(elem, Attribute):
+        return Descriptor(elem.module.__name__, elem.name, ATTRIBUTE,
+                          elem.line_nr,
+                          path=getattr(elem.module, '__file__', None),
+                          hint=elem.hint, literal=elem.assigned_value)
+    static = static_descriptor(elem)
+    code = getattr(elem, '__code__', None)
+    line_nr = static.line_nr if static else getattr(code, 'co_firstlineno', 0)
+    return Descriptor(elem.__module__, elem.__qualname__,
+                      CLASS if isclass(elem) else FUNCTION, line_nr,
+                      static.decorators if static else (),
+                      static.path if static else None,
+                      signature=_signature_text(elem))
+
+
+def _signature_text(elem: Any) -> Optional[str]:
+    # Return the signature of elem as text, if it has any.
+    try:
+        return str(signature(elem))
+    except (TypeError, ValueError):
+        return None
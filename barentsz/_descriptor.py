@@ -0,0 +1,121 @@
+import ast
+from importlib import import_module
+from typing import (
+    Any,
+    Iterable,
+    Optional,
+)
+
+CLASS = 'class'
+FUNCTION = 'function'
+ATTRIBUTE = 'attribute'
+
+
+class Descriptor:
+    """
+    Describes a class, function or attribute by name rather than by
+    reference. Descriptors hold only strings and numbers, so they can be
+    pickled and sent to other processes, which can rehydrate only the elements
+    that they need.
+    """
+
+    def __init__(
+            self,
+            module: str,
+            qualname: str,
+            kind: str,
+            line_nr: int,
+            decorators: Iterable[str] = (),
+            path: Optional[str] = None,
+            signature: Optional[str] = None,
+            hint: Optional[str] = None,
+            literal: Optional[str] = None):
+        """
+        Constructor.
+        :param module: the full name of the module that contains the element.
+        :param qualname: the qualified name of the element within the module.
+        :param kind: the kind of the element ('class', 'function' or
+        'attribute').
+        :param line_nr: the line number on which the element is defined.
+        :param decorators: the (resolved) names of the decorators of the
+        element.
+        :param path: the path to the file of the module (if any).
+        :param signature: the signature of a class or function as text.
+        :param hint: the type hint of an attribute as text.
+        :param literal: the value that is assigned to an attribute as text.
+        """
+        self.module = module
+        self.qualname = qualname
+        self.kind = kind
+        self.line_nr = line_nr
+        self.decorators = tuple(decorators)
+        self.path = path
+        self.signature = signature
+        self.hint = hint
+        self.literal = literal
+
+    @property
+    def name(self) -> str:
+        """
+        Return the name of the described element.
+        :return: the last part of the qualified name.
+        """
+        return self.qualname.rpartition('.')[2]
+
+    @property
+    def is_private(self) -> bool:
+        """
+        Return whether the described element is marked as private.
+        :return: True if the element is supposed to be private.
+        """
+        return self.name.startswith('_')
+
+    @property
+    def literal_value(self) -> Any:
+        """
+        Return the value of the literal of an attribute, without importing
+        its module. Only literals (strings, numbers, lists, dicts, etc.) can
+        be evaluated.
+        :return: the evaluated literal.
+        """
+        if self.literal is None:
+            raise ValueError('{} has no literal.'.format(self))
+        return ast.literal_eval(self.literal)
+
+    def rehydrate(self) -> Any:
+        """
+        Return the described element itself, which imports its module if
+        that did not happen yet.
+        :return: the class, function or attribute value.
+        """
+        result = import_module(self.module)
+        for part in self.qualname.split('.'):
+            result = getattr(result, part)
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare this descriptor with other and check if they are equal.
+        :param other: another descriptor instance.
+        :return: True if both describe the same element.
+        """
+        return (isinstance(other, Descriptor)
+                and other.module == self.module
+                and other.qualname == self.qualname
+                and other.kind == self.kind
+                and other.line_nr == self.line_nr)
+
+    def __hash__(self) -> int:
+        """
+        Return a hash of this descriptor.
+        :return: the hash of this descriptor.
+        """
+        return hash((self.module, self.qualname, self.kind, self.line_nr))
+
+    def __repr__(self) -> str:
+        """
+        Return a representation of this descriptor.
+        :return: a string representation.
+        """
+        return 'Descriptor({}.{}, {}, line {})'.format(
+            self.module, self.qualname, self.kind, self.line_nr)
@@ -1,7 +1,4 @@
-import glob
 import re
-import sys
-from importlib import import_module
 from inspect import (
     getmembers,
     isclass,
@@ -9,11 +6,15 @@ from inspect import (
     ismethod,
 )
 from pathlib import Path
+from pkgutil import get_importer
+from time import perf_counter
+from types import CodeType
 from typing import (
     Any,
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -30,8 +31,50 @@ from typish import (
 )
 
 from barentsz._attribute import Attribute
+from barentsz._descriptor import ATTRIBUTE, Descriptor
+from barentsz._events import (
+    ELEMENT_MATCHED,
+    emit,
+    emit_all,
+)
+from barentsz._filters import Filter, predicate
 from barentsz._here import here
-from barentsz._typings import ClsPredicate
+from barentsz._importing import _import_modules, tracing
+from barentsz._modules import (
+    _discover_loaded_modules,
+    _discover_loaded_subclasses,
+    _get_modules_from_source,
+    _has_subclasses,
+)
+from barentsz._paths import (
+    _add_to_sys_path,
+    _discover_paths_in_archive,
+    _path,
+    _walk_paths,
+)
+from barentsz._protocols import conforms, is_runtime_protocol
+from barentsz._report import Report
+from barentsz._static import (
+    decorator_names,
+    describe_code,
+    describe_module,
+    source_or_code,
+)
+from barentsz._typings import (
+    Directories,
+    Exclusions,
+    Source,
+)
+from barentsz._walker import Walker, directory_lister
+from barentsz._walking import (
+    _discover_packages_per_path,
+    _module_names,
+    _walk_packages,
+)
+from barentsz._zip import split_archive
+
+# Typish checks are more expensive than any of the filters.
+_SIGNATURE_COST = 5
 
 
 def discover(
@@ -39,32 +82,49 @@ def discover(
         *,
         what: Any = List[type],
         **kwargs: dict,
-) -> list:
+) -> Any:
     """
     Convenience function for discovering types in some source. If not source
     is given, the directory is used in which the calling module is located.
 
+    The form of the result follows what: List[T] gives a sorted list,
+    Iterator[T] a generator that imports modules as it is consumed, Set[T] an
+    unsorted set and Dict[str, T] a dict with class names as keys (the first
+    discovered class wins if names clash).
+
+    A budget (in seconds) applies to all forms and requires a report, which
+    reveals whether the result is partial. For an Iterator, it starts when
+    discover is called rather than when the iterator is consumed.
+
     Args:
         source: the source in which is searched or the directory of the
         caller if None.
         what: the type that is to be discovered.
         **kwargs: any keyword argument that is passed on.
 
-    Returns: a list of discoveries.
+    Returns: the discoveries in the form of what.
 
     """
     source = source or here(1)
+    # The budget is turned into a deadline once, for every form of result.
+    deadline = _deadline(kwargs.pop('budget', None),  # type: ignore[arg-type] # noqa
+                         kwargs.get('report'))  # type: ignore[arg-type]
 
-    delegates = [
+    delegates: List[Tuple[Any, Callable[..., Any]]] = [
         (List[type], _discover_list),
         (list, _discover_list),
         (List, _discover_list),
+        (Iterator, _discover_iterator),
+        (Set, _discover_set),
+        (set, _discover_set),
+        (Dict, _discover_dict),
+        (dict, _discover_dict),
     ]
 
     for tuple_ in delegates:
         type_, delegate = tuple_
         if subclass_of(what, type_):
-            return delegate(what, source, **kwargs)
+            return delegate(what, source, deadline=deadline, **kwargs)
 
     accepted_types = ', '.join(['`{}`'.format(delegate)
                                 for delegate, _ in delegates])
@@ -72,7 +132,10 @@ def discover(
                      '{}'.format(what, accepted_types))
 
 
-def discover_paths(directory: Union[Path, str], pattern: str) -> List[Path]:
+def discover_paths(
+        directory: Union[Path, str],
+        pattern: str,
+        walker: Optional[Walker] = None) -> List[Path]:
     """
     Return a list of Paths within the given directory that match the given
     pattern.
@@ -80,99 +143,140 @@ def discover_paths(directory: Union[Path, str], pattern: str) -> List[Path]:
     Args:
         directory: the directory in which is searched for paths.
         pattern: a pattern (example: '**/*.py').
+        walker: a Walker that determines which directories are walked.
 
     Returns: a list of Path objects.
 
     """
     directory_path = _path(directory)
-    abspath = str(directory_path.absolute())
-    sys.path.insert(0, abspath)
-    path_to_discover = directory_path.joinpath(pattern)
-    result = [Path(filename) for filename in
-              glob.iglob(str(path_to_discover), recursive=True)]
-    result.sort()
-    return result
+    archive = split_archive(directory_path)
+    if archive:
+        return _discover_paths_in_archive(*archive, pattern, walker)
+    _add_to_sys_path(str(directory_path.absolute()))
+    # Paths are matched like glob does, while walking emits events.
+    return _walk_paths(directory_path, pattern, walker or Walker(),
+                       directory_lister(directory_path))
 
 
-def discover_packages(directory: Union[Path, str]) -> List[str]:
+def discover_packages(
+        directory: Directories,
+        namespace_packages: bool = False,
+        walker: Optional[Walker] = None) -> List[str]:
     """
     Return a list of packages within the given directory. The directory must be
     a package.
     Args:
-        directory: the directory in which is searched for packages.
+        directory: the directory (or dotted package name) in which is
+        searched for packages, or multiple of those.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
 
     Returns: a list of packages.
 
     """
-    result = list(_discover_packages_per_path(directory).values())
+    result = list(_discover_packages_per_path(directory, namespace_packages,
+                                              walker).values())
     result.sort()
     return result
 
 
 def discover_module_names(
-        directory: Union[Path, str],
-        include_privates: bool = False) -> List[str]:
+        directory: Directories,
+        include_privates: bool = False,
+        namespace_packages: bool = False,
+        walker: Optional[Walker] = None) -> List[str]:
     """
     Return a list of module names within the given directory. The directory
     must be a package and only names are returned of modules that are in
     packages.
     Args:
-        directory: the directory in which is searched for modules.
+        directory: the directory (or dotted package name) in which is
+        searched for modules, or multiple of those.
         include_privates: if True, privates (unders and dunders) are also
         included.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
 
     Returns: a list of module names (strings).
 
     """
-    result = []
-    packages_per_path = _discover_packages_per_path(directory)
-    for path, package_name in packages_per_path.items():
-        result.extend(['{}.{}'.format(package_name, p.stem)
-                       for p in discover_paths(path, '*.py')
-                       if p.stem != '__init__'
-                       and (include_privates or not p.stem.startswith('_'))])
-    result.sort()
-    return result
+    return _module_names(directory, include_privates, namespace_packages,
+                         walker)
 
 
 def discover_modules(
-        directory: Union[Path, str],
+        directory: Directories,
         include_privates: bool = False,
-        raise_on_fail: bool = False) -> List[Module]:
+        raise_on_fail: bool = False,
+        namespace_packages: bool = False,
+        walker: Optional[Walker] = None,
+        from_loaded: bool = False,
+        lazy: bool = False,
+        report: Optional[Report] = None,
+        profile_memory: bool = False,
+        budget: Optional[float] = None) -> List[Module]:
     """
     Return a list of modules within the given directory. The directory must be
     a package and only modules are returned that are in packages.
     Args:
-        directory: the directory in which is searched for modules.
+        directory: the directory (or dotted package name) in which is
+        searched for modules, or multiple of those.
         include_privates: if True, privates (unders and dunders) are also
         included.
         raise_on_fail: if True, an ImportError is raised upon failing to
         import any module.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+        from_loaded: if True, modules that are imported already are taken
+        from sys.modules and only the other modules are imported.
+        lazy: if True, modules that are not imported yet are registered with
+        a LazyLoader, which executes a module upon first attribute access.
+        Failures in executing a module then only surface upon that access.
+        report: an optional Report in which the imports are recorded, with
+        their durations and failures. If the budget is exceeded,
+        report.complete is False, report.pending holds the names of the
+        modules that were not imported and report.unwalked the directories
+        that were not walked.
+        profile_memory: if True, the memory that is allocated by every import
+        is traced (using tracemalloc) and recorded in report.
+        budget: an optional maximum number of seconds for walking and
+        importing, which requires a report. When it is exceeded, no further
+        directories are walked and no further modules are imported.
 
     Returns: a list of module objects.
 
     """
-    modules = discover_module_names(directory, include_privates)
-    result = []
-    for module in modules:
-        try:
-            imported_module = import_module(module)
-            result.append(imported_module)
-        except Exception as err:
-            if raise_on_fail:
-                raise ImportError(err) from err
-    result.sort(key=lambda module: module.__name__)
-    return result
+    deadline = _deadline(budget, report)
+    if from_loaded:
+        return _discover_loaded_modules(directory, include_privates,
+                                        raise_on_fail, namespace_packages,
+                                        walker, lazy, report, profile_memory,
+                                        deadline)
+    modules = _module_names(directory, include_privates, namespace_packages,
+                            walker, report, deadline)
+    # The names are sorted already. Note that lazy modules would load upon
+    # accessing their __name__ for sorting.
+    with tracing(profile_memory and report is not None):
+        return list(_import_modules(modules, raise_on_fail, lazy, report,
+                                    profile_memory, deadline))
 
 
 def discover_classes(
-        source: Union[Path, str, Module, Iterable[Module]],
+        source: Source,
         signature: type = Any,  # type: ignore
         include_privates: bool = False,
         in_private_modules: bool = False,
         raise_on_fail: bool = False,
-        exclude: Union[type, ClsPredicate,
-                       Iterable[Union[type, ClsPredicate]]] = None
+        exclude: Exclusions = None,
+        only_defined_in_module: bool = False,
+        walker: Optional[Walker] = None,
+        from_loaded: bool = False,
+        where: Optional[Filter] = None,
+        report: Optional[Report] = None,
+        budget: Optional[float] = None,
 ) -> List[type]:
     """
     Discover any classes within the given source and according to the given
@@ -187,30 +291,45 @@ def discover_classes(
         failure.
         exclude: one or more types or predicates that are to be excluded
         from the result.
+        only_defined_in_module: if True, classes that are imported into a
+        module rather than defined in it are skipped.
+        walker: a Walker that determines which directories are walked.
+        from_loaded: if True, modules of packages that are imported already
+        are taken from sys.modules and classes are looked up through the
+        subclasses of signature, rather than through the module members.
+        Virtual subclasses (e.g. registered to an ABC) are then not found.
+        where: a Filter that classes must pass, which is evaluated before the
+        signature.
+        report: an optional Report in which the imports are recorded. If the
+        budget is exceeded, report.complete is False, report.pending holds
+        the names of the modules that were not processed and report.unwalked
+        the directories that were not walked.
+        budget: an optional maximum number of seconds for walking and
+        importing, which requires a report. When it is exceeded, no further
+        directories are walked and no further modules are imported.
 
     Returns: a list of all discovered classes (types).
 
     """
-    exclude_ = _ensure_set(exclude)
-    elements = _discover_elements(source, isclass, include_privates,
-                                  in_private_modules, raise_on_fail)
-    result = list({cls for cls in elements
-                   if (signature is Any or subclass_of(cls, signature))
-                   and cls not in exclude_})
-
-    exclude_predicates = (e for e in exclude_ if isfunction(e))
-    for pred in exclude_predicates:
-        result = [cls for cls in result if not pred(cls)]  # type: ignore[operator] # noqa
+    result = list(_iter_classes(source, signature, include_privates,
+                                in_private_modules, raise_on_fail, exclude,
+                                only_defined_in_module, walker, from_loaded,
+                                where, report, _deadline(budget, report)))
     result.sort(key=lambda cls: cls.__name__)
     return result
 
 
 def discover_functions(
-        source: Union[Path, str, Module, Iterable[Module], type],
+        source: Union[Source, type],
         signature: Type[Callable] = Callable,  # type: ignore
         include_privates: bool = False,
         in_private_modules: bool = False,
-        raise_on_fail: bool = False) -> List[type]:
+        raise_on_fail: bool = False,
+        only_defined_in_module: bool = False,
+        walker: Optional[Walker] = None,
+        where: Optional[Filter] = None,
+        report: Optional[Report] = None,
+        budget: Optional[float] = None) -> List[type]:
     """
     Discover any functions within the given source and according to the given
     constraints.
@@ -223,10 +342,23 @@ def discover_functions(
         in_private_modules: if True, private modules are explored as well.
         raise_on_fail: if True, raises an ImportError upon the first import
         failure.
+        only_defined_in_module: if True, functions that are imported into a
+        module rather than defined in it are skipped.
+        walker: a Walker that determines which directories are walked.
+        where: a Filter that functions must pass, which is evaluated before
+        the signature.
+        report: an optional Report in which the imports are recorded. If the
+        budget is exceeded, report.complete is False, report.pending holds
+        the names of the modules that were not processed and report.unwalked
+        the directories that were not walked.
+        budget: an optional maximum number of seconds for walking and
+        importing, which requires a report. When it is exceeded, no further
+        directories are walked and no further modules are imported.
 
     Returns: a list of all discovered functions.
 
     """
+    deadline = _deadline(budget, report)
 
     def filter_(*args_: Iterable[Any]) -> bool:
         return (isfunction(*args_)
@@ -236,19 +368,21 @@ def discover_functions(
         filter_ = isfunction  # type: ignore
 
     elements = _discover_elements(source, filter_, include_privates,
-                                  in_private_modules, raise_on_fail)
-    result = [elem for elem in elements
-              if (signature is Callable or instance_of(elem, signature))]
-    result.sort(key=lambda func: func.__name__)
-    return result
+                                  in_private_modules, raise_on_fail,
+                                  only_defined_in_module, walker,
+                                  report=report, deadline=deadline)
+    return _filter_functions(elements, signature, where)
 
 
 def discover_attributes(
-        source: Union[Path, str, Module, Iterable[Module]],
+        source: Source,
         signature: type = Any,  # type: ignore
         include_privates: bool = False,
         in_private_modules: bool = False,
-        raise_on_fail: bool = False) -> List[Attribute]:
+        raise_on_fail: bool = False,
+        walker: Optional[Walker] = None,
+        report: Optional[Report] = None,
+        budget: Optional[float] = None) -> List[Attribute]:
     """
     Discover any attributes within the given source and according to the given
     constraints.
@@ -261,19 +395,303 @@ def discover_attributes(
         in_private_modules: if True, private modules are explored as well.
         raise_on_fail: if True, raises an ImportError upon the first import
         failure.
+        walker: a Walker that determines which directories are walked.
+        report: an optional Report in which the imports are recorded. If the
+        budget is exceeded, report.complete is False, report.pending holds
+        the names of the modules that were not processed and report.unwalked
+        the directories that were not walked.
+        budget: an optional maximum number of seconds for walking and
+        importing, which requires a report. When it is exceeded, no further
+        directories are walked and no further modules are imported.
 
     Returns: a list of all discovered attributes.
 
     """
     modules = _get_modules_from_source(source, in_private_modules,
-                                       raise_on_fail)
+                                       raise_on_fail, walker, stream=True,
+                                       report=report,
+                                       deadline=_deadline(budget, report))
     attributes: List[Attribute] = []
     for module in modules:
-        with open(module.__file__) as module_file:
-            lines = list(module_file)
-        attributes += _discover_attributes_in_lines(
-            lines, module, signature, include_privates)
+        attributes += _discover_attributes_in_module(module, signature,
+                                                     include_privates)
     attributes.sort(key=lambda attr: attr.name)
+    emit_all(ELEMENT_MATCHED, attributes)
+    return attributes
+
+
+def discover_decorated(
+        directory: Directories,
+        decorators: Union[str, Iterable[str]],
+        include_privates: bool = False,
+        in_private_modules: bool = False,
+        namespace_packages: bool = False,
+        walker: Optional[Walker] = None) -> List[Descriptor]:
+    """
+    Discover the module-level classes and functions within the given directory
+    that are decorated with any of the given decorators. The modules are
+    parsed rather than imported. Decorator names are resolved through the
+    imports of each module, so '@r' after 'from app import route as r'
+    matches both 'route' and 'app.route'.
+
+    Args:
+        directory: the directory (or dotted package name) in which is
+        searched, or multiple of those.
+        decorators: one or more decorator names (example: 'route').
+        include_privates: if True, private classes and functions are included
+        as well.
+        in_private_modules: if True, private modules are explored as well.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+
+    Returns: a list of Descriptors, sorted by module and line number.
+
+    """
+    names = {decorators} if isinstance(decorators, str) else set(decorators)
+    result: List[Descriptor] = []
+    for path, module_names in _walk_packages(directory, namespace_packages,
+                                             walker).values():
+        importer = get_importer(str(path.absolute()))
+        for module_name in module_names:
+            if (in_private_modules
+                    or not module_name.rpartition('.')[2].startswith('_')):
+                result.extend(_decorated_in(importer, module_name, names,
+                                            include_privates))
+    result.sort(key=lambda descriptor: (descriptor.module, descriptor.line_nr))
+    emit_all(ELEMENT_MATCHED, result)
+    return result
+
+
+def _decorated_in(
+        importer: Any,
+        module_name: str,
+        decorators: Set[str],
+        include_privates: bool) -> List[Descriptor]:
+    # Return the module-level classes and functions of the (parsed) module
+    # that are decorated with any of the given decorators.
+    return [descriptor for descriptor in describe_module(importer, module_name)
+            if '.' not in descriptor.qualname
+            and (include_privates or not descriptor.is_private)
+            and decorators & decorator_names(descriptor.decorators)]
+
+
+def _deadline(
+        budget: Optional[float],
+        report: Optional[Report]) -> Optional[float]:
+    # Turn a budget in seconds into a perf_counter deadline. Only a report
+    # reveals whether the result is partial, so a budget requires one.
+    if budget is None:
+        return None
+    if report is None:
+        raise ValueError('A budget requires a report, which reveals whether '
+                         'the result is partial.')
+    return perf_counter() + budget
+
+
+def _filter_classes(
+        elements: Iterable[type],
+        signature: type,
+        exclude: Exclusions = None,
+        where: Optional[Filter] = None) -> List[type]:
+    """
+    Filter the given classes on signature, exclusions and where. All checks
+    are compiled into a single predicate, with the cheapest checks first. The
+    result contains no duplicates and is sorted by class name.
+
+    Args:
+        elements: the classes that are to be filtered.
+        signature: only classes that inherit from signature are returned.
+        exclude: one or more types or predicates that are to be excluded
+        from the result.
+        where: a Filter that classes must pass.
+
+    Returns: a sorted list of classes.
+
+    """
+    keep = _class_predicate(signature, exclude, where)
+    # Duplicates are removed while the order of discovery is kept.
+    result = [cls for cls in dict.fromkeys(elements) if keep(cls)]
+    result.sort(key=lambda cls: cls.__name__)
+    emit_all(ELEMENT_MATCHED, result)
+    return result
+
+
+def _iter_classes(
+        source: Source,
+        signature: type = Any,  # type: ignore
+        include_privates: bool = False,
+        in_private_modules: bool = False,
+        raise_on_fail: bool = False,
+        exclude: Exclusions = None,
+        only_defined_in_module: bool = False,
+        walker: Optional[Walker] = None,
+        from_loaded: bool = False,
+        where: Optional[Filter] = None,
+        report: Optional[Report] = None,
+        deadline: Optional[float] = None) -> Iterator[type]:
+    """
+    Discover classes like discover_classes, but yield them one at a time as
+    their modules are imported, without duplicates and without sorting. The
+    deadline is a perf_counter value after which no modules are imported.
+
+    Returns: an iterator of classes.
+
+    """
+    if from_loaded and _has_subclasses(signature):
+        elements = _discover_loaded_subclasses(
+            source, signature, include_privates, in_private_modules,
+            raise_on_fail, walker, report, deadline)  # type: Iterable[type]
+    else:
+        elements = _iter_elements(source, isclass, include_privates,
+                                  in_private_modules, raise_on_fail,
+                                  only_defined_in_module, walker, from_loaded,
+                                  report, deadline)
+    yield from _unique_matches(elements,
+                               _class_predicate(signature, exclude, where))
+
+
+def _unique_matches(
+        classes: Iterable[type],
+        keep: Callable[[type], bool]) -> Iterator[type]:
+    # Yield the classes that pass keep as they come, each once.
+    seen: Set[type] = set()
+    for cls in classes:
+        if cls not in seen:
+            seen.add(cls)
+            if keep(cls):
+                emit(ELEMENT_MATCHED, cls)
+                yield cls
+
+
+def _class_predicate(
+        signature: type,
+        exclude: Exclusions = None,
+        where: Optional[Filter] = None) -> Callable[[type], bool]:
+    """
+    Compile the signature, exclusions and where into a single predicate, with
+    the cheapest checks first.
+    Args:
+        signature: only classes that inherit from signature pass.
+        exclude: one or more types or predicates that do not pass.
+        where: a Filter that classes must pass.
+
+    Returns: a predicate on classes.
+
+    """
+    exclude_ = _ensure_set(exclude)
+    exclude_types = {e for e in exclude_ if not isfunction(e)}
+    filters = [Filter(lambda cls: cls not in exclude_types, 0)]
+    # Exclude predicates only ever see classes that passed the signature.
+    filters += [~predicate(e, _SIGNATURE_COST + 1)  # type: ignore[arg-type]
+                for e in exclude_ if isfunction(e)]
+    if where:
+        filters.append(where)
+    if is_runtime_protocol(signature):
+        # Conformance is answered from cached member sets instead of typish.
+        filters.append(Filter(lambda cls: conforms(cls, signature),
+                              _SIGNATURE_COST))
+    elif signature is not Any:
+        filters.append(Filter(lambda cls: subclass_of(cls, signature),
+                              _SIGNATURE_COST))
+    return _combine(filters)
+
+
+def _filter_functions(
+        elements: Iterable[Any],
+        signature: Type[Callable],
+        where: Optional[Filter] = None) -> List[Any]:
+    """
+    Filter the given functions on signature and where. The result is sorted by
+    function name.
+
+    Args:
+        elements: the functions that are to be filtered.
+        signature: only functions that have this signature are returned.
+        where: a Filter that functions must pass.
+
+    Returns: a sorted list of functions.
+
+    """
+    filters = [where] if where else []
+    if signature is not Callable:
+        filters.append(Filter(lambda func: instance_of(func, signature),
+                              _SIGNATURE_COST))
+    keep = _combine(filters)
+    result = [elem for elem in elements if keep(elem)]
+    result.sort(key=lambda func: func.__name__)
+    emit_all(ELEMENT_MATCHED, result)
+    return result
+
+
+def _combine(filters: List[Filter]) -> Callable[[Any], bool]:
+    # Combine the given filters into one compiled predicate.
+    if not filters:
+        return lambda _: True
+    combined = filters[0]
+    for filter_ in filters[1:]:
+        combined &= filter_
+    return combined.compile()
+
+
+def _discover_attributes_in_module(
+        module: Module,
+        signature: type,
+        include_privates: bool) -> List[Attribute]:
+    """
+    Discover any attributes within the given module, from its source code or,
+    if it has none, from its compiled code.
+
+    Args:
+        module: the module in which is searched for any attributes.
+        signature: only attributes that are subtypes of this signature are
+        included.
+        include_privates: if True, private attributes are included as well.
+
+    Returns: a list of all discovered attributes.
+
+    """
+    source = source_or_code(module)
+    if isinstance(source, CodeType):
+        return _discover_attributes_in_code(source, module, signature,
+                                            include_privates)
+    return _discover_attributes_in_lines(source.splitlines(keepends=True),
+                                         module, signature, include_privates)
+
+
+def _discover_attributes_in_code(
+        code: CodeType,
+        module: Module,
+        signature: type,
+        include_privates: bool) -> List[Attribute]:
+    """
+    Discover the module-level attributes to which literals are assigned in
+    the given code object of a sourceless module. Such attributes have no
+    line, docstring or comment.
+
+    Args:
+        code: the compiled code of module.
+        module: the module from which the code originates.
+        signature: only attributes that are subtypes of this signature are
+        included.
+        include_privates: if True, private attributes are included as well.
+
+    Returns: a list of all discovered attributes.
+
+    """
+    attributes = []
+    descriptors = [descriptor for descriptor
+                   in describe_code(code, module.__name__)
+                   if descriptor.kind == ATTRIBUTE
+                   and '.' not in descriptor.qualname
+                   and hasattr(module, descriptor.name)]
+    for descriptor in descriptors:
+        attribute = _create_attribute(
+            descriptor.name, descriptor.hint, descriptor.literal or '', None,
+            None, module, '', descriptor.line_nr)
+        if (instance_of(attribute.value, signature)
+                and (attribute.is_public or include_privates)):
+            attributes.append(attribute)
     return attributes
 
 
@@ -311,11 +729,40 @@ def _discover_attributes_in_lines(
 
 
 def _discover_elements(
-        source: Union[Path, str, Module, Iterable[Module], type],
+        source: Union[Source, type],
         filter_: Callable[[Any], bool],
         include_privates: bool = False,
         in_private_modules: bool = False,
-        raise_on_fail: bool = False) -> List[Any]:
+        raise_on_fail: bool = False,
+        only_defined_in_module: bool = False,
+        walker: Optional[Walker] = None,
+        from_loaded: bool = False,
+        report: Optional[Report] = None,
+        deadline: Optional[float] = None) -> List[Any]:
+    """
+    Discover elements (such as attributes or functions) in the given source.
+    See _iter_elements.
+
+    Returns: a list of elements.
+
+    """
+    return list(_iter_elements(source, filter_, include_privates,
+                               in_private_modules, raise_on_fail,
+                               only_defined_in_module, walker, from_loaded,
+                               report, deadline))
+
+
+def _iter_elements(
+        source: Union[Source, type],
+        filter_: Callable[[Any], bool],
+        include_privates: bool = False,
+        in_private_modules: bool = False,
+        raise_on_fail: bool = False,
+        only_defined_in_module: bool = False,
+        walker: Optional[Walker] = None,
+        from_loaded: bool = False,
+        report: Optional[Report] = None,
+        deadline: Optional[float] = None) -> Iterator[Any]:
     """
     Discover elements (such as attributes or functions) in the given source.
     Args:
@@ -325,104 +772,58 @@ def _discover_elements(
         in_private_modules: if True, private modules are examined as well.
         raise_on_fail: if True, an ImportError will be raised upon import
         failure.
+        only_defined_in_module: if True, elements that are imported into a
+        module rather than defined in it are skipped.
+        walker: a Walker that determines which directories are walked.
+        from_loaded: if True, modules of packages that are imported already
+        are taken from sys.modules.
+        report: an optional Report in which the imports are recorded.
+        deadline: an optional perf_counter value after which no modules are
+        imported.
 
-    Returns: a list of elements.
+    Returns: an iterator of elements, which imports modules as it goes.
 
     """
     if isinstance(source, type):
         sources = [source]  # type: Iterable
     else:
         sources = _get_modules_from_source(source, in_private_modules,
-                                           raise_on_fail)
-
-    elements = [elem for src in sources
-                for _, elem in getmembers(src, filter_)
-                if (in_private_modules or not src.__name__.startswith('_'))
-                and (include_privates or not elem.__name__.startswith('_'))]
-    return elements
-
+                                           raise_on_fail, walker, from_loaded,
+                                           stream=True, report=report,
+                                           deadline=deadline)
 
-def _discover_packages_per_path(
-        directory: Union[Path, str]) -> Dict[Path, str]:
-    """
-    Discover packages and their original Paths within the given directory.
-    Args:
-        directory: the directory in which is searched for modules.
+    return (elem for src in sources
+            if in_private_modules or not src.__name__.startswith('_')
+            for elem in _members(src, filter_, only_defined_in_module)
+            if include_privates or not elem.__name__.startswith('_'))
 
-    Returns: a dict with Paths as keys and strings (the package names) as
-    values.
 
+def _members(
+        source: Union[Module, type],
+        filter_: Callable[[Any], bool],
+        only_defined_in_module: bool = False) -> Iterable[Any]:
     """
-    directory_path = _path(directory)
-    if not directory_path.exists():
-        raise ValueError('The given directory does not exist. '
-                         'Given: {}'.format(directory))
-    if not _is_package(directory_path):
-        raise ValueError('The given directory must itself be a package. '
-                         'Given: {}'.format(directory))
-
-    paths_to_inits = discover_paths(directory_path, '**/__init__.py')
-    paths = [p.parent for p in paths_to_inits]
-    packages_per_path = {p: _to_package_name(p) for p in paths}
-
-    # All packages must have a straight line of packages from the base package.
-    base_package = _to_package_name(directory_path)
-    result = {path: package for path, package in packages_per_path.items()
-              if package.startswith(base_package)}
-
-    return result
-
-
-def _path(directory: Union[Path, str]) -> Path:
-    """
-    Return a path if directory is a string or return directory if it is a Path
-    already. Raise a ValueError if it is neither a Path nor a string.
-
-    Args:
-        directory: the directory that is a string or Path.
-
-    Returns: a Path instance.
-
-    """
-    if isinstance(directory, Path):
-        result = directory
-    elif isinstance(directory, str):
-        result = Path(directory)
-    else:
-        raise ValueError('Invalid type ({}) for directory, provide a Path or '
-                         'a string.'.format(type(directory)))
-    return result
-
-
-def _get_modules_from_source(
-        source: Union[Path, str, Module, Iterable[Module]],
-        in_private_modules: bool = False,
-        raise_on_fail: bool = False
-) -> Iterable[Module]:
-    """
-    Get an iterable of Modules from the given source.
+    Return the members of the given source that pass filter_. For modules, the
+    namespace is iterated directly, which avoids the getattr and sort of
+    inspect.getmembers. Classes are still inspected with getmembers to include
+    inherited members.
     Args:
-        source: anything that can be turned into an iterable of Modules.
-        in_private_modules: if True, private modules are explored as well.
-        raise_on_fail: if True, raises an ImportError upon the first import
-        failure.
+        source: the module or class of which the members are returned.
+        filter_: the filter that determines the type of element.
+        only_defined_in_module: if True, members of a module of which
+        __module__ refers to another module are skipped.
 
-    Returns: an iterable of Module instances.
+    Returns: an iterable of members.
 
     """
-    if isinstance(source, Path):
-        modules = discover_modules(source, in_private_modules, raise_on_fail)
-    elif isinstance(source, str):
-        modules = discover_modules(Path(source), in_private_modules,
-                                   raise_on_fail)
-    elif isinstance(source, Module):
-        modules = [source]
-    elif instance_of(source, Iterable[Module]):
-        modules = source  # type: ignore
-    else:
-        raise ValueError('The given source must be a Path, string or module. '
-                         'Given: {}'.format(source))
-    return modules
+    if isinstance(source, type):
+        return (elem for _, elem in getmembers(source, filter_))
+    namespace = list(vars(source).values())
+    if only_defined_in_module:
+        module_name = source.__name__
+        namespace = [elem for elem in namespace
+                     if getattr(elem, '__module__', None) == module_name]
+    return (elem for elem in namespace if filter_(elem))
 
 
 def _match_attribute(line: str) -> Optional[Tuple[str, str, str, str]]:
@@ -499,38 +900,6 @@ def _create_attribute(
     )
 
 
-def _is_package(directory: Path) -> bool:
-    """
-    Return True if the given directory is a package and False otherwise.
-    Args:
-        directory: the directory to check.
-
-    Returns: True if directory is a package.
-
-    """
-    paths = discover_paths(directory, '__init__.py')
-    return len(paths) > 0
-
-
-def _to_package_name(directory: Path) -> str:
-    """
-    Translate the given directory to a package (str). Check every parent
-    directory in the tree to find the complete fully qualified package name.
-    Args:
-        directory: the directory that is to become a package name.
-
-    Returns: a package name as string.
-
-    """
-    parts: List[str] = []
-    current_dir = directory.absolute()
-    while _is_package(current_dir):
-        # See how far up the tree we can go while still in a package.
-        parts.insert(0, current_dir.stem)
-        current_dir = current_dir.parent
-    return '.'.join(parts)
-
-
 def _find_attribute_docstring(lines: List[str]) -> Optional[str]:
     """
     Find any docstring that is right above an attribute.
@@ -566,11 +935,44 @@ def _ensure_set(arg: Union[object, Iterable[object]]) -> Set[object]:
 
 def _discover_list(
         what_: List[type],
-        source: Union[Path, str, Module, Iterable[Module]],
+        source: Source,
         **kwargs: dict) -> List[type]:
-    args = getattr(what_, '__args__', None) or [Any]
-    signature = args[0]
+    kwargs['signature'] = _signature_of(what_)
+    return sorted(_iter_classes(source, **kwargs),  # type: ignore[arg-type]
+                  key=lambda cls: cls.__name__)
+
+
+def _discover_iterator(
+        what_: Iterator[type],
+        source: Source,
+        **kwargs: dict) -> Iterator[type]:
+    kwargs['signature'] = _signature_of(what_)
+    return _iter_classes(source, **kwargs)  # type: ignore[arg-type]
+
+
+def _discover_set(
+        what_: Set[type],
+        source: Source,
+        **kwargs: dict) -> Set[type]:
+    kwargs['signature'] = _signature_of(what_)
+    return set(_iter_classes(source, **kwargs))  # type: ignore[arg-type]
+
+
+def _discover_dict(
+        what_: Dict[str, type],
+        source: Source,
+        **kwargs: dict) -> Dict[str, type]:
+    kwargs['signature'] = _signature_of(what_, 1)
+    result: Dict[str, type] = {}
+    for cls in _iter_classes(source, **kwargs):  # type: ignore[arg-type]
+        result.setdefault(cls.__name__, cls)
+    return result
+
+
+def _signature_of(what_: Any, index: int = 0) -> Any:
+    # Return the class signature from the type arguments of what_.
+    args = getattr(what_, '__args__', None) or []
+    signature = args[index] if len(args) > index else Any
     if signature in (type, Type) or isinstance(signature, TypeVar):  # type: ignore[arg-type] # noqa
         signature = Any
-    kwargs['signature'] = signature
-    return discover_classes(source, **kwargs)  # type: ignore[arg-type]
+    return signature
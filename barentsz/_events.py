@@ -0,0 +1,116 @@
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Tuple,
+)
+
+DIRECTORY_ENTERED = 'directory_entered'
+MODULE_FOUND = 'module_found'
+IMPORT_STARTED = 'import_started'
+IMPORT_FINISHED = 'import_finished'
+IMPORT_FAILED = 'import_failed'
+ELEMENT_MATCHED = 'element_matched'
+
+Listener = Callable[[str, Any, Any], None]
+
+
+class _Listeners:
+    """
+    The listeners that are subscribed. The tuple of listeners is replaced
+    rather than mutated, so emitting needs no lock.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self.all: Tuple[Listener, ...] = ()
+        self._lock = Lock()
+
+    def add(self, listener: Listener) -> None:
+        """
+        Add the given listener.
+        :param listener: the listener that is to be called upon events.
+        :return: None.
+        """
+        with self._lock:
+            self.all = self.all + (listener,)
+
+    def remove(self, listener: Listener) -> None:
+        """
+        Remove the given listener (if it was added).
+        :param listener: the listener that is no longer to be called.
+        :return: None.
+        """
+        with self._lock:
+            self.all = tuple(known for known in self.all
+                             if known != listener)
+
+
+_LISTENERS = _Listeners()
+
+
+def subscribe(listener: Listener) -> None:
+    """
+    Subscribe the given listener to the events of all discoveries. A listener
+    is called with the name of the event, its subject and a detail:
+
+    * 'directory_entered': the Path of a directory, None;
+    * 'module_found': the name of a module, None;
+    * 'import_started': the name of a module, None;
+    * 'import_finished': the name of a module, the duration in seconds;
+    * 'import_failed': the name of a module, the error;
+    * 'element_matched': a discovered element, None.
+
+    Listeners are called in the thread that performs the discovery.
+    Args:
+        listener: a callable that takes an event, a subject and a detail.
+
+    Returns: None.
+
+    """
+    _LISTENERS.add(listener)
+
+
+def unsubscribe(listener: Listener) -> None:
+    """
+    Unsubscribe the given listener, so that it is no longer called.
+    Args:
+        listener: a listener that was subscribed before.
+
+    Returns: None.
+
+    """
+    _LISTENERS.remove(listener)
+
+
+def emit(event: str, subject: Any, detail: Any = None) -> None:
+    """
+    Call all listeners with the given event. Without listeners, this is a
+    no-op.
+    Args:
+        event: the name of the event (example: 'module_found').
+        subject: the subject of the event (example: a module name).
+        detail: an optional detail (example: an error).
+
+    Returns: None.
+
+    """
+    for listener in _LISTENERS.all:
+        listener(event, subject, detail)
+
+
+def emit_all(event: str, subjects: Any) -> None:
+    """
+    Emit the given event for each of the given subjects.
+    Args:
+        event: the name of the event (example: 'element_matched').
+        subjects: an iterable of subjects.
+
+    Returns: None.
+
+    """
+    if _LISTENERS.all:
+        for subject in subjects:
+            emit(event, subject)
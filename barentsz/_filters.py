@@ -0,0 +1,204 @@
+import re
+from fnmatch import fnmatch
+from inspect import isabstract
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+)
+
+from barentsz._static import decorators_of
+
+_CHEAP = 1
+_MODERATE = 2
+_CUSTOM = 3
+_EXPENSIVE = 4
+
+
+class Filter:
+    """
+    A predicate on discovered elements (classes or functions) that can be
+    combined with other filters using & (and), | (or) and ~ (not). Combined
+    filters are compiled into a single predicate in which the cheapest checks
+    are evaluated first.
+
+    Example:
+        name_matches('.*Handler$') & ~is_abstract() & in_module('app.*')
+    """
+
+    def __init__(
+            self,
+            func: Callable[[Any], bool],
+            cost: int = _CUSTOM,
+            description: Optional[str] = None):
+        """
+        Constructor.
+        :param func: the callable that determines whether an element passes.
+        :param cost: an indication of how expensive func is, which determines
+        the order of evaluation.
+        :param description: a description of this filter.
+        """
+        self.predicate = func
+        self.cost = cost
+        self.description = description or str(
+            getattr(func, '__name__', 'predicate'))
+        # The filters of which this filter is an 'and' or 'or' combination.
+        self.parts: List[Filter] = []
+        self.joiner: Optional[str] = None
+
+    def __call__(self, elem: Any) -> bool:
+        """
+        Return whether the given element passes this filter.
+        :param elem: the element that is checked.
+        :return: True if the element passes.
+        """
+        return self.predicate(elem)
+
+    def __and__(self, other: 'Filter') -> 'Filter':
+        """
+        Return a filter that passes if both this filter and other pass.
+        :param other: another filter.
+        :return: a combined filter.
+        """
+        return _combined('and', [self, other])
+
+    def __or__(self, other: 'Filter') -> 'Filter':
+        """
+        Return a filter that passes if this filter or other passes.
+        :param other: another filter.
+        :return: a combined filter.
+        """
+        return _combined('or', [self, other])
+
+    def __invert__(self) -> 'Filter':
+        """
+        Return a filter that passes if this filter does not pass.
+        :return: a negated filter.
+        """
+        compiled = self.compile()
+        return Filter(lambda elem: not compiled(elem), self.cost,
+                      'not {}'.format(self.description))
+
+    def __repr__(self) -> str:
+        """
+        Return a representation of this filter.
+        :return: a string representation.
+        """
+        return 'Filter({})'.format(self.description)
+
+    def compile(self) -> Callable[[Any], bool]:
+        """
+        Compile this filter into a single predicate.
+        Returns: a callable that takes an element and returns a bool.
+
+        """
+        return self.predicate
+
+
+def name_matches(pattern: str) -> Filter:
+    """
+    Return a filter that passes elements of which the name matches the given
+    regular expression.
+    Args:
+        pattern: a regular expression (example: '.*Handler$').
+
+    Returns: a Filter.
+
+    """
+    regex = re.compile(pattern)
+    return Filter(lambda elem: bool(regex.match(elem.__name__)), _CHEAP,
+                  'name matches {}'.format(pattern))
+
+
+def in_module(pattern: str) -> Filter:
+    """
+    Return a filter that passes elements that are defined in a module of which
+    the name matches the given glob pattern.
+    Args:
+        pattern: a glob pattern (example: 'app.handlers.*').
+
+    Returns: a Filter.
+
+    """
+    return Filter(lambda elem: fnmatch(elem.__module__, pattern), _CHEAP,
+                  'in module {}'.format(pattern))
+
+
+def has_attribute(name: str) -> Filter:
+    """
+    Return a filter that passes elements that have an attribute with the given
+    name.
+    Args:
+        name: the name of the attribute.
+
+    Returns: a Filter.
+
+    """
+    return Filter(lambda elem: hasattr(elem, name), _MODERATE,
+                  'has attribute {}'.format(name))
+
+
+def is_abstract() -> Filter:
+    """
+    Return a filter that passes classes that are abstract.
+
+    Returns: a Filter.
+
+    """
+    return Filter(isabstract, _MODERATE, 'is abstract')
+
+
+def decorated_with(name: str) -> Filter:
+    """
+    Return a filter that passes elements that are decorated with a decorator
+    with the given name. The decorators are found in the source code of the
+    module of an element, which is parsed once per module.
+    Args:
+        name: the name of the decorator (example: 'dataclass').
+
+    Returns: a Filter.
+
+    """
+    return Filter(lambda elem: name in decorators_of(elem), _EXPENSIVE,
+                  'decorated with {}'.format(name))
+
+
+def predicate(func: Callable[[Any], bool], cost: int = _CUSTOM) -> Filter:
+    """
+    Return a filter that passes elements for which the given callable returns
+    True.
+    Args:
+        func: a callable that takes an element and returns a bool.
+        cost: an indication of how expensive func is.
+
+    Returns: a Filter.
+
+    """
+    return Filter(func, cost)
+
+
+def _combined(joiner: str, filters: List[Filter]) -> Filter:
+    # Combine the filters with 'and' (all must pass) or 'or' (any must pass)
+    # into a filter that evaluates the cheapest checks first.
+    parts = sorted(_flatten(joiner, filters), key=lambda filter_: filter_.cost)
+    checks = [part.compile() for part in parts]
+    quantifier = all if joiner == 'and' else any
+    result = Filter(lambda elem: quantifier(check(elem) for check in checks),
+                    max(part.cost for part in parts),
+                    ' {} '.format(joiner).join(part.description
+                                               for part in parts))
+    result.parts, result.joiner = parts, joiner
+    return result
+
+
+def _flatten(joiner: str, filters: Iterable[Filter]) -> List[Filter]:
+    # Unpack nested combinations of the same kind, so they are sorted as one.
+    result: List[Filter] = []
+    for filter_ in filters:
+        if filter_.joiner == joiner:
+            result.extend(filter_.parts)
+        else:
+            result.append(filter_)
+    return result
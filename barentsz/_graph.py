@@ -0,0 +1,259 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pkgutil import get_importer
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from barentsz._cache import MtimeCache
+from barentsz._static import imported_names, parse_module
+from barentsz._typings import Directories
+from barentsz._walker import Walker
+from barentsz._walking import _walk_packages
+from barentsz._zip import path_mtime
+
+_IMPORTS: MtimeCache[FrozenSet[str]] = MtimeCache()
+
+
+class ImportGraph:
+    """
+    The internal import graph of one or more packages: which of the modules
+    within the packages each module imports.
+    """
+
+    def __init__(self, edges: Dict[str, Set[str]]):
+        """
+        Constructor.
+        :param edges: a dict with module names as keys and the names of the
+        modules that they import as values.
+        """
+        self.edges = edges
+
+    @property
+    def modules(self) -> List[str]:
+        """
+        Return the names of all modules in this graph.
+        :return: a sorted list of module names.
+        """
+        return sorted(self.edges)
+
+    def imported_by(self, module: str) -> List[str]:
+        """
+        Return the names of the modules that import the given module.
+        :param module: the name of a module in this graph.
+        :return: a sorted list of module names.
+        """
+        return sorted(name for name, imported in self.edges.items()
+                      if module in imported)
+
+    def cycles(self) -> List[List[str]]:
+        """
+        Return the import cycles in this graph. Each cycle is a group of
+        modules that (indirectly) import each other.
+        :return: a list of sorted lists of module names.
+        """
+        return sorted(sorted(component)
+                      for component in _strongly_connected(self.edges)
+                      if len(component) > 1)
+
+    def topological_order(self) -> List[str]:
+        """
+        Order the modules such that every module comes after the modules that
+        it imports. Cycles are broken deterministically, in the alphabetical
+        order of module names.
+        :return: a list of all module names.
+        """
+        result: List[str] = []
+        visited: Set[str] = set()
+        for module in self.modules:
+            _visit(module, self.edges, visited, result)
+        return result
+
+    def __repr__(self) -> str:
+        """
+        Return a representation of this graph.
+        :return: a string representation.
+        """
+        return 'ImportGraph({} modules, {} edges)'.format(
+            len(self.edges), sum(len(v) for v in self.edges.values()))
+
+
+def discover_import_graph(
+        directory: Directories,
+        include_privates: bool = False,
+        namespace_packages: bool = False,
+        walker: Optional[Walker] = None,
+        workers: Optional[int] = None) -> ImportGraph:
+    """
+    Return the import graph of the modules within the given directory. The
+    modules are parsed rather than imported, in parallel threads. The imports
+    of every module are cached for as long as its file is not modified.
+    Args:
+        directory: the directory (or dotted package name) in which is
+        searched for modules, or multiple of those.
+        include_privates: if True, private modules are included as well.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+        workers: the maximum number of threads that parse modules, or None
+        for the default of ThreadPoolExecutor.
+
+    Returns: an ImportGraph.
+
+    """
+    to_parse: List[Tuple[object, str]] = []
+    for path, module_names in _walk_packages(directory, namespace_packages,
+                                             walker).values():
+        importer = get_importer(str(path.absolute()))
+        to_parse.extend(
+            (importer, module_name) for module_name in module_names
+            if include_privates
+            or not module_name.rpartition('.')[2].startswith('_'))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        imports = list(executor.map(lambda args: _imports_of(*args),
+                                    to_parse))
+    modules = {module_name for _, module_name in to_parse}
+    return ImportGraph({
+        module_name: set(imported & modules) - {module_name}
+        for (_, module_name), imported in zip(to_parse, imports)})
+
+
+def _visit(
+        module: str,
+        edges: Dict[str, Set[str]],
+        visited: Set[str],
+        result: List[str]) -> None:
+    # Add module to result after its imports (depth first, iteratively).
+    to_visit: List[Tuple[str, Iterable[str]]] = []
+    if module not in visited:
+        visited.add(module)
+        to_visit.append((module, iter(sorted(edges.get(module, ())))))
+    while to_visit:
+        current, imports = to_visit[-1]
+        for imported in imports:
+            if imported not in visited:
+                visited.add(imported)
+                to_visit.append(
+                    (imported, iter(sorted(edges.get(imported, ())))))
+                break
+        else:
+            to_visit.pop()
+            result.append(current)
+
+
+def _strongly_connected(edges: Dict[str, Set[str]]) -> List[Set[str]]:
+    """
+    Return the strongly connected components of the given graph (Tarjan's
+    algorithm, iteratively).
+    Args:
+        edges: a dict with nodes as keys and their successors as values.
+
+    Returns: a list of sets of nodes.
+
+    """
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    result: List[Set[str]] = []
+    for root in sorted(edges):
+        if root not in index:
+            _connect(root, edges, index, low, stack, on_stack, result)
+    return result
+
+
+def _connect(
+        root: str,
+        edges: Dict[str, Set[str]],
+        index: Dict[str, int],
+        low: Dict[str, int],
+        stack: List[str],
+        on_stack: Set[str],
+        result: List[Set[str]]) -> None:
+    # Visit the nodes that are reachable from root depth first and add the
+    # components that they complete to result.
+    to_visit = [_enter(root, edges, index, low, stack, on_stack)]
+    while to_visit:
+        node, successors = to_visit[-1]
+        successor = _next_unvisited(node, successors, index, low, on_stack)
+        if successor is not None:
+            to_visit.append(
+                _enter(successor, edges, index, low, stack, on_stack))
+            continue
+        to_visit.pop()
+        if to_visit:
+            parent = to_visit[-1][0]
+            low[parent] = min(low[parent], low[node])
+        if low[node] == index[node]:
+            result.append(_pop_component(node, stack, on_stack))
+
+
+def _enter(
+        node: str,
+        edges: Dict[str, Set[str]],
+        index: Dict[str, int],
+        low: Dict[str, int],
+        stack: List[str],
+        on_stack: Set[str]) -> Tuple[str, Iterator[str]]:
+    # Number the node, push it on the stack and return it with its successors.
+    index[node] = low[node] = len(index)
+    stack.append(node)
+    on_stack.add(node)
+    return node, iter(sorted(edges.get(node, ())))
+
+
+def _next_unvisited(
+        node: str,
+        successors: Iterator[str],
+        index: Dict[str, int],
+        low: Dict[str, int],
+        on_stack: Set[str]) -> Optional[str]:
+    # Return the next successor that is not visited yet (if any), lowering the
+    # link of node for the visited successors that are on the stack.
+    for successor in successors:
+        if successor not in index:
+            return successor
+        if successor in on_stack:
+            low[node] = min(low[node], index[successor])
+    return None
+
+
+def _pop_component(
+        node: str,
+        stack: List[str],
+        on_stack: Set[str]) -> Set[str]:
+    # Pop the component of which node is the root from the stack.
+    component: Set[str] = set()
+    while True:
+        member = stack.pop()
+        on_stack.discard(member)
+        component.add(member)
+        if member == node:
+            return component
+
+
+def _imports_of(importer: object, module: str) -> FrozenSet[str]:
+    # Return the names that the module imports, cached per file mtime.
+    spec = importer.find_spec(module) if importer else None  # type: ignore[attr-defined] # noqa
+    origin = getattr(spec, 'origin', None)
+    if not origin:
+        return frozenset()
+    return _IMPORTS.get(origin, path_mtime(origin),
+                        partial(_parse_imports, module, origin))
+
+
+def _parse_imports(module: str, origin: str) -> FrozenSet[str]:
+    # Parse the module at origin and return the names that it imports.
+    parsed = parse_module(get_importer(os.path.dirname(origin)), module)
+    if not parsed:
+        return frozenset()
+    tree, name, is_package, _ = parsed
+    return imported_names(tree, name, is_package)
@@ -0,0 +1,295 @@
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from importlib import import_module
+from importlib.util import (
+    LazyLoader,
+    find_spec,
+    module_from_spec,
+)
+from threading import Lock
+from time import perf_counter
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+from typish import Module
+
+from barentsz._events import (
+    IMPORT_FAILED,
+    IMPORT_FINISHED,
+    IMPORT_STARTED,
+    emit,
+)
+from barentsz._report import Report
+from barentsz._zip import path_mtime
+
+# Modules that failed to import, with the mtime of their source at the time.
+_FAILED_IMPORTS: Dict[str, Tuple[float, Exception]] = {}
+_FAILED_IMPORTS_LOCK = Lock()
+
+
+def import_module_with(
+        name: str,
+        report: Optional[Report] = None,
+        lazy: bool = False,
+        profile_memory: bool = False) -> Module:
+    """
+    Import the module with the given name and record the import in report.
+    If importing the module failed before and its source file has not been
+    modified since, the import is skipped and an ImportError is raised from
+    the earlier error.
+    Args:
+        name: the full name of a module.
+        report: an optional Report in which the import is recorded.
+        lazy: if True, the module is imported through a LazyLoader.
+        profile_memory: if True, the memory that is allocated by the import
+        is recorded as well. This requires tracemalloc to be tracing.
+
+    Returns: the imported module.
+
+    """
+    if name in sys.modules:
+        if report is not None:
+            report.already_imported.append(name)
+        return sys.modules[name]
+    mtime = _source_mtime(name)
+    failed_before = _skip_if_failed(name, mtime, report)
+    profile_memory = (profile_memory and report is not None
+                      and tracemalloc.is_tracing())
+    before = _snapshot() if profile_memory else None
+    emit(IMPORT_STARTED, name)
+    start = perf_counter()
+    module = _import_or_remember(import_lazily if lazy else import_module,
+                                 name, mtime, report)
+    duration = perf_counter() - start
+    emit(IMPORT_FINISHED, name, duration)
+    if failed_before:
+        with _FAILED_IMPORTS_LOCK:
+            _FAILED_IMPORTS.pop(name, None)
+    if report is not None:
+        _record_import(report, name, duration, before)
+    return module
+
+
+def failed_imports() -> Dict[str, Exception]:
+    """
+    Return the modules that failed to import and that are skipped by
+    discovery until their source files are modified.
+
+    Returns: a dict with module names as keys and the errors as values.
+
+    """
+    with _FAILED_IMPORTS_LOCK:
+        return {name: err for name, (_, err) in _FAILED_IMPORTS.items()}
+
+
+def clear_failed_imports() -> None:
+    """
+    Forget all modules that failed to import, so that discovery retries them
+    (for instance after installing a missing dependency).
+
+    Returns: None.
+
+    """
+    with _FAILED_IMPORTS_LOCK:
+        _FAILED_IMPORTS.clear()
+
+
+def import_lazily(name: str) -> Module:
+    """
+    Import the module with the given name through a LazyLoader, unless it is
+    imported already. The module is registered in sys.modules and in its
+    parent package, but its body is executed only upon first attribute
+    access.
+    Args:
+        name: the full name of a module.
+
+    Returns: the (lazy) module.
+
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = find_spec(name)
+    loader = getattr(spec, 'loader', None)
+    if spec is None or loader is None or not hasattr(loader, 'exec_module'):
+        raise ImportError('The module `{}` cannot be loaded lazily.'
+                          .format(name))
+    lazy_loader = spec.loader = LazyLoader(loader)
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+    lazy_loader.exec_module(module)
+    parent, _, child = name.rpartition('.')
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+@contextmanager
+def tracing(enabled: bool) -> Iterator[None]:
+    """
+    Trace memory allocations with tracemalloc within this context, unless it
+    is tracing already. Tracing is stopped afterwards only if it was started
+    here.
+    Args:
+        enabled: if False, this context does nothing.
+
+    Returns: a context manager.
+
+    """
+    start = enabled and not tracemalloc.is_tracing()
+    if start:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if start:
+            tracemalloc.stop()
+
+
+def _import_modules(
+        names: Iterable[str],
+        raise_on_fail: bool = False,
+        lazy: bool = False,
+        report: Optional[Report] = None,
+        profile_memory: bool = False,
+        deadline: Optional[float] = None) -> Iterator[Module]:
+    """
+    Import the modules with the given names one at a time, until the deadline
+    is exceeded.
+    Args:
+        names: the full names of modules.
+        raise_on_fail: if True, an ImportError is raised upon failing to
+        import any module. Otherwise, such modules are skipped.
+        lazy: if True, modules are imported through a LazyLoader.
+        report: an optional Report in which the imports are recorded.
+        profile_memory: if True, the memory of every import is recorded.
+        deadline: an optional perf_counter value after which no modules are
+        imported. The remaining modules are then pending in report.
+
+    Returns: an iterator of modules.
+
+    """
+    names = list(names)
+    for index, name in enumerate(names):
+        if _exceeded(deadline):
+            if report is not None:
+                report.complete = False
+                report.pending.extend(names[index:])
+            return
+        try:
+            module = import_module_with(name, report, lazy, profile_memory)
+        except Exception as err:
+            if raise_on_fail:
+                raise ImportError(err) from err
+            continue
+        yield module
+
+
+def _exceeded(deadline: Optional[float]) -> bool:
+    # Return True if the given deadline (if any) has passed.
+    return deadline is not None and perf_counter() > deadline
+
+
+def _skip_if_failed(
+        name: str,
+        mtime: Optional[float],
+        report: Optional[Report]) -> bool:
+    # Raise an ImportError if the module failed to import before and its
+    # source was not modified since. Return whether it failed before at all.
+    failure = _FAILED_IMPORTS.get(name)
+    if failure and mtime is not None and failure[0] == mtime:
+        if report is not None:
+            report.skipped.append(name)
+        # A new error is raised, so that the traceback of the earlier error
+        # does not grow with every skip.
+        raise ImportError('The module `{}` failed to import before: {}'
+                          .format(name, failure[1])) from failure[1]
+    return failure is not None
+
+
+def _import_or_remember(
+        importer: Callable[[str], Module],
+        name: str,
+        mtime: Optional[float],
+        report: Optional[Report]) -> Module:
+    # Import the module with importer and remember it if that fails.
+    try:
+        return importer(name)
+    except Exception as err:
+        emit(IMPORT_FAILED, name, err)
+        # The parent package may have been imported along.
+        mtime = mtime if mtime is not None else _source_mtime(name)
+        if mtime is not None:
+            with _FAILED_IMPORTS_LOCK:
+                _FAILED_IMPORTS[name] = (mtime, err)
+        if report is not None:
+            report.failed[name] = err
+        raise
+
+
+def _record_import(
+        report: Report,
+        name: str,
+        duration: float,
+        before: Optional[tracemalloc.Snapshot]) -> None:
+    # Record the duration and, if profiled, the memory of an import.
+    report.durations[name] = duration
+    report.imported.append(name)
+    if before:
+        _record_memory(report, name, before, _snapshot())
+
+
+def _source_mtime(name: str) -> Optional[float]:
+    # Return the mtime of the source of the module, without importing it.
+    parent = name.rpartition('.')[0]
+    if parent and parent not in sys.modules:
+        return None
+    try:
+        spec = find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    origin = getattr(spec, 'origin', None)
+    return path_mtime(origin) if origin else None
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    # Take a snapshot without the allocations of tracemalloc itself.
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)])
+
+
+def _record_memory(
+        report: Report,
+        name: str,
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot) -> None:
+    """
+    Record the memory that was allocated between the given snapshots. The
+    transitive memory includes the allocations of any module that was
+    imported along; the self memory includes only the allocations by the code
+    of the module itself.
+    Args:
+        report: the Report in which the memory is recorded.
+        name: the name of the imported module.
+        before: a snapshot from before the import.
+        after: a snapshot from after the import.
+
+    Returns: None.
+
+    """
+    origin = getattr(sys.modules.get(name), '__spec__', None)
+    filename = getattr(origin, 'origin', None)
+    transitive = 0
+    self_ = 0
+    for stat in after.compare_to(before, 'filename'):
+        transitive += stat.size_diff
+        if stat.traceback[0].filename == filename:
+            self_ += stat.size_diff
+    report.memory[name] = transitive
+    report.self_memory[name] = self_
@@ -0,0 +1,310 @@
+import sys
+from inspect import isclass
+from pathlib import Path
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+from typish import Module, instance_of
+
+from barentsz._events import MODULE_FOUND, emit_all
+from barentsz._importing import _import_modules, tracing
+from barentsz._paths import _path
+from barentsz._report import Report
+from barentsz._typings import Directories, Source
+from barentsz._walker import Walker
+from barentsz._walking import (
+    _is_package_name,
+    _module_names,
+    _record_unwalked,
+    _to_package_name,
+    _walk_package_by_name,
+)
+
+# The modules of which the classes (e.g. Any) have no runtime subclasses.
+_TYPING_MODULES = ('typing', 'typing_extensions')
+
+
+def _get_modules_from_source(
+        source: Source,
+        in_private_modules: bool = False,
+        raise_on_fail: bool = False,
+        walker: Optional[Walker] = None,
+        from_loaded: bool = False,
+        stream: bool = False,
+        report: Optional[Report] = None,
+        deadline: Optional[float] = None
+) -> Iterable[Module]:
+    """
+    Get an iterable of Modules from the given source.
+    Args:
+        source: anything that can be turned into an iterable of Modules: a
+        Path, a string (a path or a dotted package name), a module or an
+        iterable of modules, Paths or strings.
+        in_private_modules: if True, private modules are explored as well.
+        raise_on_fail: if True, raises an ImportError upon the first import
+        failure.
+        walker: a Walker that determines which directories are walked.
+        from_loaded: if True, modules of packages that are imported already
+        are taken from sys.modules.
+        stream: if True, modules that are discovered in directories are
+        imported as the returned iterable is consumed.
+        report: an optional Report in which the imports are recorded.
+        deadline: an optional perf_counter value after which no modules are
+        imported.
+
+    Returns: an iterable of Module instances.
+
+    """
+    modules: Iterable[Module]
+    if isinstance(source, Module):
+        modules = [source]
+    elif instance_of(source, Iterable[Module]):
+        modules = source  # type: ignore
+    elif (isinstance(source, (Path, str))
+          or instance_of(source, Iterable[Union[Path, str]])):
+        if from_loaded:
+            modules = _discover_loaded_modules(
+                source, in_private_modules, raise_on_fail, False, walker,  # type: ignore[arg-type] # noqa
+                report=report, deadline=deadline)
+        else:
+            modules = _import_modules(
+                _module_names(source, in_private_modules, False, walker,  # type: ignore[arg-type] # noqa
+                              report, deadline), raise_on_fail,
+                report=report, deadline=deadline)
+            if not stream:
+                modules = list(modules)
+    else:
+        raise ValueError('The given source must be a Path, string or module, '
+                         'or an iterable of those. Given: {}'.format(source))
+    return modules
+
+
+def _discover_loaded_subclasses(
+        source: Source,
+        signature: type,
+        include_privates: bool,
+        in_private_modules: bool,
+        raise_on_fail: bool,
+        walker: Optional[Walker],
+        report: Optional[Report] = None,
+        deadline: Optional[float] = None) -> List[type]:
+    """
+    Discover the subclasses of signature that are defined in the modules of
+    the given source, using the runtime subclass graph of signature rather
+    than the members of those modules.
+    Args:
+        source: the source in which is searched for any classes.
+        signature: the class of which the subclasses are discovered.
+        include_privates: if True, private classes are included as well.
+        in_private_modules: if True, private modules are explored as well.
+        raise_on_fail: if True, raises an ImportError upon the first import
+        failure.
+        walker: a Walker that determines which directories are walked.
+        report: an optional Report in which the imports are recorded.
+        deadline: an optional perf_counter value after which no modules are
+        imported.
+
+    Returns: a list of classes.
+
+    """
+    modules = _get_modules_from_source(source, in_private_modules,
+                                       raise_on_fail, walker, True,
+                                       report=report, deadline=deadline)
+    module_names = {module.__name__ for module in modules
+                    if _included(module.__name__, in_private_modules)}
+    return [cls for cls in _subclasses(signature)
+            if cls.__module__ in module_names
+            and _included(cls.__name__, include_privates)]
+
+
+def _discover_loaded_modules(
+        directory: Directories,
+        include_privates: bool,
+        raise_on_fail: bool,
+        namespace_packages: bool,
+        walker: Optional[Walker],
+        lazy: bool = False,
+        report: Optional[Report] = None,
+        profile_memory: bool = False,
+        deadline: Optional[float] = None) -> List[Module]:
+    """
+    Return a list of modules within the given directory. For packages that are
+    imported already, the imported modules are taken from sys.modules and the
+    modules that are not imported yet are detected through a cached walk of
+    the package. Other packages are discovered from the file system.
+    Args:
+        directory: the directory (or dotted package name) in which is
+        searched for modules, or multiple of those.
+        include_privates: if True, privates (unders and dunders) are also
+        included.
+        raise_on_fail: if True, an ImportError is raised upon failing to
+        import any module.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+        lazy: if True, modules that are not imported yet are loaded lazily.
+        report: an optional Report in which the imports are recorded.
+        profile_memory: if True, the memory of every import is recorded.
+        deadline: an optional perf_counter value after which no modules are
+        imported.
+
+    Returns: a list of module objects.
+
+    """
+    names = _names_per_root(directory, include_privates, namespace_packages,
+                            walker, report, deadline)
+    _import_missing(names, raise_on_fail, lazy, report, profile_memory,
+                    deadline)
+    return [sys.modules[name] for name in sorted(names)
+            if sys.modules.get(name) is not None]
+
+
+def _names_per_root(
+        directory: Directories,
+        include_privates: bool,
+        namespace_packages: bool,
+        walker: Optional[Walker],
+        report: Optional[Report],
+        deadline: Optional[float]) -> Set[str]:
+    # Collect the module names of every root, from sys.modules for packages
+    # that are imported already and from the file system otherwise.
+    directories = ([directory] if isinstance(directory, (Path, str))
+                   else directory)
+    names: Set[str] = set()
+    for root in directories:
+        package = _loaded_package_name(root)
+        if package:
+            names.update(_loaded_module_names(package, include_privates,
+                                              namespace_packages, walker,
+                                              report, deadline))
+        else:
+            names.update(_module_names(root, include_privates,
+                                       namespace_packages, walker, report,
+                                       deadline))
+    return names
+
+
+def _import_missing(
+        names: Set[str],
+        raise_on_fail: bool,
+        lazy: bool,
+        report: Optional[Report],
+        profile_memory: bool,
+        deadline: Optional[float]) -> None:
+    # Import the modules that are not in sys.modules yet. Lazy modules would
+    # load upon accessing their __name__, so they are not returned.
+    missing = sorted(name for name in names if sys.modules.get(name) is None)
+    with tracing(profile_memory and report is not None):
+        for _ in _import_modules(missing, raise_on_fail, lazy, report,
+                                 profile_memory, deadline):
+            pass
+
+
+def _loaded_module_names(
+        package: str,
+        include_privates: bool,
+        namespace_packages: bool,
+        walker: Optional[Walker],
+        report: Optional[Report] = None,
+        deadline: Optional[float] = None) -> Set[str]:
+    """
+    Return the names of the modules of an imported package. The names of the
+    imported modules are taken from sys.modules by their prefix. The walk of
+    the package is cached for as long as none of its directories is modified,
+    so it only costs a stat per directory to detect modules that are not
+    imported yet.
+    Args:
+        package: the dotted name of an imported package.
+        include_privates: if True, privates (unders and dunders) are also
+        included.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+        report: an optional Report in which unwalked directories are recorded.
+        deadline: an optional perf_counter value after which no directories
+        are walked.
+
+    Returns: a set of module names (strings).
+
+    """
+    unwalked: List[Path] = []
+    walked = _walk_package_by_name(package, namespace_packages, walker,
+                                   unwalked, deadline)
+    _record_unwalked(report, unwalked)
+    names = {name for _, module_names in walked.values()
+             for name in module_names}
+    if walker is None:
+        # A Walker may exclude modules that are imported nonetheless.
+        names.update(_imported_module_names(package, walked))
+    result = {name for name in names
+              if _included(name.rpartition('.')[2], include_privates)}
+    emit_all(MODULE_FOUND, sorted(result))
+    return result
+
+
+def _imported_module_names(package: str, packages: Iterable[str]) -> Set[str]:
+    # Return the names of the imported modules within package that are not
+    # among the given (sub)packages.
+    prefix = package + '.'
+    return {name for name, module in list(sys.modules.items())
+            if name.startswith(prefix) and module is not None
+            and name not in packages}
+
+
+def _loaded_package_name(directory: Union[Path, str]) -> Optional[str]:
+    """
+    Return the name of the package at directory if it is imported already.
+    Args:
+        directory: the directory (or dotted package name) of a package.
+
+    Returns: the name of the package or None if it is not imported.
+
+    """
+    if _is_package_name(directory):
+        package = str(directory)
+    else:
+        package = _to_package_name(_path(directory))
+    return package if package and package in sys.modules else None
+
+
+def _subclasses(cls: type) -> List[type]:
+    """
+    Return all (direct and indirect) subclasses of the given class.
+    Args:
+        cls: the class of which the subclasses are returned.
+
+    Returns: a list of classes.
+
+    """
+    result: List[type] = []
+    seen: Set[type] = set()
+    to_visit: List[type] = [cls]
+    while to_visit:
+        subclasses: List[type] = type.__subclasses__(to_visit.pop())
+        for subclass in subclasses:
+            if subclass not in seen:
+                seen.add(subclass)
+                result.append(subclass)
+                to_visit.append(subclass)
+    return result
+
+
+def _included(name: str, include_privates: bool) -> bool:
+    # Return True if name is public or if privates are included.
+    return include_privates or not name.startswith('_')
+
+
+def _has_subclasses(signature: Any) -> bool:
+    # Return True if the subclasses of signature can be looked up at runtime.
+    # Protocols are excluded, since classes need not inherit from them, and so
+    # are the classes of typing (e.g. Any, which is a class since 3.11).
+    return (getattr(signature, '__module__', None) not in _TYPING_MODULES
+            and isclass(signature) and signature not in (object, type)
+            and not issubclass(signature, type)
+            and not getattr(signature, '_is_protocol', False))
@@ -0,0 +1,133 @@
+import sys
+from pathlib import Path
+from threading import Lock
+from typing import (
+    List,
+    Optional,
+    Union,
+)
+
+from barentsz._events import DIRECTORY_ENTERED, emit
+from barentsz._walker import (
+    Lister,
+    Walker,
+    match_path,
+)
+from barentsz._zip import (
+    join_inner,
+    split_archive,
+    zip_index,
+)
+
+_SYS_PATH_LOCK = Lock()
+
+
+def _discover_paths_in_archive(
+        archive: Path,
+        inner: str,
+        pattern: str,
+        walker: Optional[Walker] = None) -> List[Path]:
+    """
+    Return a list of Paths within the given zip archive that match the given
+    pattern. The archive is added to sys.path to allow zipimport to import
+    from it.
+
+    Args:
+        archive: the path to the zip archive.
+        inner: the directory within the archive in which is searched.
+        pattern: a pattern (example: '**/*.py').
+        walker: a Walker that determines which directories are walked.
+
+    Returns: a list of Path objects that point into the archive.
+
+    """
+    _add_to_sys_path(str(archive.absolute()))
+    index = zip_index(archive)
+    return _walk_paths(
+        archive.joinpath(inner), pattern, walker or Walker(),
+        lambda rel: index.list(join_inner(inner, '/'.join(rel))))
+
+
+def _walk_paths(
+        directory: Path,
+        pattern: str,
+        walker: Walker,
+        lister: Lister) -> List[Path]:
+    """
+    Return a list of Paths within the given directory that match the given
+    pattern, by walking only the directories that the walker allows.
+    Args:
+        directory: the directory in which is searched for paths.
+        pattern: a pattern (example: '**/*.py').
+        walker: a Walker that determines which directories are walked.
+        lister: a callable that lists a directory relative to directory.
+
+    Returns: a sorted list of Path objects.
+
+    """
+    pattern_parts = pattern.split('/')
+    # Without '**', there is no need to walk deeper than the pattern goes.
+    max_depth = None if '**' in pattern_parts else len(pattern_parts) - 1
+    # Like glob, '**' matches the directory itself as well.
+    result = [directory] if match_path((), pattern_parts) else []
+    for relative, dirs, files in walker.walk(lister, max_depth):
+        emit(DIRECTORY_ENTERED, directory.joinpath(*relative))
+        result.extend(directory.joinpath(*relative, name)
+                      for name in dirs + files
+                      if match_path(relative + (name,), pattern_parts))
+    result.sort()
+    return result
+
+
+def _add_to_sys_path(path: str) -> None:
+    """
+    Add the given path to the front of sys.path, unless it is in there
+    already. The check and the insertion are atomic, so concurrent
+    discoveries do not add a path twice.
+    Args:
+        path: an absolute path.
+
+    Returns: None.
+
+    """
+    with _SYS_PATH_LOCK:
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def _exists(path: Path) -> bool:
+    """
+    Return True if the given path exists, either on the file system or within
+    a zip archive.
+    Args:
+        path: the path to check.
+
+    Returns: True if path exists.
+
+    """
+    archive = split_archive(path)
+    if archive:
+        archive_path, inner = archive
+        return zip_index(archive_path).exists(inner)
+    return path.exists()
+
+
+def _path(directory: Union[Path, str]) -> Path:
+    """
+    Return a path if directory is a string or return directory if it is a Path
+    already. Raise a ValueError if it is neither a Path nor a string.
+
+    Args:
+        directory: the directory that is a string or Path.
+
+    Returns: a Path instance.
+
+    """
+    if isinstance(directory, Path):
+        result = directory
+    elif isinstance(directory, str):
+        result = Path(directory)
+    else:
+        raise ValueError('Invalid type ({}) for directory, provide a Path or '
+                         'a string.'.format(type(directory)))
+    return result
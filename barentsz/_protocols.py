@@ -0,0 +1,113 @@
+from functools import lru_cache
+from threading import Lock
+from typing import (
+    Any,
+    FrozenSet,
+    Set,
+)
+from weakref import WeakKeyDictionary
+
+# Names that typing puts in the namespace of every protocol.
+_PROTOCOL_INTERNALS = frozenset({
+    '__abstractmethods__', '__annotations__', '__dict__', '__doc__',
+    '__init__', '__module__', '__new__', '__slots__', '__subclasshook__',
+    '__weakref__', '__class_getitem__', '__parameters__', '__orig_bases__',
+    '__orig_class__', '__protocol_attrs__', '__non_callable_proto_members__',
+    '__callable_proto_members_only__', '__type_params__', '__qualname__',
+    '__firstlineno__', '__static_attributes__', '__annotate__',
+    '__annotate_func__', '__annotations_cache__', '_is_protocol',
+    '_is_runtime_protocol',
+})
+
+# The member sets of classes, which are dropped along with the classes.
+_MEMBERS: 'WeakKeyDictionary[type, FrozenSet[str]]' = WeakKeyDictionary()
+_MEMBERS_LOCK = Lock()
+
+
+def is_runtime_protocol(signature: Any) -> bool:
+    """
+    Return whether the given signature is a runtime checkable Protocol.
+    Args:
+        signature: any signature.
+
+    Returns: True if signature is a Protocol decorated with
+    @runtime_checkable.
+
+    """
+    return (isinstance(signature, type)
+            and getattr(signature, '_is_protocol', False)
+            and getattr(signature, '_is_runtime_protocol', False))
+
+
+def conforms(cls: type, protocol: type) -> bool:
+    """
+    Return whether the given class conforms to the given protocol: whether it
+    inherits from it or whether it has all of its members. The members of
+    both are determined once and cached.
+    Args:
+        cls: the class that is checked.
+        protocol: a Protocol.
+
+    Returns: True if cls conforms to protocol.
+
+    """
+    return (protocol in cls.__mro__
+            or protocol_members(protocol) <= members_of(cls))
+
+
+@lru_cache(maxsize=None)
+def protocol_members(protocol: type) -> FrozenSet[str]:
+    """
+    Return the names of the members (methods and attributes) that classes
+    must have to conform to the given protocol, including those of the
+    protocols that it extends.
+    Args:
+        protocol: a Protocol.
+
+    Returns: a frozenset of member names.
+
+    """
+    result: Set[str] = set()
+    for base in protocol.__mro__:
+        if (not getattr(base, '_is_protocol', False)
+                or base.__module__ in ('typing', 'typing_extensions')):
+            continue
+        names = list(vars(base)) + list(vars(base).get('__annotations__', {}))
+        result.update(name for name in names
+                      if name not in _PROTOCOL_INTERNALS
+                      and not name.startswith('_abc_'))
+    return frozenset(result)
+
+
+def members_of(cls: type) -> FrozenSet[str]:
+    """
+    Return the names of the members of the given class, including inherited
+    and annotated members. Members that are set to None (e.g. __hash__) are
+    not supported by the class and are left out.
+    Args:
+        cls: any class.
+
+    Returns: a frozenset of member names.
+
+    """
+    result = _MEMBERS.get(cls)
+    if result is None:
+        result = _collect_members(cls)
+        with _MEMBERS_LOCK:
+            _MEMBERS[cls] = result
+    return result
+
+
+def _collect_members(cls: type) -> FrozenSet[str]:
+    # Collect the members of cls along its mro, where the first definition of
+    # a name counts.
+    members: Set[str] = set()
+    blocked: Set[str] = set()
+    for base in cls.__mro__:
+        namespace = vars(base)
+        for name, value in namespace.items():
+            if name not in members and name not in blocked:
+                (blocked if value is None else members).add(name)
+        members.update(name for name in namespace.get('__annotations__', {})
+                       if name not in blocked)
+    return frozenset(members)
@@ -0,0 +1,236 @@
+from inspect import isclass, isfunction
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+)
+
+from typish import Module, instance_of
+
+from barentsz._discover import (
+    _discover_attributes_in_module,
+    _filter_classes,
+    _filter_functions,
+    _members,
+)
+from barentsz._filters import Filter
+from barentsz._modules import _get_modules_from_source
+from barentsz._typings import Exclusions, Source
+from barentsz._walker import Walker
+
+_CLASSES = 'classes'
+_FUNCTIONS = 'functions'
+_ATTRIBUTES = 'attributes'
+
+
+class _Request:
+    """
+    A single request for some kind of elements within a Query.
+    """
+
+    def __init__(
+            self,
+            kind: str,
+            key: str,
+            signature: Any,
+            exclude: Any = None,
+            where: Optional[Filter] = None):
+        """
+        Constructor.
+        :param kind: the kind of elements (classes, functions, attributes).
+        :param key: the key under which the result is stored.
+        :param signature: the signature that elements must comply to.
+        :param exclude: any exclusions (only applicable to classes).
+        :param where: a Filter that elements must pass.
+        """
+        self.kind = kind
+        self.key = key
+        self.signature = signature
+        self.exclude = exclude
+        self.where = where
+
+    def collect(self, attributes: list) -> list:
+        """
+        Return the attributes that comply to the signature of this request.
+        :param attributes: the attributes of a module.
+        :return: a list of attributes.
+        """
+        return [attr for attr in attributes
+                if instance_of(attr.value, self.signature)]
+
+    def select(self, elements: Dict[str, list], collected: list) -> list:
+        """
+        Return the discoveries of this request.
+        :param elements: the classes and functions that were found per kind.
+        :param collected: the attributes that were collected for this request.
+        :return: a list of discovered elements.
+        """
+        if self.kind == _CLASSES:
+            return _filter_classes(elements[_CLASSES], self.signature,
+                                   self.exclude, self.where)
+        if self.kind == _FUNCTIONS:
+            return _filter_functions(elements[_FUNCTIONS], self.signature,
+                                     self.where)
+        return sorted(collected, key=lambda attr: attr.name)
+
+
+class Query:
+    """
+    Discover classes, functions and attributes in one go. The source is walked
+    and imported once and every module is examined once, regardless of the
+    number of requested kinds and signatures.
+
+    Example:
+        result = (Query(path)
+                  .classes(signature=SomeBase)
+                  .functions()
+                  .attributes(signature=int, key='ints')
+                  .run())
+        result['classes'], result['functions'], result['ints']
+    """
+
+    def __init__(
+            self,
+            source: Source,
+            include_privates: bool = False,
+            in_private_modules: bool = False,
+            raise_on_fail: bool = False,
+            only_defined_in_module: bool = False,
+            walker: Optional[Walker] = None):
+        """
+        Constructor.
+        :param source: the source in which is searched.
+        :param include_privates: if True, private elements are included.
+        :param in_private_modules: if True, private modules are explored.
+        :param raise_on_fail: if True, raises an ImportError upon the first
+        import failure.
+        :param only_defined_in_module: if True, classes and functions that are
+        imported into a module rather than defined in it are skipped.
+        :param walker: a Walker that determines which directories are walked.
+        """
+        self.source = source
+        self.include_privates = include_privates
+        self.in_private_modules = in_private_modules
+        self.raise_on_fail = raise_on_fail
+        self.only_defined_in_module = only_defined_in_module
+        self.walker = walker
+        self._requests: List[_Request] = []
+
+    def classes(
+            self,
+            signature: type = Any,  # type: ignore
+            exclude: Exclusions = None,
+            key: str = _CLASSES,
+            where: Optional[Filter] = None) -> 'Query':
+        """
+        Request classes that comply to the given signature.
+        Args:
+            signature: only classes that inherit from signature are returned.
+            exclude: one or more types or predicates that are to be excluded
+            from the result.
+            key: the key under which the classes are found in the result.
+            where: a Filter that classes must pass.
+
+        Returns: this query.
+
+        """
+        return self._add(_Request(_CLASSES, key, signature, exclude, where))
+
+    def functions(
+            self,
+            signature: Type[Callable] = Callable,  # type: ignore
+            key: str = _FUNCTIONS,
+            where: Optional[Filter] = None) -> 'Query':
+        """
+        Request functions that comply to the given signature.
+        Args:
+            signature: only functions that have this signature (parameters and
+            return type) are returned.
+            key: the key under which the functions are found in the result.
+            where: a Filter that functions must pass.
+
+        Returns: this query.
+
+        """
+        return self._add(_Request(_FUNCTIONS, key, signature, where=where))
+
+    def attributes(
+            self,
+            signature: type = Any,  # type: ignore
+            key: str = _ATTRIBUTES) -> 'Query':
+        """
+        Request attributes that comply to the given signature.
+        Args:
+            signature: only attributes that are subtypes of this signature are
+            returned.
+            key: the key under which the attributes are found in the result.
+
+        Returns: this query.
+
+        """
+        return self._add(_Request(_ATTRIBUTES, key, signature))
+
+    def run(self) -> Dict[str, list]:
+        """
+        Execute this query.
+
+        Returns: a dict with the key of each request and its discoveries.
+
+        """
+        elements: Dict[str, list] = {request.kind: []
+                                     for request in self._requests}
+        collected: Dict[str, list] = {request.key: []
+                                      for request in self._requests}
+        modules = _get_modules_from_source(self.source,
+                                           self.in_private_modules,
+                                           self.raise_on_fail, self.walker)
+        for module in modules:
+            self._examine(module, elements, collected)
+        return {request.key: request.select(elements, collected[request.key])
+                for request in self._requests}
+
+    def _add(self, request: _Request) -> 'Query':
+        # Add the given request and make sure that its key is unique.
+        if any(r.key == request.key for r in self._requests):
+            raise ValueError('The key `{}` is already in use by another '
+                             'request.'.format(request.key))
+        self._requests.append(request)
+        return self
+
+    def _examine(
+            self,
+            module: Module,
+            elements: Dict[str, list],
+            collected: Dict[str, list]) -> None:
+        # Collect the classes, functions and attributes of module.
+        if _CLASSES in elements or _FUNCTIONS in elements:
+            self._collect_members(module, elements)
+        attribute_requests = [request for request in self._requests
+                              if request.kind == _ATTRIBUTES]
+        if attribute_requests:
+            attributes = _discover_attributes_in_module(
+                module, Any, self.include_privates)
+            for request in attribute_requests:
+                collected[request.key] += request.collect(attributes)
+
+    def _collect_members(
+            self,
+            module: Module,
+            elements: Dict[str, list]) -> None:
+        # Sort the members of module into classes and functions in one pass.
+        if not self.in_private_modules and module.__name__.startswith('_'):
+            return
+        for elem in _members(module, _is_class_or_function,
+                             self.only_defined_in_module):
+            kind = _CLASSES if isclass(elem) else _FUNCTIONS
+            if (kind in elements and (self.include_privates
+                                      or not elem.__name__.startswith('_'))):
+                elements[kind].append(elem)
+
+
+def _is_class_or_function(elem: Any) -> bool:
+    # Return True if elem is either a class or a function.
+    return isclass(elem) or isfunction(elem)
@@ -0,0 +1,228 @@
+from importlib import invalidate_caches, reload
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+from typish import Module
+
+from barentsz._discover import discover_classes
+from barentsz._filters import Filter
+from barentsz._modules import _get_modules_from_source
+from barentsz._typings import Exclusions, Source
+from barentsz._walker import Walker
+from barentsz._zip import module_mtime
+
+
+class Registry:
+    """
+    The classes of a discovery, indexed by name, qualified name, module and
+    base class. Lookups are dict lookups. Upon refresh, only modules that
+    were added or modified are (re)imported and examined again. If reloading
+    a module fails (and raise_on_fail is False), its classes of before are
+    kept and the error is in failed until the module is modified again.
+
+    Example:
+        registry = Registry('my_package', signature=Handler)
+        registry.get('my_package.handlers.UserHandler')
+        registry.subclasses_of(Handler)
+        registry.refresh()
+    """
+
+    def __init__(
+            self,
+            source: Source,
+            signature: type = Any,  # type: ignore
+            include_privates: bool = False,
+            in_private_modules: bool = False,
+            raise_on_fail: bool = False,
+            exclude: Exclusions = None,
+            only_defined_in_module: bool = False,
+            walker: Optional[Walker] = None,
+            where: Optional[Filter] = None):
+        """
+        Constructor.
+        :param source: the source in which is searched for classes.
+        :param signature: only classes that inherit from signature are
+        registered.
+        :param include_privates: if True, private classes are registered too.
+        :param in_private_modules: if True, private modules are explored too.
+        :param raise_on_fail: if True, raises an ImportError upon the first
+        import failure.
+        :param exclude: one or more types or predicates that are to be
+        excluded.
+        :param only_defined_in_module: if True, classes that are imported into
+        a module rather than defined in it are skipped.
+        :param walker: a Walker that determines which directories are walked.
+        :param where: a Filter that classes must pass.
+        """
+        self.source = source
+        self.signature = signature
+        self.include_privates = include_privates
+        self.in_private_modules = in_private_modules
+        self.raise_on_fail = raise_on_fail
+        self.exclude = exclude
+        self.only_defined_in_module = only_defined_in_module
+        self.walker = walker
+        self.where = where
+        self._classes_per_module: Dict[str, List[type]] = {}
+        self._mtimes: Dict[str, Optional[float]] = {}
+        self._by_name: Dict[str, List[type]] = {}
+        self._by_qualname: Dict[str, type] = {}
+        self._by_module: Dict[str, List[type]] = {}
+        self._by_base: Dict[type, List[type]] = {}
+        self.failed: Dict[str, Exception] = {}
+        self.refresh()
+
+    def get(self, qualified_name: str) -> Optional[type]:
+        """
+        Return the class with the given qualified name.
+        :param qualified_name: the module and qualified name of a class
+        (example: 'some_package.some_module.SomeClass').
+        :return: the class or None if it is not registered.
+        """
+        return self._by_qualname.get(qualified_name)
+
+    def by_name(self, name: str) -> List[type]:
+        """
+        Return the classes with the given name.
+        :param name: the name of a class (example: 'SomeClass').
+        :return: a list of classes, as multiple modules may define a class
+        with that name.
+        """
+        return list(self._by_name.get(name, []))
+
+    def in_module(self, module: str) -> List[type]:
+        """
+        Return the classes that are defined in the module with the given name.
+        :param module: the full name of a module.
+        :return: a list of classes.
+        """
+        return list(self._by_module.get(module, []))
+
+    def subclasses_of(self, base: type) -> List[type]:
+        """
+        Return the registered classes that (indirectly) inherit from base.
+        :param base: any class.
+        :return: a list of classes, excluding base itself.
+        """
+        return list(self._by_base.get(base, []))
+
+    def refresh(self) -> List[str]:
+        """
+        Bring this registry up to date. Modules that are new to the source are
+        imported, modules of which the file was modified are reloaded and
+        modules that disappeared are dropped. Only these modules are examined.
+        :return: the names of the modules that were (re)examined or dropped.
+        """
+        # Make sure that the finders notice new files.
+        invalidate_caches()
+        modules = _get_modules_from_source(self.source,
+                                           self.in_private_modules,
+                                           self.raise_on_fail, self.walker)
+        current = {module.__name__: module for module in modules}
+        changed = [name for name in self._classes_per_module
+                   if name not in current]
+        for name in changed:
+            del self._classes_per_module[name]
+            del self._mtimes[name]
+            self.failed.pop(name, None)
+        for name, module in current.items():
+            mtime = module_mtime(module)
+            if name in self._mtimes and self._mtimes[name] == mtime:
+                continue
+            if self._examine(name, module, mtime):
+                changed.append(name)
+        if changed:
+            self._index()
+        return sorted(changed)
+
+    def snapshot(self) -> 'Registry':
+        """
+        Return a copy of this registry that is not affected by later
+        refreshes of this registry.
+        :return: a new Registry.
+        """
+        result = Registry.__new__(Registry)
+        result.__dict__.update(self.__dict__)
+        # A refresh replaces the indexes, but updates these dicts in place.
+        result.__dict__.update(
+            _classes_per_module=dict(self._classes_per_module),
+            _mtimes=dict(self._mtimes),
+            failed=dict(self.failed))
+        return result
+
+    def __iter__(self) -> Iterator[type]:
+        """
+        Iterate over all registered classes.
+        :return: an iterator of classes.
+        """
+        return iter(list(self._by_qualname.values()))
+
+    def __len__(self) -> int:
+        """
+        Return the number of registered classes.
+        :return: the number of classes.
+        """
+        return len(self._by_qualname)
+
+    def __contains__(self, cls: object) -> bool:
+        """
+        Return whether the given class is registered.
+        :param cls: any class.
+        :return: True if cls is registered.
+        """
+        return self._by_qualname.get(_qualified_name(cls)) is cls
+
+    def _examine(
+            self,
+            name: str,
+            module: Module,
+            mtime: Optional[float]) -> bool:
+        # (Re)load the module and discover its classes. Return False if the
+        # reload failed, in which case its classes of before are kept.
+        self._mtimes[name] = mtime
+        if name in self._classes_per_module:
+            try:
+                module = reload(module)
+            except Exception as err:
+                if self.raise_on_fail:
+                    raise ImportError(err) from err
+                self.failed[name] = err
+                return False
+        self.failed.pop(name, None)
+        self._classes_per_module[name] = self._discover(module)
+        return True
+
+    def _discover(self, module: Module) -> List[type]:
+        # Discover the classes within the given module.
+        return discover_classes(module, self.signature, self.include_privates,
+                                self.in_private_modules, self.raise_on_fail,
+                                self.exclude, self.only_defined_in_module,
+                                where=self.where)
+
+    def _index(self) -> None:
+        # (Re)build the indexes from the classes per module.
+        self._by_name = {}
+        self._by_qualname = {}
+        self._by_module = {}
+        self._by_base = {}
+        for name in sorted(self._classes_per_module):
+            for cls in self._classes_per_module[name]:
+                qualified_name = _qualified_name(cls)
+                if qualified_name in self._by_qualname:
+                    continue
+                self._by_qualname[qualified_name] = cls
+                self._by_name.setdefault(cls.__name__, []).append(cls)
+                self._by_module.setdefault(cls.__module__, []).append(cls)
+                for base in cls.__mro__[1:]:
+                    self._by_base.setdefault(base, []).append(cls)
+
+
+def _qualified_name(cls: Any) -> str:
+    # Return the module and qualified name of cls.
+    return '{}.{}'.format(getattr(cls, '__module__', None),
+                          getattr(cls, '__qualname__', None))
@@ -0,0 +1,55 @@
+from typing import Dict, List
+
+
+class Report:
+    """
+    Reports on what happened during a discovery: which modules were imported,
+    which failed, which were skipped because they failed before, how long each
+    import took and, if profiled, how much memory each import allocated (in
+    bytes). If a discovery ran out of its budget, it is not complete, the
+    modules that were not processed are pending and the directories that were
+    not walked are unwalked.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self.imported: List[str] = []
+        self.already_imported: List[str] = []
+        self.failed: Dict[str, Exception] = {}
+        self.skipped: List[str] = []
+        self.durations: Dict[str, float] = {}
+        self.memory: Dict[str, int] = {}
+        self.self_memory: Dict[str, int] = {}
+        self.frozen = False
+        self.complete = True
+        self.pending: List[str] = []
+        self.unwalked: List[str] = []
+
+    @property
+    def total_duration(self) -> float:
+        """
+        Return the total duration of all imports in seconds.
+        :return: the sum of all durations.
+        """
+        return sum(self.durations.values())
+
+    @property
+    def total_memory(self) -> int:
+        """
+        Return the total memory that was allocated by all imports in bytes.
+        :return: the sum of the self memory of all imports.
+        """
+        return sum(self.self_memory.values())
+
+    def __repr__(self) -> str:
+        """
+        Return a representation of this report.
+        :return: a string representation.
+        """
+        return ('Report(imported={}, already_imported={}, failed={}, '
+                'skipped={}, pending={}, total_duration={:.3f}s)'.format(
+                    len(self.imported), len(self.already_imported),
+                    len(self.failed), len(self.skipped), len(self.pending),
+                    self.total_duration))
@@ -0,0 +1,265 @@
+from functools import partial
+from inspect import signature
+from pathlib import Path
+from threading import Event, Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from typish import Module, instance_of
+
+from barentsz._attribute import Attribute
+from barentsz._descriptor import Descriptor
+from barentsz._discover import (
+    discover_attributes,
+    discover_classes,
+    discover_decorated,
+    discover_functions,
+    discover_module_names,
+    discover_modules,
+    discover_packages,
+    discover_paths,
+)
+
+# Arguments that affect how the modules of a source are imported.
+_IMPORT_ARGUMENTS = ('budget', 'from_loaded', 'report')
+
+
+class _Flight:
+    """
+    A discovery that is (or was) performed by one thread, while other threads
+    may wait for its outcome.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self._done = Event()
+        self._result: Optional[list] = None
+        self._error: Optional[BaseException] = None
+
+    def land(
+            self,
+            result: Optional[list] = None,
+            error: Optional[BaseException] = None) -> None:
+        """
+        Record the outcome of the discovery and release all waiting threads.
+        :param result: the result of the discovery (if it succeeded).
+        :param error: the error of the discovery (if it failed).
+        :return: None.
+        """
+        self._result = result
+        self._error = error
+        self._done.set()
+
+    def landed(self) -> bool:
+        """
+        Return whether the discovery has an outcome.
+        :return: True if the discovery is done.
+        """
+        return self._done.is_set()
+
+    def outcome(self) -> list:
+        """
+        Wait for the discovery and return a copy of its result, or raise its
+        error.
+        :return: a list with the result of the discovery.
+        """
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return list(self._result or [])
+
+
+class Session:
+    """
+    Discovery results that can be shared among threads. Calls with identical
+    arguments share a result. Discoveries of classes, functions and attributes
+    in the same directories also share the modules, which are then walked and
+    imported once, unless a report, a budget or from_loaded is given. Identical
+    discoveries that are in flight are coalesced: one thread performs the
+    discovery and all other threads wait for its result. Results are kept and
+    shared with later identical calls until the session is cleared.
+
+    Example:
+        session = Session()
+        # In any thread:
+        session.discover_classes('my_package', signature=Base)
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self._lock = Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def discover_paths(self, *args: Any, **kwargs: Any) -> List[Path]:
+        """
+        Like barentsz.discover_paths, but shared with identical calls
+        within this session.
+        :return: a list of Path objects.
+        """
+        return self._run(discover_paths, args, kwargs)
+
+    def discover_packages(self, *args: Any, **kwargs: Any) -> List[str]:
+        """
+        Like barentsz.discover_packages, but shared with identical calls
+        within this session.
+        :return: a list of package names.
+        """
+        return self._run(discover_packages, args, kwargs)
+
+    def discover_module_names(self, *args: Any, **kwargs: Any) -> List[str]:
+        """
+        Like barentsz.discover_module_names, but shared with identical calls
+        within this session.
+        :return: a list of module names.
+        """
+        return self._run(discover_module_names, args, kwargs)
+
+    def discover_modules(self, *args: Any, **kwargs: Any) -> List[Module]:
+        """
+        Like barentsz.discover_modules, but shared with identical calls
+        within this session.
+        :return: a list of module objects.
+        """
+        return self._run(discover_modules, args, kwargs)
+
+    def discover_classes(self, *args: Any, **kwargs: Any) -> List[type]:
+        """
+        Like barentsz.discover_classes, but shared with identical calls
+        within this session.
+        :return: a list of classes.
+        """
+        return self._run_on_modules(discover_classes, args, kwargs)
+
+    def discover_functions(self, *args: Any, **kwargs: Any) -> List[Any]:
+        """
+        Like barentsz.discover_functions, but shared with identical calls
+        within this session.
+        :return: a list of functions.
+        """
+        return self._run_on_modules(discover_functions, args, kwargs)
+
+    def discover_attributes(
+            self,
+            *args: Any,
+            **kwargs: Any) -> List[Attribute]:
+        """
+        Like barentsz.discover_attributes, but shared with identical calls
+        within this session.
+        :return: a list of attributes.
+        """
+        return self._run_on_modules(discover_attributes, args, kwargs)
+
+    def discover_decorated(
+            self,
+            *args: Any,
+            **kwargs: Any) -> List[Descriptor]:
+        """
+        Like barentsz.discover_decorated, but shared with identical calls
+        within this session.
+        :return: a list of descriptors.
+        """
+        return self._run(discover_decorated, args, kwargs)
+
+    def clear(self) -> None:
+        """
+        Forget all completed discoveries of this session. Discoveries that are
+        in flight are not affected.
+        :return: None.
+        """
+        with self._lock:
+            self._flights = {key: flight for key, flight
+                             in self._flights.items()
+                             if not flight.landed()}
+
+    def _run(
+            self,
+            func: Callable[..., list],
+            args: Tuple[Any, ...],
+            kwargs: Dict[str, Any]) -> Any:
+        # Perform func once per distinct call and let others wait for it.
+        key = _key(func, args, kwargs)
+        if key is None:
+            return func(*args, **kwargs)
+        with self._lock:
+            leader = key not in self._flights
+            if leader:
+                self._flights[key] = _Flight()
+            flight = self._flights[key]
+        if leader:
+            self._perform(key, flight, partial(func, *args, **kwargs))
+        return flight.outcome()
+
+    def _run_on_modules(
+            self,
+            func: Callable[..., list],
+            args: Tuple[Any, ...],
+            kwargs: Dict[str, Any]) -> Any:
+        # Perform func on the modules of its source, which are shared with
+        # other discoveries in this session.
+        arguments = signature(func).bind(*args, **kwargs).arguments
+        source = arguments['source']
+        if ((not isinstance(source, (Path, str))
+             and not instance_of(source, Iterable[Union[Path, str]]))
+                or any(arguments.get(name) for name in _IMPORT_ARGUMENTS)):
+            return self._run(func, args, kwargs)
+        arguments['source'] = self.discover_modules(
+            source, arguments.get('in_private_modules', False),
+            arguments.get('raise_on_fail', False),
+            walker=arguments.get('walker'))
+        return self._run(func, (), arguments)
+
+    def _perform(
+            self,
+            key: Hashable,
+            flight: _Flight,
+            discover: Callable[[], list]) -> None:
+        # Perform the discovery of the given flight and land it.
+        try:
+            result = discover()
+        except BaseException as err:
+            with self._lock:
+                # Failures are not shared with later callers.
+                del self._flights[key]
+            flight.land(error=err)
+            raise
+        flight.land(result=result)
+
+
+def _key(
+        func: Callable[..., list],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any]) -> Optional[Hashable]:
+    # Return a hashable key for the given call or None if there is none.
+    try:
+        key = (func.__name__, _freeze(args),
+               _freeze(sorted(kwargs.items())))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _freeze(obj: Any) -> Any:
+    # Turn lists, sets and tuples (recursively) into hashable tuples.
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(elem) for elem in obj)
+    if isinstance(obj, (set, frozenset)):
+        return frozenset(_freeze(elem) for elem in obj)
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, Path):
+        return obj.absolute()
+    return obj
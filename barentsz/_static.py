@@ -0,0 +1,616 @@
+import ast
+import dis
+import sys
+from functools import partial
+from types import CodeType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from typish import Module
+
+from barentsz._cache import MtimeCache
+from barentsz._descriptor import (
+    ATTRIBUTE,
+    CLASS,
+    FUNCTION,
+    Descriptor,
+)
+from barentsz._zip import module_mtime
+
+_Definition = Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]
+
+# Instructions that do not affect the evaluation of literals.
+_NEUTRAL_OPS = frozenset({'CACHE', 'EXTENDED_ARG', 'NOP', 'RESUME'})
+# Instructions that end a statement by storing a value.
+_STORE_OPS = frozenset({'STORE_ANNOTATION', 'STORE_NAME', 'STORE_SUBSCR'})
+# Instructions that load a (simple) hint.
+_HINT_OPS = frozenset({'LOAD_CONST', 'LOAD_NAME'})
+# The definitions per qualname of each module file.
+_DESCRIPTORS: MtimeCache[Dict[str, Descriptor]] = MtimeCache()
+
+
+def source_or_code(module: Module) -> Union[str, CodeType]:
+    """
+    Read the source code of the given module or, if it has none (e.g. if only
+    a .pyc file is deployed), load its code object without executing it. The
+    source is obtained through the loader of the module if possible, which
+    allows for reading modules that are not on the file system (e.g. in a zip
+    archive). Either is read once.
+    Args:
+        module: the module of which the source or code is read.
+
+    Returns: the source code or a code object.
+
+    """
+    loader = getattr(module, '__loader__', None)
+    source = None
+    if hasattr(loader, 'get_source'):
+        source = loader.get_source(module.__name__)  # type: ignore[union-attr] # noqa
+    if source is None:
+        code = _load_code(loader, module.__name__)
+        if code is not None:
+            return code
+        with open(module.__file__) as module_file:
+            source = module_file.read()
+    return source
+
+
+def decorators_of(elem: Any) -> FrozenSet[str]:
+    """
+    Return the names of the decorators of the given class or function, as
+    found in the source code of its module. Both the full (dotted) names and
+    the last parts of the names are returned (e.g. 'app.route' and 'route').
+    Names are resolved through the imports of the module.
+    Args:
+        elem: a class or function.
+
+    Returns: a frozenset of decorator names.
+
+    """
+    descriptor = static_descriptor(elem)
+    if descriptor is None:
+        return frozenset()
+    return decorator_names(descriptor.decorators)
+
+
+def static_descriptor(elem: Any) -> Optional[Descriptor]:
+    """
+    Return the Descriptor of the given class or function, as found in the
+    source code of its module. Every module is parsed once (per modification).
+    Args:
+        elem: a class or function.
+
+    Returns: a Descriptor or None if elem could not be found in the source.
+
+    """
+    module = sys.modules.get(getattr(elem, '__module__', None) or '')
+    qualname = getattr(elem, '__qualname__', None)
+    if module is None or qualname is None:
+        return None
+    path = getattr(module, '__file__', None)
+    if isinstance(path, str):
+        descriptors = _DESCRIPTORS.get(
+            path, module_mtime(module),
+            partial(_descriptors_per_qualname, module))
+    else:
+        descriptors = _descriptors_per_qualname(module)
+    return descriptors.get(qualname)
+
+
+def decorator_names(decorators: Iterable[str]) -> FrozenSet[str]:
+    """
+    Return the given (full) decorator names along with their last parts.
+    Args:
+        decorators: full decorator names (example: ['app.route']).
+
+    Returns: a frozenset of decorator names (example: {'app.route', 'route'}).
+
+    """
+    result = set()
+    for name in decorators:
+        result.update({name, name.rpartition('.')[2]})
+    return frozenset(result)
+
+
+def describe_module(importer: Any, module: str) -> List[Descriptor]:
+    """
+    Describe the classes and functions of the module with the given name,
+    without importing it. The source is obtained through the loader that the
+    given importer (finder) provides for the module.
+    Args:
+        importer: the importer of the directory that contains the module.
+        module: the full name of the module.
+
+    Returns: a list of Descriptors, or an empty list if the module could not
+    be read or parsed.
+
+    """
+    parsed = parse_module(importer, module)
+    if parsed:
+        return describe(*parsed)
+    spec = importer.find_spec(module) if importer else None
+    code = _code_without_source(getattr(spec, 'loader', None), module)
+    if code is None:
+        return []
+    return [descriptor for descriptor
+            in describe_code(code, module, spec.origin)  # type: ignore[union-attr] # noqa
+            if descriptor.kind != ATTRIBUTE]
+
+
+def parse_module(
+        importer: Any,
+        module: str) -> Optional[Tuple[ast.Module, str, bool, Optional[str]]]:
+    """
+    Parse the module with the given name, without importing it. The source is
+    obtained through the loader that the given importer (finder) provides for
+    the module.
+    Args:
+        importer: the importer of the directory that contains the module.
+        module: the full name of the module.
+
+    Returns: a tuple (syntax tree, module name, is package, path) or None if
+    the module could not be read or parsed.
+
+    """
+    spec = importer.find_spec(module) if importer else None
+    loader = getattr(spec, 'loader', None)
+    if not hasattr(loader, 'get_source'):
+        return None
+    try:
+        source = loader.get_source(module)  # type: ignore[union-attr]
+        if source is None:
+            # A module without source (e.g. a .pyc file) cannot be parsed.
+            return None
+        tree = ast.parse(source)
+    except (ImportError, OSError, SyntaxError, ValueError):
+        return None
+    return tree, module, loader.is_package(module), spec.origin  # type: ignore[union-attr] # noqa
+
+
+def imported_names(
+        tree: ast.Module,
+        module: str,
+        is_package: bool = False) -> FrozenSet[str]:
+    """
+    Return the full names of everything that is imported anywhere in the
+    given syntax tree of a module. For 'from a import b', both 'a' and 'a.b'
+    are returned, as b may be a module or a member of a.
+    Args:
+        tree: the parsed source of a module.
+        module: the full name of the module.
+        is_package: True if the module is the __init__ of a package.
+
+    Returns: a frozenset of full (dotted) names.
+
+    """
+    result: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            result.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            origin = _absolute(node.module or '', node.level, module,
+                               is_package)
+            result.update(name for name in _imported_from(origin, node)
+                          if name and not name.endswith('*'))
+    return frozenset(result)
+
+
+def describe(
+        tree: ast.Module,
+        module: str,
+        is_package: bool = False,
+        path: Optional[str] = None) -> List[Descriptor]:
+    """
+    Describe the classes and functions (including those within classes) that
+    are defined in the given syntax tree of a module.
+    Args:
+        tree: the parsed source of a module.
+        module: the full name of the module.
+        is_package: True if the module is the __init__ of a package.
+        path: the path to the file of the module (if any).
+
+    Returns: a list of Descriptors.
+
+    """
+    aliases = import_aliases(tree, module, is_package)
+    result = []
+    for qualname, definition in _definitions(tree.body):
+        kind = CLASS if isinstance(definition, ast.ClassDef) else FUNCTION
+        decorators = [resolve(name, aliases) for name in
+                      map(dotted_name, definition.decorator_list) if name]
+        result.append(Descriptor(module, qualname, kind,
+                                 _def_line(definition), decorators, path))
+    return result
+
+
+def import_aliases(
+        tree: ast.Module,
+        module: str,
+        is_package: bool = False) -> Dict[str, str]:
+    """
+    Return the names that are bound by the module-level imports in the given
+    syntax tree, mapped to the full names that they refer to. Relative imports
+    are resolved against the given module.
+    Args:
+        tree: the parsed source of a module.
+        module: the full name of the module.
+        is_package: True if the module is the __init__ of a package.
+
+    Returns: a dict with bound names as keys and full names as values (e.g.
+    {'r': 'app.route'} for 'from app import route as r').
+
+    """
+    result: Dict[str, str] = {}
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            result.update(_bound_by_import(alias) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            origin = _absolute(node.module or '', node.level, module,
+                               is_package)
+            names = _imported_from(origin, node)[1:]
+            result.update((alias.asname or alias.name, name)
+                          for alias, name in zip(node.names, names))
+    return result
+
+
+def resolve(name: str, aliases: Dict[str, str]) -> str:
+    """
+    Resolve the given dotted name through the given import aliases.
+    Args:
+        name: a dotted name as written in the source (example: 'r').
+        aliases: the import aliases of the module.
+
+    Returns: the full name (example: 'app.route').
+
+    """
+    head, dot, rest = name.partition('.')
+    return aliases.get(head, head) + dot + rest
+
+
+def describe_code(
+        code: CodeType,
+        module: str,
+        path: Optional[str] = None,
+        prefix: str = '') -> List[Descriptor]:
+    """
+    Describe the classes, functions and literal attributes that are defined
+    in the given (unmarshalled) code object of a module, without executing
+    it. Classes and functions are recognized by the code objects of their
+    bodies and attributes by the literals that are assigned to names.
+    Decorators cannot be recovered from compiled code.
+    Args:
+        code: the code object of a module (or of a class body).
+        module: the full name of the module.
+        path: the path to the file of the module (if any).
+        prefix: the qualified name of the class of which code is the body.
+
+    Returns: a list of Descriptors.
+
+    """
+    result = []
+    hints: Dict[str, str] = {}
+    for statement, store, line_nr in _statements(code):
+        if store.opname == 'STORE_NAME':
+            result.extend(_describe_statement(
+                statement, store.argval, module, path, prefix, line_nr))
+        else:
+            hints.update(_annotation(statement, store))
+    for descriptor in result:
+        if descriptor.kind == ATTRIBUTE:
+            descriptor.hint = hints.get(descriptor.qualname[len(prefix):])
+    return result
+
+
+def _descriptors_per_qualname(module: Module) -> Dict[str, Descriptor]:
+    # Parse the (imported) module and index its definitions.
+    try:
+        source = source_or_code(module)
+        if isinstance(source, CodeType):
+            return {descriptor.qualname: descriptor for descriptor
+                    in describe_code(source, module.__name__,
+                                     getattr(module, '__file__', None))}
+        tree = ast.parse(source)
+    except (AttributeError, OSError, TypeError, SyntaxError):
+        return {}
+    descriptors = describe(tree, module.__name__, hasattr(module, '__path__'),
+                           getattr(module, '__file__', None))
+    return {descriptor.qualname: descriptor for descriptor in descriptors}
+
+
+def _code_without_source(loader: Any, module: str) -> Optional[CodeType]:
+    # Load the code of the module if its loader has no source for it.
+    try:
+        if getattr(loader, 'get_source', lambda _: None)(module) is not None:
+            return None
+    except (ImportError, OSError, ValueError):
+        return None
+    return _load_code(loader, module)
+
+
+def _load_code(loader: Any, module: str) -> Optional[CodeType]:
+    # Load the code of the module through its loader, if it can.
+    if not hasattr(loader, 'get_code'):
+        return None
+    try:
+        return loader.get_code(module)
+    except (ImportError, OSError, EOFError, ValueError):
+        return None
+
+
+def _statements(
+        code: CodeType
+) -> Iterable[Tuple[List[dis.Instruction], dis.Instruction, int]]:
+    # Split the instructions of code into statements that end with a store and
+    # yield every statement with its store and the line number of the store.
+    line_starts = dict(dis.findlinestarts(code))
+    line_nr = code.co_firstlineno
+    statement: List[dis.Instruction] = []
+    for instruction in dis.get_instructions(code):
+        line_nr = line_starts.get(instruction.offset) or line_nr
+        if instruction.opname in _STORE_OPS:
+            yield statement, instruction, line_nr
+            statement = []
+        elif instruction.opname not in _NEUTRAL_OPS:
+            statement.append(instruction)
+
+
+def _describe_statement(
+        statement: List[dis.Instruction],
+        name: str,
+        module: str,
+        path: Optional[str],
+        prefix: str,
+        line_nr: int) -> List[Descriptor]:
+    """
+    Describe the element that the given instructions store under the given
+    name, if it is a class, a function or a literal.
+    Args:
+        statement: the instructions that precede the store.
+        name: the name under which is stored.
+        module: the full name of the module.
+        path: the path to the file of the module (if any).
+        prefix: the qualified name of the class that holds the statement.
+        line_nr: the line number of the store.
+
+    Returns: a list of Descriptors, which is empty if the stored value is
+    neither.
+
+    """
+    qualname = prefix + name
+    bodies = [instruction.argval for instruction in statement
+              if instruction.opname == 'LOAD_CONST'
+              and isinstance(instruction.argval, CodeType)]
+    if bodies:
+        # Lambdas and aliases have bodies with other names.
+        if bodies[-1].co_name != name:
+            return []
+        return _describe_body(statement, bodies[-1], module, path, qualname)
+    literal = _literal(statement)
+    # Dunders such as __doc__ and __module__ are set by the compiler.
+    if not literal or (name.startswith('__') and name.endswith('__')):
+        return []
+    return [Descriptor(module, qualname, ATTRIBUTE, line_nr, path=path,
+                       literal=repr(literal[0]))]
+
+
+def _describe_body(
+        statement: List[dis.Instruction],
+        body: CodeType,
+        module: str,
+        path: Optional[str],
+        qualname: str) -> List[Descriptor]:
+    # Describe the class or function of which body is the code, along with
+    # the elements within the body of a class.
+    if any(instruction.opname == 'LOAD_BUILD_CLASS'
+           for instruction in statement):
+        return ([Descriptor(module, qualname, CLASS, body.co_firstlineno,
+                            path=path)]
+                + describe_code(body, module, path, qualname + '.'))
+    return [Descriptor(module, qualname, FUNCTION, body.co_firstlineno,
+                       path=path)]
+
+
+def _literal(statement: List[dis.Instruction]) -> Optional[Tuple[Any]]:
+    """
+    Evaluate the shortest tail of the given instructions that builds a
+    literal, e.g. the tail of [LOAD_NAME x, POP_JUMP_IF_FALSE, LOAD_CONST 1].
+    Args:
+        statement: the instructions that precede a store.
+
+    Returns: a tuple with the literal or None if the stored value is not a
+    literal.
+
+    """
+    for start in range(len(statement) - 1, -1, -1):
+        result = _evaluate(statement[start:])
+        if result:
+            return result
+    return None
+
+
+def _evaluate(instructions: List[dis.Instruction]) -> Optional[Tuple[Any]]:
+    # Evaluate the instructions if they build exactly one literal.
+    stack: List[Any] = []
+    for instruction in instructions:
+        if instruction.opname == 'LOAD_CONST':
+            stack.append(instruction.argval)
+        elif not _combine(stack, instruction):
+            return None
+    if len(stack) != 1 or isinstance(stack[0], CodeType):
+        return None
+    return (stack[0],)
+
+
+def _combine(stack: List[Any], instruction: dis.Instruction) -> bool:
+    # Replace the values that instruction takes from the stack by the value
+    # that it builds from them. Return False if it builds no literal.
+    if instruction.opname not in _COMBINE_OPS:
+        return False
+    taken, build = _COMBINE_OPS[instruction.opname]
+    count = taken(instruction.arg or 0)
+    if len(stack) < count:
+        return False
+    try:
+        value = build(stack[len(stack) - count:])
+    except TypeError:
+        return False
+    stack[len(stack) - count:] = [value]
+    return True
+
+
+def _extended(items: List[Any]) -> List[Any]:
+    # Build the list of LIST_EXTEND, e.g. for [1, 2, 3] since Python 3.9.
+    if not isinstance(items[0], list):
+        raise TypeError('Not a list: {}'.format(items[0]))
+    return items[0] + list(items[1])
+
+
+def _updated(items: List[Any]) -> Set[Any]:
+    # Build the set of SET_UPDATE, e.g. for {1, 2, 3} since Python 3.9.
+    if not isinstance(items[0], set):
+        raise TypeError('Not a set: {}'.format(items[0]))
+    return items[0] | set(items[1])
+
+
+def _negated(items: List[Any]) -> Union[int, float]:
+    # Build the negative number of UNARY_NEGATIVE, e.g. for -1 before 3.8.
+    if not isinstance(items[0], (int, float)):
+        raise TypeError('Not a number: {}'.format(items[0]))
+    return -items[0]
+
+
+# Instructions that build a literal from values on the stack, with the number
+# of values that they take (given their argument) and the function to build.
+_COMBINE_OPS: Dict[str, Tuple[Callable[[int], int],
+                              Callable[[List[Any]], Any]]] = {
+    'BUILD_LIST': (lambda arg: arg, list),
+    'BUILD_SET': (lambda arg: arg, set),
+    'BUILD_TUPLE': (lambda arg: arg, tuple),
+    'BUILD_CONST_KEY_MAP': (lambda arg: arg + 1,
+                            lambda items: dict(zip(items[-1], items[:-1]))),
+    'BUILD_MAP': (lambda arg: 2 * arg,
+                  lambda items: dict(zip(items[::2], items[1::2]))),
+    'LIST_EXTEND': (lambda arg: arg + 1, _extended),
+    'SET_UPDATE': (lambda arg: arg + 1, _updated),
+    'UNARY_NEGATIVE': (lambda _: 1, _negated),
+}
+
+
+def _annotation(
+        statement: List[dis.Instruction],
+        store: dis.Instruction) -> Dict[str, str]:
+    # Return {name: hint} if statement (with its store) adds a hint to the
+    # __annotations__ of a module or class.
+    if store.opname == 'STORE_ANNOTATION':
+        return _stored_annotation(statement, store)
+    if len(statement) < 3:
+        return {}
+    hint, target, name = statement[-3:]
+    if (target.argval == '__annotations__' and hint.opname in _HINT_OPS
+            and name.opname == 'LOAD_CONST'):
+        return {name.argval: str(hint.argval)}
+    return {}
+
+
+def _stored_annotation(
+        statement: List[dis.Instruction],
+        store: dis.Instruction) -> Dict[str, str]:
+    # Return {name: hint} for Python 3.6, which stores hints with an
+    # instruction of its own.
+    if statement and statement[-1].opname in _HINT_OPS:
+        return {store.argval: str(statement[-1].argval)}
+    return {}
+
+
+def _imported_from(origin: str, node: ast.ImportFrom) -> List[str]:
+    # Return the origin of 'from origin import a, b' followed by the full
+    # names of what is imported: [origin, origin.a, origin.b].
+    return [origin] + ['.'.join(part for part in (origin, alias.name) if part)
+                       for alias in node.names]
+
+
+def _bound_by_import(alias: ast.alias) -> Tuple[str, str]:
+    # Return the name that 'import a.b' binds (a) and the full name that it
+    # refers to (a), or (c, a.b) for 'import a.b as c'.
+    if alias.asname:
+        return alias.asname, alias.name
+    head = alias.name.partition('.')[0]
+    return head, head
+
+
+def _absolute(
+        name: str,
+        level: int,
+        module: str,
+        is_package: bool) -> str:
+    # Turn a (relative) imported name into an absolute name.
+    if not level:
+        return name
+    package = module if is_package else module.rpartition('.')[0]
+    for _ in range(level - 1):
+        package = package.rpartition('.')[0]
+    return '.'.join(part for part in (package, name) if part)
+
+
+def _definitions(
+        body: Iterable[ast.stmt],
+        prefix: str = '') -> Iterable[Tuple[str, _Definition]]:
+    """
+    Return the classes and functions that are defined in the given body and
+    in the bodies of classes within it, with their qualified names.
+    Args:
+        body: the statements of a module or class.
+        prefix: the qualified name of the class that holds body (if any).
+
+    Returns: an iterable of tuples (qualified name, definition).
+
+    """
+    for node in body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef,
+                             ast.AsyncFunctionDef)):
+            qualname = prefix + node.name
+            yield qualname, node
+            if isinstance(node, ast.ClassDef):
+                yield from _definitions(node.body, qualname + '.')
+
+
+def _def_line(definition: _Definition) -> int:
+    # Return the line of the def or class statement itself. Before Python 3.8,
+    # the line number of a decorated definition is that of its first
+    # decorator; the line after the last line of the decorators is taken then.
+    decorator_lines = [node.lineno for decorator in definition.decorator_list
+                       for node in ast.walk(decorator)
+                       if hasattr(node, 'lineno')]
+    if decorator_lines and definition.lineno <= max(decorator_lines):
+        return max(decorator_lines) + 1
+    return definition.lineno
+
+
+def dotted_name(node: ast.expr) -> Optional[str]:
+    """
+    Return the dotted name of the given (decorator) expression, e.g.
+    'app.route' for @app.route('/') or None if it has no name.
+    Args:
+        node: an expression.
+
+    Returns: a dotted name or None.
+
+    """
+    if isinstance(node, ast.Call):
+        return dotted_name(node.func)
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        owner = dotted_name(node.value)
+        return '{}.{}'.format(owner, node.attr) if owner else None
+    return None
@@ -1,3 +1,16 @@
-from typing import Callable
+from pathlib import Path
+from typing import (
+    Callable,
+    Iterable,
+    Optional,
+    Union,
+)
+
+from typish import Module
 
 ClsPredicate = Callable[[type], bool]
+Exclusions = Optional[Union[type, ClsPredicate,
+                            Iterable[Union[type, ClsPredicate]]]]
+Directories = Union[Path, str, Iterable[Union[Path, str]]]
+Source = Union[Path, str, Module, Iterable[Module],
+               Iterable[Union[Path, str]]]
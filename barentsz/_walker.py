@@ -0,0 +1,271 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+Listing = Tuple[List[str], List[str]]
+Lister = Callable[[Tuple[str, ...]], Listing]
+
+
+class Walker:
+    """
+    Determines which directories are walked during discovery. Pruned
+    directories are never listed and neither is anything below them.
+
+    Exclude patterns are matched against both the name and the path (relative
+    to the directory that is walked) of a directory. Include patterns are
+    matched against relative paths; a directory is walked if it is included,
+    if it is within an included directory or if it leads to one.
+
+    With workers, directories (and packages) are listed concurrently by a pool
+    of threads, ahead of when they are walked. This pays off on file systems
+    on which every listing is a slow round-trip (e.g. NFS). The walk itself
+    and its results are the same as without workers.
+
+    Example:
+        Walker(exclude=['tests', 'node_modules', 'build'], max_depth=3)
+    """
+
+    def __init__(
+            self,
+            include: Optional[Iterable[str]] = None,
+            exclude: Optional[Iterable[str]] = None,
+            max_depth: Optional[int] = None,
+            workers: Optional[int] = None):
+        """
+        Constructor.
+        :param include: patterns of directories that are to be walked.
+        :param exclude: patterns of directories that are to be pruned.
+        :param max_depth: the maximum depth of directories that are walked,
+        where 0 is the walked directory itself.
+        :param workers: the maximum number of threads that list directories
+        concurrently. If None, directories are listed one by one.
+        """
+        self.include = tuple(include or ())
+        self.exclude = tuple(exclude or ())
+        self.max_depth = max_depth
+        self.workers = workers
+
+    def allows(self, relative: Sequence[str]) -> bool:
+        """
+        Return whether the directory at the given relative path is to be
+        walked.
+        Args:
+            relative: the parts of the path of the directory, relative to the
+            directory that is walked.
+
+        Returns: True if the directory is to be walked.
+
+        """
+        if self.max_depth is not None and len(relative) > self.max_depth:
+            return False
+        if not relative:
+            return True
+        name = relative[-1]
+        path = '/'.join(relative)
+        if any(fnmatch(name, pattern) or fnmatch(path, pattern)
+               for pattern in self.exclude):
+            return False
+        return not self.include or any(_leads_to(relative, pattern.split('/'))
+                                       for pattern in self.include)
+
+    def walk(
+            self,
+            lister: Lister,
+            max_depth: Optional[int] = None) -> Iterator[
+                Tuple[Tuple[str, ...], List[str], List[str]]]:
+        """
+        Walk the directories that are allowed, top-down.
+        Args:
+            lister: a callable that lists the directories and files in the
+            directory at the given relative path.
+            max_depth: an additional maximum depth of directories that are
+            listed during this walk.
+
+        Returns: an iterator of tuples (relative path, allowed directories,
+        files).
+
+        """
+        prefetcher = (_Prefetcher(lister, self.workers) if self.workers
+                      else None)
+        try:
+            yield from self._walk(prefetcher or lister, max_depth, prefetcher)
+        finally:
+            if prefetcher:
+                prefetcher.close()
+
+    def _walk(
+            self,
+            lister: Lister,
+            max_depth: Optional[int],
+            prefetcher: Optional['_Prefetcher']) -> Iterator[
+                Tuple[Tuple[str, ...], List[str], List[str]]]:
+        # Walk top-down and let the prefetcher (if any) list the directories
+        # that are walked next.
+        to_walk: List[Tuple[str, ...]] = [()]
+        while to_walk:
+            relative = to_walk.pop()
+            dirs, files = lister(relative)
+            dirs = [name for name in dirs if self.allows(relative + (name,))]
+            yield relative, dirs, files
+            if max_depth is None or len(relative) < max_depth:
+                children = [relative + (name,) for name in dirs]
+                if prefetcher:
+                    prefetcher.prefetch(children)
+                to_walk.extend(reversed(children))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare this walker with other and check if they are equal.
+        :param other: another walker instance.
+        :return: True if both instances prune the same directories. The
+        number of workers is not compared, as it does not affect the walk.
+        """
+        return (isinstance(other, Walker)
+                and other.include == self.include
+                and other.exclude == self.exclude
+                and other.max_depth == self.max_depth)
+
+    def __hash__(self) -> int:
+        """
+        Return a hash of this walker, which allows it to be part of a cache
+        key.
+        :return: the hash of this walker.
+        """
+        return hash((self.include, self.exclude, self.max_depth))
+
+
+class _Prefetcher:
+    """
+    Lists directories with a pool of threads, ahead of when they are needed.
+    """
+
+    def __init__(self, lister: Lister, workers: int):
+        """
+        Constructor.
+        :param lister: the callable that lists a directory.
+        :param workers: the maximum number of threads.
+        """
+        self._lister = lister
+        self._executor = ThreadPoolExecutor(workers)
+        self._futures: Dict[Tuple[str, ...], Future] = {}
+
+    def prefetch(self, relatives: Iterable[Tuple[str, ...]]) -> None:
+        """
+        Start listing the directories at the given relative paths.
+        :param relatives: the relative paths in the order they are needed.
+        :return: None.
+        """
+        for relative in relatives:
+            self._futures[relative] = self._executor.submit(self._lister,
+                                                            relative)
+
+    def __call__(self, relative: Tuple[str, ...]) -> Listing:
+        """
+        Return the listing of the directory at the given relative path, which
+        waits for it if it is being listed.
+        :param relative: the relative path of a directory.
+        :return: a tuple of the names of directories and the names of files.
+        """
+        future = self._futures.pop(relative, None)
+        return future.result() if future else self._lister(relative)
+
+    def close(self) -> None:
+        """
+        Cancel the listings that did not start and release the threads.
+        :return: None.
+        """
+        for future in self._futures.values():
+            future.cancel()
+        self._executor.shutdown(wait=False)
+
+
+def match_path(parts: Sequence[str], pattern: Sequence[str]) -> bool:
+    """
+    Match the given path against the given pattern like glob does, where '**'
+    matches zero or more directories.
+    Args:
+        parts: the parts of a relative path.
+        pattern: the parts of a pattern (example: ['**', '*.py']).
+
+    Returns: True if the path matches the pattern.
+
+    """
+    if not pattern:
+        return not parts
+    head, rest = pattern[0], pattern[1:]
+    if head == '**':
+        for index in range(len(parts) + 1):
+            if match_path(parts[index:], rest):
+                return True
+            if index < len(parts) and parts[index].startswith('.'):
+                return False
+        return False
+    return (bool(parts) and match_name(parts[0], head)
+            and match_path(parts[1:], rest))
+
+
+def match_name(name: str, pattern: str) -> bool:
+    """
+    Match a name like glob does: hidden names require an explicit dot.
+    Args:
+        name: the name of a file or directory.
+        pattern: a pattern (example: '*.py').
+
+    Returns: True if the name matches the pattern.
+
+    """
+    return ((not name.startswith('.') or pattern.startswith('.'))
+            and fnmatch(name, pattern))
+
+
+def directory_lister(directory: Path) -> Lister:
+    """
+    Return a lister for walking the given directory on the file system.
+    Args:
+        directory: the directory that is walked.
+
+    Returns: a callable that lists a directory relative to directory.
+
+    """
+    def _lister(relative: Tuple[str, ...]) -> Listing:
+        return list_directory(directory.joinpath(*relative))
+    return _lister
+
+
+def list_directory(directory: Path) -> Listing:
+    """
+    List the directories and files in the given directory.
+    Args:
+        directory: the directory that is listed.
+
+    Returns: a tuple of the names of directories and the names of files.
+
+    """
+    dirs: List[str] = []
+    files: List[str] = []
+    with os.scandir(str(directory)) as entries:
+        for entry in entries:
+            (dirs if entry.is_dir() else files).append(entry.name)
+    return dirs, files
+
+
+def _leads_to(relative: Sequence[str], pattern: Sequence[str]) -> bool:
+    # Return True if relative matches pattern or is within or on the way to a
+    # directory that matches pattern.
+    for index, part in enumerate(relative):
+        if index == len(pattern) or pattern[index] == '**':
+            return True
+        if not fnmatch(part, pattern[index]):
+            return False
+    return True
@@ -0,0 +1,512 @@
+import os
+from functools import lru_cache
+from importlib.machinery import FileFinder
+from importlib.util import find_spec
+from pathlib import Path
+from pkgutil import (  # type: ignore[attr-defined]
+    get_importer,
+    iter_importer_modules,
+)
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from barentsz._events import (
+    DIRECTORY_ENTERED,
+    MODULE_FOUND,
+    emit,
+    emit_all,
+)
+from barentsz._importing import _exceeded
+from barentsz._paths import (
+    _add_to_sys_path,
+    _exists,
+    _path,
+)
+from barentsz._report import Report
+from barentsz._typings import Directories
+from barentsz._walker import (
+    Lister,
+    Listing,
+    Walker,
+)
+from barentsz._zip import split_archive
+
+# Walks of (installed) package locations, with the mtimes of the walked
+# directories at the time.
+_WALKED_LOCATIONS: Dict[Tuple[str, str, bool, Optional[Walker]], Tuple[
+    Dict[Path, Optional[float]], Dict[str, Tuple[Path, List[str]]]]] = {}
+
+
+def _module_names(
+        directory: Directories,
+        include_privates: bool,
+        namespace_packages: bool,
+        walker: Optional[Walker],
+        report: Optional[Report] = None,
+        deadline: Optional[float] = None) -> List[str]:
+    """
+    Return a list of module names like discover_module_names, walking until
+    the deadline. The directories that were not walked by then are recorded
+    in report.
+    Args:
+        directory: the directory (or dotted package name) in which is
+        searched for modules, or multiple of those.
+        include_privates: if True, privates (unders and dunders) are also
+        included.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+        report: an optional Report in which unwalked directories are recorded.
+        deadline: an optional perf_counter value after which no directories
+        are walked.
+
+    Returns: a list of module names (strings).
+
+    """
+    unwalked: List[Path] = []
+    walked = _walk_packages(directory, namespace_packages, walker,
+                            unwalked=unwalked, deadline=deadline)
+    _record_unwalked(report, unwalked)
+    result = []
+    for _, module_names in walked.values():
+        result.extend([name for name in module_names
+                       if include_privates
+                       or not name.rpartition('.')[2].startswith('_')])
+    result.sort()
+    emit_all(MODULE_FOUND, result)
+    return result
+
+
+def _record_unwalked(report: Optional[Report], unwalked: List[Path]) -> None:
+    # Record the directories that were not walked (if any) in report.
+    if unwalked and report is not None:
+        report.complete = False
+        report.unwalked.extend(str(path) for path in unwalked)
+
+
+def _discover_packages_per_path(
+        directory: Directories,
+        namespace_packages: bool = False,
+        walker: Optional[Walker] = None) -> Dict[Path, str]:
+    """
+    Discover packages and their original Paths within the given directory.
+    Args:
+        directory: the directory in which is searched for modules, or multiple
+        of those.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+
+    Returns: a dict with Paths as keys and strings (the package names) as
+    values.
+
+    """
+    return {path: package for package, (path, _)
+            in _walk_packages(directory, namespace_packages, walker).items()}
+
+
+def _walk_packages(
+        directory: Directories,
+        namespace_packages: bool = False,
+        walker: Optional[Walker] = None,
+        package_cache: Optional[Dict[Path, bool]] = None,
+        unwalked: Optional[List[Path]] = None,
+        deadline: Optional[float] = None
+) -> Dict[str, Tuple[Path, List[str]]]:
+    """
+    Walk the packages within the given directory and collect the names of
+    their modules. The listings are obtained through the importers (finders)
+    of the import system, which are cached in sys.path_importer_cache and
+    which are reused when the modules are imported.
+    Args:
+        directory: the directory in which is searched for packages, or
+        multiple of such directories.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+        package_cache: an optional dict that holds the package status of
+        directories that were checked before.
+        unwalked: an optional list to which the directories are added that
+        were not walked before the deadline.
+        deadline: an optional perf_counter value after which no directories
+        are walked.
+
+    Returns: a dict with package names as keys and a tuple of the package
+    Path and the names of the modules in that package as values.
+
+    """
+    if not isinstance(directory, (Path, str)):
+        return _walk_roots(directory, namespace_packages, walker, unwalked,
+                           deadline)
+    if _is_package_name(directory):
+        return _walk_package_by_name(str(directory), namespace_packages,
+                                     walker, unwalked, deadline)
+
+    directory_path = _path(directory)
+    if not _exists(directory_path):
+        raise ValueError('The given directory does not exist. '
+                         'Given: {}'.format(directory))
+    if _is_package(directory_path, package_cache):
+        base_package = _to_package_name(directory_path, package_cache)
+    elif namespace_packages and directory_path.stem.isidentifier():
+        base_package = directory_path.stem
+        # Like the parent of a regular package, the parent of the namespace
+        # package must be importable.
+        _add_to_sys_path(str(directory_path.absolute().parent))
+    else:
+        raise ValueError('The given directory must itself be a package. '
+                         'Given: {}'.format(directory))
+    return _walk_packages_from(directory_path, base_package,
+                               namespace_packages, walker, unwalked, deadline)
+
+
+def _walk_roots(
+        directories: Iterable[Union[Path, str]],
+        namespace_packages: bool,
+        walker: Optional[Walker],
+        unwalked: Optional[List[Path]] = None,
+        deadline: Optional[float] = None
+) -> Dict[str, Tuple[Path, List[str]]]:
+    """
+    Walk the packages within all given directories. The package status of
+    directories is shared among the walks, so common parents are checked only
+    once. Packages that are found through multiple (overlapping) directories
+    are merged.
+    Args:
+        directories: the directories in which is searched for packages.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+        unwalked: an optional list to which the directories are added that
+        were not walked before the deadline.
+        deadline: an optional perf_counter value after which no directories
+        are walked.
+
+    Returns: a dict with package names as keys and a tuple of the package
+    Path and the names of the modules in that package as values.
+
+    """
+    package_cache: Dict[Path, bool] = {}
+    result: Dict[str, Tuple[Path, List[str]]] = {}
+    for directory in directories:
+        walked = _walk_packages(directory, namespace_packages, walker,
+                                package_cache, unwalked, deadline)
+        for package, (path, module_names) in walked.items():
+            known_path, known_names = result.get(package, (path, []))
+            known_set = set(known_names)
+            result[package] = (known_path, known_names + [
+                name for name in module_names if name not in known_set])
+    return result
+
+
+def _walk_packages_from(
+        directory: Path,
+        base_package: str,
+        namespace_packages: bool,
+        walker: Optional[Walker],
+        unwalked: Optional[List[Path]] = None,
+        deadline: Optional[float] = None
+) -> Dict[str, Tuple[Path, List[str]]]:
+    """
+    Walk the packages within the given directory, which is known to be the
+    package with the given name. The packages are listed through the walker,
+    so that its workers apply to package walks as well.
+    Args:
+        directory: the directory of the base package.
+        base_package: the full name of the base package.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+        unwalked: an optional list to which the directories are added that
+        were not walked before the deadline.
+        deadline: an optional perf_counter value after which no directories
+        are walked.
+
+    Returns: a dict with package names as keys and a tuple of the package
+    Path and the names of the modules in that package as values.
+
+    """
+    result = {}
+    # All packages must have a straight line of packages from the base
+    # package, so only subpackages are walked into.
+    lister = _package_lister(directory, base_package, namespace_packages)
+    pending: Set[Tuple[str, ...]] = set()
+    for relative, subpackages, module_names in (walker or Walker()).walk(
+            lister):
+        path = directory.joinpath(*relative)
+        emit(DIRECTORY_ENTERED, path)
+        result['.'.join((base_package,) + relative)] = (path, module_names)
+        pending.discard(relative)
+        pending.update(relative + (name,) for name in subpackages)
+        if pending and _exceeded(deadline):
+            # Closing the walk cancels the listings that are in flight.
+            if unwalked is not None:
+                unwalked.extend(directory.joinpath(*parts)
+                                for parts in sorted(pending))
+            break
+    return result
+
+
+def _package_lister(
+        directory: Path,
+        base_package: str,
+        namespace_packages: bool) -> Lister:
+    # Return a lister of the subpackages (by name) and the modules (by full
+    # name) of the packages within directory.
+    def _lister(relative: Tuple[str, ...]) -> Listing:
+        subpackages: List[str] = []
+        module_names: List[str] = []
+        for name, is_package in _iter_modules(
+                directory.joinpath(*relative),
+                '.'.join((base_package,) + relative), namespace_packages):
+            if is_package:
+                subpackages.append(name.rpartition('.')[2])
+            else:
+                module_names.append(name)
+        return subpackages, module_names
+    return _lister
+
+
+def _walk_package_by_name(
+        package: str,
+        namespace_packages: bool,
+        walker: Optional[Walker],
+        unwalked: Optional[List[Path]] = None,
+        deadline: Optional[float] = None
+) -> Dict[str, Tuple[Path, List[str]]]:
+    """
+    Walk the packages of the (installed) package with the given name. The
+    package is located once and the result of walking each location is cached
+    for as long as none of the walked directories is modified.
+    Args:
+        package: the dotted name of a package (e.g. 'some.package').
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+        unwalked: an optional list to which the directories are added that
+        were not walked before the deadline.
+        deadline: an optional perf_counter value after which no directories
+        are walked.
+
+    Returns: a dict with package names as keys and a tuple of the package
+    Path and the names of the modules in that package as values.
+
+    """
+    result: Dict[str, Tuple[Path, List[str]]] = {}
+    for location in _locate_package(package):
+        walked = _walk_location(package, location, namespace_packages, walker,
+                                unwalked, deadline)
+        for name, (path, module_names) in walked.items():
+            # Portions of a namespace package may reside at multiple
+            # locations.
+            _, known_names = result.get(name, (path, []))
+            result[name] = (path, known_names + module_names)
+    return result
+
+
+@lru_cache(maxsize=None)
+def _locate_package(package: str) -> Tuple[str, ...]:
+    """
+    Locate the package with the given name, using the import system.
+    Args:
+        package: the dotted name of a package (e.g. 'some.package').
+
+    Returns: a tuple with the directories of the package.
+
+    """
+    try:
+        spec = find_spec(package)
+    except ImportError as err:
+        raise ValueError('The package `{}` could not be found.'
+                         .format(package)) from err
+    if spec is None:
+        raise ValueError('The package `{}` could not be found.'
+                         .format(package))
+    if not spec.submodule_search_locations:
+        raise ValueError('The given name must be a package. Given: {}'
+                         .format(package))
+    return tuple(spec.submodule_search_locations)
+
+
+def _walk_location(
+        package: str,
+        location: str,
+        namespace_packages: bool,
+        walker: Optional[Walker],
+        unwalked: Optional[List[Path]] = None,
+        deadline: Optional[float] = None
+) -> Dict[str, Tuple[Path, List[str]]]:
+    """
+    Walk a package at a location, or return the result of an earlier walk if
+    none of the walked directories was modified since. Adding or removing a
+    module or subpackage modifies the directory that contains it. A walk that
+    is cut short by the deadline is not cached.
+    Args:
+        package: the dotted name of a package (e.g. 'some.package').
+        location: a directory of the package.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+        unwalked: an optional list to which the directories are added that
+        were not walked before the deadline.
+        deadline: an optional perf_counter value after which no directories
+        are walked.
+
+    Returns: a dict with package names as keys and a tuple of the package
+    Path and the names of the modules in that package as values.
+
+    """
+    key = (package, location, namespace_packages, walker)
+    cached = _WALKED_LOCATIONS.get(key)
+    if cached and all(_directory_mtime(path) == mtime
+                      for path, mtime in cached[0].items()):
+        emit_all(DIRECTORY_ENTERED, [path for path, _ in cached[1].values()])
+        return cached[1]
+    missed: List[Path] = []
+    result = _walk_packages_from(Path(location), package, namespace_packages,
+                                 walker, missed, deadline)
+    if missed:
+        if unwalked is not None:
+            unwalked.extend(missed)
+        return result
+    mtimes = {path: _directory_mtime(path) for path, _ in result.values()}
+    _WALKED_LOCATIONS[key] = (mtimes, result)
+    return result
+
+
+def _directory_mtime(path: Path) -> Optional[float]:
+    # Return the mtime of the directory or None if it no longer exists.
+    try:
+        return os.stat(str(path)).st_mtime
+    except OSError:
+        return None
+
+
+def _is_package_name(source: Union[Path, str]) -> bool:
+    """
+    Return True if the given source is a dotted (package) name rather than a
+    path. Existing paths take precedence over names.
+    Args:
+        source: a path or a dotted name.
+
+    Returns: True if source is to be treated as a package name.
+
+    """
+    return (isinstance(source, str)
+            and all(part.isidentifier() for part in source.split('.'))
+            and not Path(source).exists())
+
+
+def _iter_modules(
+        directory: Path,
+        package: str,
+        namespace_packages: bool = False) -> Iterable[Tuple[str, bool]]:
+    """
+    Iterate over the modules and subpackages that are directly within the
+    given directory, using the (cached) importer for that directory.
+    Args:
+        directory: the directory of the package.
+        package: the name of the package.
+        namespace_packages: if True, directories without an __init__.py are
+        yielded as packages as well.
+
+    Returns: an iterable of tuples (module name, is package).
+
+    """
+    importer = get_importer(str(directory.absolute()))
+    if importer is None:
+        return
+    prefix = package + '.'
+    yielded = set()
+    for name, is_package in iter_importer_modules(  # type: ignore[attr-defined] # noqa
+            importer, prefix):
+        yielded.add(name)
+        yield name, is_package
+    if namespace_packages and isinstance(importer, FileFinder):
+        for name in _namespace_portions(directory, importer, prefix):
+            if name not in yielded:
+                yield name, True
+
+
+def _namespace_portions(
+        directory: Path,
+        finder: FileFinder,
+        prefix: str) -> Iterable[str]:
+    """
+    Return the names of the namespace packages that are directly within the
+    given directory. The finder decides what is a namespace package, just like
+    it would upon importing.
+    Args:
+        directory: the directory of the package.
+        finder: the finder for directory.
+        prefix: the prefix for every name.
+
+    Returns: an iterable of namespace package names.
+
+    """
+    with os.scandir(str(directory)) as entries:
+        candidates = [entry.name for entry in entries
+                      if entry.name.isidentifier()
+                      and entry.name != '__pycache__'
+                      and entry.is_dir()]
+    for candidate in candidates:
+        spec = finder.find_spec(prefix + candidate)
+        if (spec is not None and spec.loader is None
+                and spec.submodule_search_locations):
+            yield prefix + candidate
+
+
+def _is_package(
+        directory: Path,
+        package_cache: Optional[Dict[Path, bool]] = None) -> bool:
+    """
+    Return True if the given directory is a package and False otherwise.
+    Args:
+        directory: the directory to check.
+        package_cache: an optional dict that holds the package status of
+        directories that were checked before.
+
+    Returns: True if directory is a package.
+
+    """
+    if package_cache is None:
+        package_cache = {}
+    key = directory.absolute()
+    if key not in package_cache:
+        # The parent of the top-level package must be importable.
+        archive = split_archive(key)
+        _add_to_sys_path(str(archive[0].absolute() if archive else key))
+        # Sourceless packages have only a compiled __init__.pyc.
+        package_cache[key] = any(_exists(directory / ('__init__' + ext))
+                                 for ext in ('.py', '.pyc'))
+    return package_cache[key]
+
+
+def _to_package_name(
+        directory: Path,
+        package_cache: Optional[Dict[Path, bool]] = None) -> str:
+    """
+    Translate the given directory to a package (str). Check every parent
+    directory in the tree to find the complete fully qualified package name.
+    Args:
+        directory: the directory that is to become a package name.
+        package_cache: an optional dict that holds the package status of
+        directories that were checked before.
+
+    Returns: a package name as string.
+
+    """
+    parts: List[str] = []
+    current_dir = directory.absolute()
+    while _is_package(current_dir, package_cache):
+        # See how far up the tree we can go while still in a package.
+        parts.insert(0, current_dir.stem)
+        current_dir = current_dir.parent
+    return '.'.join(parts)
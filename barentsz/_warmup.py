@@ -0,0 +1,63 @@
+import gc
+from typing import Optional
+
+from barentsz._graph import discover_import_graph
+from barentsz._importing import import_module_with, tracing
+from barentsz._report import Report
+from barentsz._typings import Directories
+from barentsz._walker import Walker
+
+
+def warmup(
+        directory: Directories,
+        include_privates: bool = False,
+        raise_on_fail: bool = False,
+        freeze: bool = False,
+        namespace_packages: bool = False,
+        walker: Optional[Walker] = None,
+        profile_memory: bool = False) -> Report:
+    """
+    Import all modules within the given directory, for instance in the master
+    process of a pre-forking server, so workers share them copy-on-write. The
+    modules are imported in the order of their static import graph, such that
+    every module is imported after the modules that it imports.
+    Args:
+        directory: the directory (or dotted package name) in which is
+        searched for modules, or multiple of those.
+        include_privates: if True, private modules are imported as well.
+        raise_on_fail: if True, an ImportError is raised upon failing to
+        import any module.
+        freeze: if True, gc.freeze() is called after importing, which moves
+        all objects to a permanent generation that the garbage collector
+        ignores and thus does not touch (and copy) in forked workers.
+        namespace_packages: if True, directories without an __init__.py are
+        considered to be (namespace) packages as well.
+        walker: a Walker that determines which directories are walked.
+        profile_memory: if True, the memory that is allocated by every import
+        is traced (using tracemalloc) and recorded in the report.
+
+    Returns: a Report of the imported modules and their durations.
+
+    """
+    graph = discover_import_graph(directory, include_privates,
+                                  namespace_packages, walker)
+    report = Report()
+    with tracing(profile_memory):
+        for module in graph.topological_order():
+            try:
+                import_module_with(module, report,
+                                   profile_memory=profile_memory)
+            except Exception as err:
+                if raise_on_fail:
+                    raise ImportError(err) from err
+    if freeze:
+        _freeze(report)
+    return report
+
+
+def _freeze(report: Report) -> None:
+    # Move all objects to a permanent generation, if this Python supports it.
+    if hasattr(gc, 'freeze'):
+        gc.collect()
+        gc.freeze()
+        report.frozen = True
@@ -0,0 +1,165 @@
+import os
+import zipfile
+from pathlib import Path
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from typish import Module
+
+from barentsz._cache import MtimeCache
+from barentsz._walker import Listing
+
+
+class ZipIndex:
+    """
+    An index of the directory structure of a zip archive. The index is built
+    once from the central directory of the archive, so no member is extracted
+    or read while walking.
+    """
+
+    def __init__(self, names: List[str]):
+        """
+        Constructor.
+        :param names: the names of all members of the archive.
+        """
+        self.children: Dict[str, Dict[str, bool]] = {'': {}}
+        for name in names:
+            parts = name.rstrip('/').split('/')
+            for index, part in enumerate(parts):
+                parent = '/'.join(parts[:index])
+                is_dir = index < len(parts) - 1 or name.endswith('/')
+                self.children.setdefault(parent, {})
+                self.children[parent][part] = (
+                    self.children[parent].get(part, False) or is_dir)
+                if is_dir:
+                    self.children.setdefault('/'.join(parts[:index + 1]), {})
+
+    def is_dir(self, inner: str) -> bool:
+        """
+        Return whether the given inner path is a directory in the archive.
+        Args:
+            inner: a path within the archive (separated by '/').
+
+        Returns: True if inner is a directory.
+
+        """
+        return inner in self.children
+
+    def exists(self, inner: str) -> bool:
+        """
+        Return whether the given inner path exists in the archive.
+        Args:
+            inner: a path within the archive (separated by '/').
+
+        Returns: True if inner is a file or directory within the archive.
+
+        """
+        parent, _, name = inner.rpartition('/')
+        return self.is_dir(inner) or name in self.children.get(parent, {})
+
+    def list(self, inner: str) -> Listing:
+        """
+        List the directories and files in the given inner directory.
+        Args:
+            inner: a directory within the archive (separated by '/').
+
+        Returns: a tuple of the names of directories and the names of files.
+
+        """
+        children = self.children.get(inner, {})
+        dirs = [name for name, is_dir in children.items() if is_dir]
+        files = [name for name, is_dir in children.items() if not is_dir]
+        return dirs, files
+
+
+def split_archive(path: Path) -> Optional[Tuple[Path, str]]:
+    """
+    Split the given path into the zip archive that contains it and the inner
+    path within that archive. Return None if the path is not within an archive.
+    Args:
+        path: a path that may point into a zip archive.
+
+    Returns: a tuple (archive, inner path) or None.
+
+    """
+    if path.is_dir():
+        return None
+    for candidate in [path, *path.parents]:
+        if candidate.is_file():
+            if not zipfile.is_zipfile(str(candidate)):
+                return None
+            inner = path.relative_to(candidate).as_posix()
+            return candidate, '' if inner == '.' else inner
+    return None
+
+
+_ZIP_INDICES: MtimeCache[ZipIndex] = MtimeCache()
+
+
+def zip_index(archive: Path) -> ZipIndex:
+    """
+    Return the (cached) index of the given zip archive. The index is rebuilt
+    only when the archive is modified.
+    Args:
+        archive: the path to the zip archive.
+
+    Returns: a ZipIndex.
+
+    """
+    path = str(archive.absolute())
+    return _ZIP_INDICES.get(path, archive.stat().st_mtime,
+                            lambda: _read_zip_index(path))
+
+
+def _read_zip_index(archive: str) -> ZipIndex:
+    # Build the index from the central directory of the archive.
+    with zipfile.ZipFile(archive) as zip_file:
+        return ZipIndex(zip_file.namelist())
+
+
+def path_mtime(path: str) -> Optional[float]:
+    """
+    Return the modification time of the file at the given path or, if that
+    file is within a zip archive, of that archive.
+    Args:
+        path: the path to a file (possibly within an archive).
+
+    Returns: the modification time or None if there is no such file.
+
+    """
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        archive = split_archive(Path(path))
+        return archive[0].stat().st_mtime if archive else None
+
+
+def module_mtime(module: Module) -> Optional[float]:
+    """
+    Return the modification time of the file of the given module or, if that
+    file is within a zip archive, of that archive.
+    Args:
+        module: a module.
+
+    Returns: the modification time or None if the module has no such file.
+
+    """
+    path = getattr(module, '__file__', None)
+    return path_mtime(path) if isinstance(path, str) else None
+
+
+def join_inner(inner: str, name: str) -> str:
+    """
+    Join a name (or a relative path) to an inner path.
+    Args:
+        inner: a path within an archive (separated by '/').
+        name: the name or relative path that is joined.
+
+    Returns: the joined inner path.
+
+    """
+    return '{}/{}'.format(inner, name) if inner and name else inner or name
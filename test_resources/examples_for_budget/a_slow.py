@@ -0,0 +1,7 @@
+from time import sleep
+
+sleep(0.2)
+
+
+class SlowClass:
+    pass
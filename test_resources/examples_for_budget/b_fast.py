@@ -0,0 +1,5 @@
+class FastClass:
+    pass
+
+
+FAST_ATTRIBUTE = 42
@@ -0,0 +1,8 @@
+def route(path):
+    def _decorator(func):
+        return func
+    return _decorator
+
+
+def task(func):
+    return func
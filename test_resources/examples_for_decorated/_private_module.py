@@ -0,0 +1,6 @@
+from examples_for_decorated import task
+
+
+@task
+def hidden():
+    ...
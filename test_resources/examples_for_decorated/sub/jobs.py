@@ -0,0 +1,6 @@
+from .. import task
+
+
+@task
+async def nightly():
+    ...
@@ -0,0 +1,30 @@
+import examples_for_decorated as app
+from examples_for_decorated import route as r
+
+raise RuntimeError('This module must not be imported.')
+
+
+@r('/users')
+def users():
+    ...
+
+
+@app.task
+class Cleanup:
+    @app.task
+    def nested(self):
+        ...
+
+
+@app.route('/orders')
+def orders():
+    ...
+
+
+@r('/private')
+def _private():
+    ...
+
+
+def undecorated():
+    ...
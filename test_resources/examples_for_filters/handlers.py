@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+
+
+def register(cls):
+    return cls
+
+
+class BaseHandler(ABC):
+    @abstractmethod
+    def handle(self):
+        ...
+
+
+@register
+class UserHandler(BaseHandler):
+    route = '/users'
+
+    def handle(self):
+        ...
+
+
+class OrderHandler(BaseHandler):
+    def handle(self):
+        ...
+
+
+class Helper:
+    route = '/help'
+
+
+@register
+def registered_function():
+    ...
+
+
+def plain_function():
+    ...
@@ -0,0 +1 @@
+from examples_for_import_graph import cycle_b
@@ -0,0 +1,3 @@
+def function_b():
+    from . import cycle_a
+    return cycle_a
@@ -0,0 +1,2 @@
+import examples_for_import_graph.standalone
+from examples_for_import_graph.cycle_a import cycle_b
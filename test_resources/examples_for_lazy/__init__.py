@@ -0,0 +1 @@
+EXECUTED = []
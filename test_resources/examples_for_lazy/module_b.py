@@ -0,0 +1,5 @@
+from examples_for_lazy import EXECUTED
+
+EXECUTED.append(__name__)
+
+value_b = 'b'
@@ -0,0 +1,3 @@
+from examples_for_memory import big
+
+SMALL = [big]
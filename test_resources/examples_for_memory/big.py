@@ -0,0 +1 @@
+DATA = bytearray(1000000)
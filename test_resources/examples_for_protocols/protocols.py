@@ -0,0 +1,24 @@
+from typing import (
+    Protocol,
+    runtime_checkable,
+)
+
+
+@runtime_checkable
+class HasArea(Protocol):
+    def area(self):
+        ...
+
+
+@runtime_checkable
+class HasNamedArea(HasArea, Protocol):
+    name: str
+
+
+class NotRuntimeCheckable(Protocol):
+    def area(self):
+        ...
+
+
+class ExplicitShape(HasNamedArea):
+    ...
@@ -0,0 +1,18 @@
+class Circle:
+    name = 'circle'
+
+    def area(self):
+        ...
+
+
+class Square:
+    def area(self):
+        ...
+
+
+class NamedSquare(Square):
+    name: str
+
+
+class Unmeasurable(Square):
+    area = None
@@ -0,0 +1,6 @@
+class Origin:
+    ...
+
+
+def origin_function():
+    ...
@@ -0,0 +1,9 @@
+from examples_for_reexports.origin import Origin, origin_function
+
+
+class Own:
+    ...
+
+
+def own_function():
+    ...
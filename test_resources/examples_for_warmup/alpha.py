@@ -0,0 +1,5 @@
+from examples_for_warmup import beta
+
+
+def alpha_function():
+    return beta.beta_function()
@@ -0,0 +1,5 @@
+from .gamma import gamma_function
+
+
+def beta_function():
+    return gamma_function()
@@ -0,0 +1,2 @@
+def gamma_function():
+    return 'gamma'
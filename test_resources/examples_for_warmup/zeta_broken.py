@@ -0,0 +1 @@
+raise RuntimeError('This module cannot be imported.')
@@ -0,0 +1,107 @@
+import py_compile
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from barentsz import (
+    AttributeTable,
+    discover_attribute_table,
+    discover_attributes,
+)
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+
+class TestAttributeTable(TestCase):
+    path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                         / 'examples_for_tests')
+
+    def test_discover_attribute_table(self):
+        # EXECUTE
+        table = discover_attribute_table(self.path_to_resources,
+                                         include_privates=True,
+                                         in_private_modules=True)
+        attributes = discover_attributes(self.path_to_resources,
+                                         include_privates=True,
+                                         in_private_modules=True)
+
+        # VERIFY
+        self.assertEqual(6, len(table))
+        self.assertListEqual([attr.name for attr in attributes], table.names)
+        self.assertListEqual([attr.module.__name__ for attr in attributes],
+                             table.module_names)
+        self.assertListEqual([attr.line_nr for attr in attributes],
+                             list(table.line_nrs))
+        self.assertListEqual([attr.hint for attr in attributes], table.hints)
+        self.assertListEqual(attributes, list(table))
+        self.assertEqual(attributes[2], table[2])
+        self.assertEqual('AttributeTable(6 attributes in 3 modules)',
+                         repr(table))
+
+    def test_strings_are_interned(self):
+        # EXECUTE
+        table = discover_attribute_table(self.path_to_resources,
+                                         include_privates=True)
+
+        # VERIFY
+        self.assertIs(table.names[0], table.names[1])
+        self.assertIs(table.module_names[0], table.module_names[2])
+
+    def test_where(self):
+        # SETUP
+        table = discover_attribute_table(self.path_to_resources,
+                                         include_privates=True,
+                                         in_private_modules=True)
+
+        # EXECUTE
+        public = table.where(name='^[A-Z]')
+        in_level2 = table.where(module='*.level2.*')
+        hinted = table.where(name='ATTR1', hint='int')
+        none = table.where(name='ATTR1', module='*.level2.*', hint='int')
+
+        # VERIFY
+        self.assertListEqual(['ATTR1'] * 3, public.names)
+        self.assertListEqual(['examples_for_tests.level2.module1'] * 2,
+                             in_level2.module_names)
+        self.assertListEqual(['examples_for_tests.module1'],
+                             hinted.module_names)
+        self.assertEqual(42, list(hinted)[0].value)
+        self.assertEqual(0, len(none))
+        self.assertListEqual([], list(none))
+
+    def test_empty_table(self):
+        # EXECUTE
+        table = AttributeTable()
+
+        # VERIFY
+        self.assertEqual(0, len(table))
+        self.assertListEqual([], list(table.where(name='.*')))
+
+    def test_attributes_on_one_line(self):
+        # SETUP
+        temp_dir = Path(tempfile.mkdtemp())
+        package = temp_dir / 'one_line_package'
+        package.mkdir()
+        for name, source in (('__init__.py', ''),
+                             ('constants.py', 'A = 1; B = 2\n')):
+            path = package / name
+            path.write_text(source)
+            # Without source, both attributes are found on the same line.
+            py_compile.compile(str(path), str(path) + 'c', doraise=True)
+            path.unlink()
+
+        # EXECUTE
+        table = discover_attribute_table(package)
+        attributes = list(table)
+        second = table[1]
+        for name in list(sys.modules):
+            if name.startswith('one_line_package'):
+                del sys.modules[name]
+        shutil.rmtree(str(temp_dir))
+
+        # VERIFY
+        self.assertListEqual(['A', 'B'], table.names)
+        self.assertListEqual(['A', 'B'], [attr.name for attr in attributes])
+        self.assertEqual(2, second.value)
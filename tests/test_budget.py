@@ -0,0 +1,149 @@
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Set,
+)
+from unittest import TestCase
+
+from barentsz import (
+    Report,
+    discover,
+    discover_attributes,
+    discover_classes,
+    discover_module_names,
+    discover_modules,
+)
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+import examples_for_budget
+
+
+class TestBudget(TestCase):
+    path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                         / 'examples_for_budget')
+
+    def setUp(self):
+        for name in list(sys.modules):
+            if name.startswith('examples_for_budget.'):
+                del sys.modules[name]
+                delattr(examples_for_budget, name.rpartition('.')[2])
+
+    def test_discover_modules_without_budget_left(self):
+        # SETUP
+        report = Report()
+
+        # EXECUTE
+        modules = discover_modules(self.path_to_resources, report=report,
+                                   budget=0)
+
+        # VERIFY
+        self.assertListEqual([], modules)
+        self.assertFalse(report.complete)
+        self.assertListEqual(['examples_for_budget.a_slow',
+                              'examples_for_budget.b_fast'], report.pending)
+        self.assertNotIn('examples_for_budget.a_slow', sys.modules)
+
+    def test_discover_classes_stops_after_slow_module(self):
+        # SETUP
+        report = Report()
+
+        # EXECUTE
+        classes = discover_classes(self.path_to_resources, report=report,
+                                   budget=0.1)
+
+        # VERIFY
+        self.assertListEqual(['SlowClass'], [cls.__name__ for cls in classes])
+        self.assertFalse(report.complete)
+        self.assertListEqual(['examples_for_budget.b_fast'], report.pending)
+
+    def test_discover_attributes_within_budget(self):
+        # SETUP
+        report = Report()
+
+        # EXECUTE
+        attributes = discover_attributes(self.path_to_resources,
+                                         report=report, budget=10)
+
+        # VERIFY
+        self.assertListEqual(['FAST_ATTRIBUTE'],
+                             [attr.name for attr in attributes])
+        self.assertTrue(report.complete)
+        self.assertListEqual([], report.pending)
+
+    def test_discover_list_with_budget(self):
+        self._test_discover_with_budget(List[type])
+
+    def test_discover_iterator_with_budget(self):
+        self._test_discover_with_budget(Iterator[type])
+
+    def test_discover_set_with_budget(self):
+        self._test_discover_with_budget(Set[type])
+
+    def test_discover_dict_with_budget(self):
+        self._test_discover_with_budget(Dict[str, type])
+
+    def _test_discover_with_budget(self, what):
+        # SETUP
+        report = Report()
+
+        # EXECUTE
+        result = discover(self.path_to_resources, what=what, report=report,
+                          budget=0.1)
+
+        # VERIFY
+        self.assertListEqual(['SlowClass'],
+                             [getattr(cls, '__name__', cls) for cls in result])
+        self.assertFalse(report.complete)
+        self.assertListEqual(['examples_for_budget.b_fast'], report.pending)
+
+    def test_budget_requires_report(self):
+        # EXECUTE & VERIFY
+        with self.assertRaises(ValueError):
+            discover_modules(self.path_to_resources, budget=10)
+        with self.assertRaises(ValueError):
+            discover(self.path_to_resources, budget=10)
+
+    def test_walk_stops_without_budget_left(self):
+        # SETUP
+        report = Report()
+        path_to_examples = self.path_to_resources.parent / 'examples_for_tests'
+
+        # EXECUTE
+        names = discover_module_names(path_to_examples)
+        modules = discover_modules(path_to_examples, report=report, budget=0)
+
+        # VERIFY
+        self.assertIn('examples_for_tests.level2.module1', names)
+        self.assertListEqual([], modules)
+        self.assertFalse(report.complete)
+        self.assertListEqual([str(path_to_examples / 'level2')],
+                             report.unwalked)
+
+    def test_partial_walk_is_not_cached(self):
+        # SETUP
+        temp_dir = Path(tempfile.mkdtemp())
+        package_dir = temp_dir / 'partially_walked_package'
+        (package_dir / 'sub').mkdir(parents=True)
+        (package_dir / '__init__.py').write_text('')
+        (package_dir / 'sub' / '__init__.py').write_text('')
+        (package_dir / 'sub' / 'module.py').write_text('')
+        sys.path.append(str(temp_dir))
+        report = Report()
+
+        # EXECUTE
+        partial = discover_modules('partially_walked_package', report=report,
+                                   budget=0)
+        names = discover_module_names('partially_walked_package')
+        sys.path.remove(str(temp_dir))
+        shutil.rmtree(str(temp_dir))
+
+        # VERIFY
+        self.assertListEqual([], partial)
+        self.assertListEqual([str(package_dir / 'sub')], report.unwalked)
+        self.assertListEqual(['partially_walked_package.sub.module'], names)
@@ -0,0 +1,24 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from barentsz._cache import MtimeCache
+
+
+class TestMtimeCache(TestCase):
+
+    def test_get_computes_once_per_mtime(self):
+        # SETUP
+        cache = MtimeCache()
+        compute = Mock(side_effect=['first', 'second', 'third'])
+
+        # EXECUTE
+        values = [cache.get('a.py', 1.0, compute),
+                  cache.get('a.py', 1.0, compute),
+                  cache.get('a.py', 2.0, compute)]
+        cache.clear()
+        cleared = cache.get('a.py', 2.0, compute)
+
+        # VERIFY
+        self.assertListEqual(['first', 'first', 'second'], values)
+        self.assertEqual('third', cleared)
+        self.assertEqual(3, compute.call_count)
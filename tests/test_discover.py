@@ -1,6 +1,11 @@
 import sys
 from pathlib import Path
-from typing import List
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Set,
+)
 from unittest import TestCase
 
 sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
@@ -55,6 +60,57 @@ class TestDiscoverClasses(TestCase):
         self.assertIn(Class1, discoveries2)
         self.assertIn(Class1Level2, discoveries2)
 
+    def test_discover_iterator(self):
+        # SETUP
+        path_to_resources = (here().parent / 'test_resources'
+                             / 'examples_for_tests')
+
+        # EXECUTE
+        discoveries = discover(path_to_resources, what=Iterator[type])
+
+        # VERIFY
+        self.assertIsInstance(discoveries, Iterator)
+        self.assertSetEqual({Class1, Class1Level2}, set(discoveries))
+
+    def test_discover_iterator_with_signature(self):
+        # SETUP
+        path_to_resources = (here().parent / 'test_resources'
+                             / 'examples_for_tests')
+
+        # EXECUTE
+        discoveries = discover(path_to_resources, what=Iterator[str])
+
+        # VERIFY
+        self.assertListEqual([Class1], list(discoveries))
+
+    def test_discover_set(self):
+        # SETUP
+        path_to_resources = (here().parent / 'test_resources'
+                             / 'examples_for_tests')
+
+        # EXECUTE
+        discoveries1 = discover(path_to_resources, what=Set[type])
+        discoveries2 = discover(path_to_resources, what=set)
+
+        # VERIFY
+        self.assertSetEqual({Class1, Class1Level2}, discoveries1)
+        self.assertSetEqual({Class1, Class1Level2}, discoveries2)
+
+    def test_discover_dict(self):
+        # SETUP
+        path_to_resources = (here().parent / 'test_resources'
+                             / 'examples_for_tests')
+
+        # EXECUTE
+        discoveries1 = discover(path_to_resources, what=Dict[str, str])
+        discoveries2 = discover(path_to_resources, what=dict,
+                                include_privates=True)
+
+        # VERIFY
+        self.assertDictEqual({'Class1': Class1}, discoveries1)
+        self.assertIn('Class1', discoveries2)
+        self.assertIn('_PrivateClass', discoveries2)
+
     def test_discover_not_supported(self):
         # SETUP
         path_to_resources = (here().parent / 'test_resources'
@@ -1,5 +1,6 @@
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
 from barentsz._discover import (
     discover_attributes,
@@ -58,6 +59,18 @@ class TestDiscoverClasses(TestCase):
                          'multiple lines...', attributes[0].doc)
         self.assertEqual('And some more comments here...', attributes[0].comment)
 
+    def test_discover_attributes_reads_source_once(self):
+        # SETUP
+        loader = module1.__loader__
+
+        # EXECUTE
+        with patch.object(loader, 'get_source',
+                          wraps=loader.get_source) as get_source:
+            discover_attributes(module1)
+
+        # VERIFY
+        self.assertEqual(1, get_source.call_count)
+
     def test_discover_attributes_in_private_modules(self):
         # SETUP
         path_to_resources = (Path(__file__).parent.parent / 'test_resources'
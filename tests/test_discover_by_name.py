@@ -0,0 +1,98 @@
+import shutil
+import sys
+import tempfile
+from importlib import invalidate_caches
+from pathlib import Path
+from unittest import TestCase
+
+from barentsz import (
+    discover_classes,
+    discover_module_names,
+    discover_packages,
+)
+from barentsz._walking import _directory_mtime, _walk_location
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+from examples_for_tests.level2.module1 import Class1 as Class1_level2
+from examples_for_tests.module1 import Class1
+
+
+class TestDiscoverByName(TestCase):
+
+    def test_discover_classes_by_package_name(self):
+        # EXECUTE
+        classes = discover_classes('examples_for_tests')
+
+        # VERIFY
+        self.assertEqual(2, len(classes))
+        self.assertIn(Class1, classes)
+        self.assertIn(Class1_level2, classes)
+
+    def test_discover_by_dotted_package_name(self):
+        # EXECUTE
+        packages = discover_packages('examples_for_tests.level2')
+        module_names = discover_module_names('json')
+
+        # VERIFY
+        self.assertListEqual(['examples_for_tests.level2'], packages)
+        self.assertListEqual(['json.decoder', 'json.encoder', 'json.scanner',
+                              'json.tool'], module_names)
+
+    def test_discover_by_package_name_is_cached(self):
+        # SETUP
+        location = str(Path(__file__).parent.parent / 'test_resources'
+                       / 'examples_for_tests')
+        walked1 = _walk_location('examples_for_tests', location, False, None)
+
+        # EXECUTE
+        walked2 = _walk_location('examples_for_tests', location, False, None)
+
+        # VERIFY
+        self.assertIs(walked1, walked2)
+
+    def test_discover_by_package_name_after_nested_addition(self):
+        # SETUP
+        temp_dir = Path(tempfile.mkdtemp())
+        sub = temp_dir / 'installed_package' / 'sub'
+        sub.mkdir(parents=True)
+        (sub.parent / '__init__.py').write_text('')
+        (sub / '__init__.py').write_text('')
+        (sub / 'module_a.py').write_text('')
+        sys.path.insert(0, str(temp_dir))
+
+        # EXECUTE
+        try:
+            names_before = discover_module_names('installed_package')
+            (sub / 'module_b.py').write_text('')
+            invalidate_caches()
+            names_after = discover_module_names('installed_package')
+        finally:
+            sys.path.remove(str(temp_dir))
+            shutil.rmtree(str(temp_dir))
+
+        # VERIFY
+        self.assertListEqual(['installed_package.sub.module_a'],
+                             names_before)
+        self.assertListEqual(['installed_package.sub.module_a',
+                              'installed_package.sub.module_b'], names_after)
+
+    def test_discover_by_unknown_package_name(self):
+        # EXECUTE & VERIFY
+        with self.assertRaises(ValueError):
+            discover_module_names('no_such_package_exists')
+        with self.assertRaises(ValueError):
+            discover_module_names('examples_for_tests.module1')
+        with self.assertRaises(ValueError):
+            discover_module_names('examples_for_tests.module1.no_such_module')
+
+    def test_directory_mtime_of_removed_directory(self):
+        # SETUP
+        temp_dir = Path(tempfile.mkdtemp())
+        temp_dir.rmdir()
+
+        # EXECUTE
+        mtime = _directory_mtime(temp_dir)
+
+        # VERIFY
+        self.assertIsNone(mtime)
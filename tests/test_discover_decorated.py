@@ -0,0 +1,89 @@
+import ast
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+from barentsz import Descriptor, discover_decorated
+from barentsz._static import describe
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+
+class TestDiscoverDecorated(TestCase):
+    path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                         / 'examples_for_decorated')
+
+    def test_discover_decorated_without_importing(self):
+        # EXECUTE
+        descriptors = discover_decorated(self.path_to_resources, 'route')
+
+        # VERIFY
+        self.assertListEqual(['users', 'orders'],
+                             [d.name for d in descriptors])
+        self.assertEqual('examples_for_decorated.views', descriptors[0].module)
+        self.assertEqual('function', descriptors[0].kind)
+        self.assertEqual(8, descriptors[0].line_nr)
+        self.assertTupleEqual(('examples_for_decorated.route',),
+                              descriptors[0].decorators)
+        self.assertNotIn('examples_for_decorated.views', sys.modules)
+
+    def test_discover_decorated_with_full_names(self):
+        # EXECUTE
+        descriptors = discover_decorated(self.path_to_resources,
+                                         ['examples_for_decorated.task'])
+
+        # VERIFY
+        self.assertListEqual(
+            [Descriptor('examples_for_decorated.sub.jobs', 'nightly',
+                        'function', 5),
+             Descriptor('examples_for_decorated.views', 'Cleanup', 'class',
+                        13)],
+            descriptors)
+
+    def test_discover_decorated_with_privates(self):
+        # EXECUTE
+        descriptors = discover_decorated(self.path_to_resources,
+                                         ['route', 'task'],
+                                         include_privates=True,
+                                         in_private_modules=True)
+
+        # VERIFY
+        self.assertListEqual(
+            ['hidden', 'nightly', 'users', 'Cleanup', 'orders', '_private'],
+            [d.name for d in descriptors])
+
+    def test_discover_decorated_by_package_name(self):
+        # EXECUTE
+        descriptors = discover_decorated('examples_for_decorated.sub', 'task')
+
+        # VERIFY
+        self.assertListEqual(['nightly'], [d.name for d in descriptors])
+
+    def test_describe_with_line_numbers_of_decorators(self):
+        # SETUP
+        source = (self.path_to_resources / 'views.py').read_text()
+        tree = ast.parse(source)
+        # Before Python 3.8, decorated definitions have the line number of
+        # their first decorator.
+        for node in ast.walk(tree):
+            if getattr(node, 'decorator_list', None):
+                node.lineno = node.decorator_list[0].lineno
+
+        # EXECUTE
+        descriptors = describe(tree, 'examples_for_decorated.views')
+
+        # VERIFY
+        self.assertListEqual([8, 13, 15, 20, 25, 29],
+                             [d.line_nr for d in descriptors])
+
+    def test_equal_descriptors_have_equal_hashes(self):
+        # SETUP
+        descriptors = discover_decorated(self.path_to_resources, 'route')
+
+        # EXECUTE
+        rediscovered = discover_decorated(self.path_to_resources, 'route')
+
+        # VERIFY
+        self.assertSetEqual(set(descriptors), set(rediscovered))
+        self.assertEqual(len(descriptors), len(set(descriptors)))
+        self.assertEqual(hash(descriptors[0]), hash(rediscovered[0]))
@@ -0,0 +1,105 @@
+import os
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from barentsz import discover_import_graph
+from barentsz._graph import _imports_of
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+
+class TestDiscoverImportGraph(TestCase):
+    path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                         / 'examples_for_import_graph')
+
+    def test_discover_import_graph(self):
+        # EXECUTE
+        graph = discover_import_graph(self.path_to_resources)
+
+        # VERIFY
+        self.assertDictEqual({
+            'examples_for_import_graph.cycle_a': {
+                'examples_for_import_graph.cycle_b'},
+            'examples_for_import_graph.cycle_b': {
+                'examples_for_import_graph.cycle_a'},
+            'examples_for_import_graph.standalone': set(),
+            'examples_for_import_graph.user': {
+                'examples_for_import_graph.cycle_a',
+                'examples_for_import_graph.standalone'},
+        }, graph.edges)
+        self.assertNotIn('examples_for_import_graph.user', sys.modules)
+
+    def test_cycles(self):
+        # SETUP
+        graph = discover_import_graph(self.path_to_resources)
+
+        # EXECUTE
+        cycles = graph.cycles()
+
+        # VERIFY
+        self.assertListEqual([['examples_for_import_graph.cycle_a',
+                               'examples_for_import_graph.cycle_b']], cycles)
+
+    def test_topological_order(self):
+        # SETUP
+        graph = discover_import_graph(self.path_to_resources, workers=1)
+
+        # EXECUTE
+        order = graph.topological_order()
+
+        # VERIFY
+        self.assertListEqual(['examples_for_import_graph.cycle_b',
+                              'examples_for_import_graph.cycle_a',
+                              'examples_for_import_graph.standalone',
+                              'examples_for_import_graph.user'], order)
+        self.assertListEqual(['examples_for_import_graph.user'],
+                             graph.imported_by(
+                                 'examples_for_import_graph.standalone'))
+
+    def test_graph_is_updated_when_a_module_is_modified(self):
+        # SETUP
+        with TemporaryDirectory() as tmp:
+            package = Path(tmp) / 'graph_package_in_tmp'
+            package.mkdir()
+            (package / '__init__.py').write_text('')
+            (package / 'module_a.py').write_text('')
+            (package / 'module_b.py').write_text('')
+            graph_before = discover_import_graph(package)
+            (package / 'module_a.py').write_text(
+                'from graph_package_in_tmp import module_b\n')
+            os.utime(str(package / 'module_a.py'), (1, 1))
+
+            # EXECUTE
+            graph_after = discover_import_graph(package)
+
+        # VERIFY
+        self.assertSetEqual(
+            set(), graph_before.edges['graph_package_in_tmp.module_a'])
+        self.assertSetEqual(
+            {'graph_package_in_tmp.module_b'},
+            graph_after.edges['graph_package_in_tmp.module_a'])
+
+    def test_graph_skips_modules_that_cannot_be_parsed(self):
+        # SETUP
+        with TemporaryDirectory() as tmp:
+            package = Path(tmp) / 'broken_graph_package_in_tmp'
+            package.mkdir()
+            (package / '__init__.py').write_text('')
+            (package / 'broken.py').write_text('def broken(:\n')
+
+            # EXECUTE
+            graph = discover_import_graph(package)
+
+        # VERIFY
+        self.assertSetEqual(
+            set(), graph.edges['broken_graph_package_in_tmp.broken'])
+        self.assertEqual('ImportGraph(1 modules, 0 edges)', repr(graph))
+
+    def test_imports_of_module_without_origin(self):
+        # EXECUTE
+        imports = _imports_of(None, 'some_module')
+
+        # VERIFY
+        self.assertEqual(frozenset(), imports)
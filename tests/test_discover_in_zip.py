@@ -0,0 +1,158 @@
+import shutil
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest import TestCase
+
+from barentsz import (
+    Walker,
+    discover_attributes,
+    discover_classes,
+    discover_module_names,
+    discover_packages,
+    discover_paths,
+)
+from barentsz._zip import (
+    ZipIndex,
+    path_mtime,
+    split_archive,
+    zip_index,
+)
+
+
+class TestDiscoverInZip(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = Path(tempfile.mkdtemp())
+        cls.archive = cls.temp_dir / 'bundle.zip'
+        with zipfile.ZipFile(str(cls.archive), 'w') as zip_file:
+            zip_file.writestr('zipped_plugins/__init__.py', '')
+            zip_file.writestr('zipped_plugins/plugin_a.py',
+                              '"""The answer."""\n'
+                              'ANSWER = 42  # Some comment.\n\n\n'
+                              'class PluginA:\n    ...\n')
+            zip_file.writestr('zipped_plugins/sub/__init__.py', '')
+            zip_file.writestr('zipped_plugins/sub/plugin_b.py',
+                              'class PluginB:\n    ...\n')
+            zip_file.writestr('zipped_plugins/sub/data.txt', '')
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.path.remove(str(cls.archive.absolute()))
+        shutil.rmtree(str(cls.temp_dir))
+
+    def test_split_archive(self):
+        # EXECUTE
+        split1 = split_archive(self.archive / 'zipped_plugins' / 'sub')
+        split2 = split_archive(self.archive)
+        split3 = split_archive(self.temp_dir)
+
+        # VERIFY
+        self.assertEqual((self.archive, 'zipped_plugins/sub'), split1)
+        self.assertEqual((self.archive, ''), split2)
+        self.assertIsNone(split3)
+
+    def test_zip_index_is_cached(self):
+        # EXECUTE
+        index1 = zip_index(self.archive)
+        index2 = zip_index(self.archive)
+
+        # VERIFY
+        self.assertIs(index1, index2)
+
+    def test_zip_index(self):
+        # SETUP
+        index = ZipIndex(['a/__init__.py', 'a/b/c.py', 'e/'])
+
+        # EXECUTE
+        listing = index.list('a')
+
+        # VERIFY
+        self.assertEqual((['b'], ['__init__.py']), listing)
+        self.assertTrue(index.is_dir('e'))
+        self.assertTrue(index.exists('a/b/c.py'))
+        self.assertFalse(index.exists('a/b/x.py'))
+
+    def test_path_mtime_in_zip(self):
+        # EXECUTE
+        mtime = path_mtime(str(self.archive / 'zipped_plugins/plugin_a.py'))
+        no_mtime = path_mtime(str(self.temp_dir / 'does_not_exist.py'))
+
+        # VERIFY
+        self.assertEqual(self.archive.stat().st_mtime, mtime)
+        self.assertIsNone(no_mtime)
+
+    def test_discover_paths_in_zip(self):
+        # EXECUTE
+        paths = discover_paths(self.archive / 'zipped_plugins', '**/*.py')
+
+        # VERIFY
+        self.assertListEqual([
+            self.archive / 'zipped_plugins/__init__.py',
+            self.archive / 'zipped_plugins/plugin_a.py',
+            self.archive / 'zipped_plugins/sub/__init__.py',
+            self.archive / 'zipped_plugins/sub/plugin_b.py',
+        ], paths)
+
+    def test_discover_paths_in_zip_ending_with_double_star(self):
+        # SETUP
+        directory = self.archive / 'zipped_plugins'
+
+        # EXECUTE
+        all_paths = discover_paths(directory, '**')
+        sub_paths = discover_paths(directory, 'sub/**')
+
+        # VERIFY
+        self.assertListEqual([
+            directory,
+            directory / '__init__.py',
+            directory / 'plugin_a.py',
+            directory / 'sub',
+            directory / 'sub/__init__.py',
+            directory / 'sub/data.txt',
+            directory / 'sub/plugin_b.py',
+        ], all_paths)
+        self.assertListEqual([
+            directory / 'sub',
+            directory / 'sub/__init__.py',
+            directory / 'sub/data.txt',
+            directory / 'sub/plugin_b.py',
+        ], sub_paths)
+
+    def test_discover_packages_and_modules_in_zip(self):
+        # EXECUTE
+        packages = discover_packages(self.archive / 'zipped_plugins')
+        module_names = discover_module_names(self.archive / 'zipped_plugins')
+
+        # VERIFY
+        self.assertListEqual(['zipped_plugins', 'zipped_plugins.sub'],
+                             packages)
+        self.assertListEqual(['zipped_plugins.plugin_a',
+                              'zipped_plugins.sub.plugin_b'], module_names)
+
+    def test_discover_classes_and_attributes_in_zip(self):
+        # EXECUTE
+        classes = discover_classes(self.archive / 'zipped_plugins')
+        attributes = discover_attributes(self.archive / 'zipped_plugins')
+
+        # VERIFY
+        self.assertListEqual(['PluginA', 'PluginB'],
+                             [cls.__name__ for cls in classes])
+        self.assertEqual(1, len(attributes))
+        self.assertEqual('ANSWER', attributes[0].name)
+        self.assertEqual(42, attributes[0].value)
+        self.assertEqual('The answer.', attributes[0].doc)
+        self.assertEqual('Some comment.', attributes[0].comment)
+
+    def test_discover_paths_in_zip_with_walker(self):
+        # EXECUTE
+        paths = discover_paths(self.archive / 'zipped_plugins', '**/*.py',
+                               Walker(exclude=['sub']))
+
+        # VERIFY
+        self.assertListEqual([
+            self.archive / 'zipped_plugins/__init__.py',
+            self.archive / 'zipped_plugins/plugin_a.py',
+        ], paths)
@@ -0,0 +1,157 @@
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from barentsz import (
+    Walker,
+    discover_classes,
+    discover_modules,
+)
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+from examples_for_tests.module1 import Class1
+
+
+class TestDiscoverLoaded(TestCase):
+
+    def test_discover_loaded_modules_without_importing(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+        expected = discover_modules(path_to_resources)
+
+        # EXECUTE
+        with patch('barentsz._importing.import_module_with',
+                   side_effect=AssertionError('Should not import')):
+            modules = discover_modules(path_to_resources, from_loaded=True)
+            modules_by_name = discover_modules('examples_for_tests',
+                                               from_loaded=True)
+
+        # VERIFY
+        self.assertListEqual(expected, modules)
+        self.assertListEqual(expected, modules_by_name)
+
+    def test_discover_loaded_subclasses_without_enumerating(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+        discover_modules(path_to_resources, include_privates=True)
+
+        # EXECUTE
+        with patch('barentsz._importing.import_module_with',
+                   side_effect=AssertionError('Should not import')), \
+                patch('barentsz._discover._members',
+                      side_effect=AssertionError('Should not enumerate')):
+            classes = discover_classes(path_to_resources, signature=str,
+                                       include_privates=True,
+                                       in_private_modules=True,
+                                       from_loaded=True)
+
+        # VERIFY
+        self.assertListEqual([Class1], classes)
+
+    def test_discover_not_loaded_modules(self):
+        # SETUP
+        temp_dir = Path(tempfile.mkdtemp())
+        package_dir = temp_dir / 'not_loaded_package'
+        package_dir.mkdir()
+        (package_dir / '__init__.py').write_text('')
+        (package_dir / 'some_module.py').write_text('class C:\n    ...\n')
+
+        # EXECUTE
+        modules = discover_modules(package_dir, from_loaded=True)
+        shutil.rmtree(str(temp_dir))
+
+        # VERIFY
+        self.assertListEqual(['not_loaded_package.some_module'],
+                             [module.__name__ for module in modules])
+
+    def test_discover_loaded_classes_with_default_signature(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+        expected = discover_classes(path_to_resources)
+
+        # EXECUTE
+        classes = discover_classes(path_to_resources, from_loaded=True)
+
+        # VERIFY
+        self.assertTrue(classes)
+        self.assertListEqual(expected, classes)
+
+    def test_discover_partially_loaded_package(self):
+        # SETUP
+        temp_dir = Path(tempfile.mkdtemp())
+        package_dir = temp_dir / 'partially_loaded_package'
+        package_dir.mkdir()
+        (package_dir / '__init__.py').write_text('')
+        (package_dir / 'module_a.py').write_text('class A:\n    ...\n')
+        (package_dir / 'module_b.py').write_text('class B:\n    ...\n')
+        sys.path.append(str(temp_dir))
+        __import__('partially_loaded_package.module_a')
+
+        # EXECUTE
+        modules = discover_modules('partially_loaded_package',
+                                   from_loaded=True)
+        sys.path.remove(str(temp_dir))
+        shutil.rmtree(str(temp_dir))
+
+        # VERIFY
+        self.assertListEqual(['partially_loaded_package.module_a',
+                              'partially_loaded_package.module_b'],
+                             [module.__name__ for module in modules])
+
+    def test_discover_loaded_modules_with_walker(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+        discover_modules(path_to_resources)
+
+        # EXECUTE
+        modules = discover_modules(path_to_resources, from_loaded=True,
+                                   walker=Walker(exclude=['level2']))
+
+        # VERIFY
+        names = [module.__name__ for module in modules]
+        self.assertIn('examples_for_tests.module1', names)
+        self.assertNotIn('examples_for_tests.level2.module1', names)
+
+    def test_discover_loaded_modules_reuses_walk(self):
+        # SETUP
+        expected = discover_modules('examples_for_tests', from_loaded=True)
+
+        # EXECUTE
+        with patch('barentsz._walking._walk_packages_from',
+                   side_effect=AssertionError('Should not walk')):
+            modules = discover_modules('examples_for_tests',
+                                       from_loaded=True)
+
+        # VERIFY
+        self.assertListEqual(expected, modules)
+
+    def test_discover_loaded_modules_detects_new_module(self):
+        # SETUP
+        temp_dir = Path(tempfile.mkdtemp())
+        package_dir = temp_dir / 'growing_loaded_package'
+        package_dir.mkdir()
+        (package_dir / '__init__.py').write_text('')
+        (package_dir / 'module_a.py').write_text('class A:\n    ...\n')
+        sys.path.append(str(temp_dir))
+        discover_modules('growing_loaded_package', from_loaded=True)
+        (package_dir / 'module_b.py').write_text('class B:\n    ...\n')
+        os.utime(str(package_dir), (0, 0))
+
+        # EXECUTE
+        modules = discover_modules('growing_loaded_package', from_loaded=True)
+        sys.path.remove(str(temp_dir))
+        shutil.rmtree(str(temp_dir))
+
+        # VERIFY
+        self.assertListEqual(['growing_loaded_package.module_a',
+                              'growing_loaded_package.module_b'],
+                             [module.__name__ for module in modules])
@@ -0,0 +1,53 @@
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+from barentsz import (
+    Query,
+    discover_classes,
+    discover_functions,
+)
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+from examples_for_reexports import reexporter
+from examples_for_reexports.origin import Origin, origin_function
+
+
+class TestDiscoverMembers(TestCase):
+
+    def test_discover_with_reexports(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_reexports')
+
+        # EXECUTE
+        functions = discover_functions(path_to_resources)
+        classes = discover_classes(path_to_resources)
+
+        # VERIFY
+        self.assertEqual(3, len(functions))
+        self.assertEqual(2, functions.count(origin_function))
+        self.assertEqual(2, len(classes))
+
+    def test_discover_only_defined_in_module(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_reexports')
+
+        # EXECUTE
+        functions = discover_functions(path_to_resources,
+                                       only_defined_in_module=True)
+        classes = discover_classes(reexporter, only_defined_in_module=True)
+        result = (Query(reexporter, only_defined_in_module=True)
+                  .classes()
+                  .functions()
+                  .run())
+
+        # VERIFY
+        self.assertEqual(2, len(functions))
+        self.assertEqual(1, functions.count(origin_function))
+        self.assertListEqual([reexporter.Own], classes)
+        self.assertListEqual([reexporter.Own], result['classes'])
+        self.assertListEqual([reexporter.own_function], result['functions'])
+        self.assertNotIn(Origin, classes)
@@ -23,3 +23,18 @@ class TestDiscoverModuleNames(TestCase):
         self.assertIn(expected_module0, modules)
         self.assertIn(expected_module1, modules)
         self.assertIn(expected_module2, modules)
+
+    def test_discover_module_names_in_namespace_packages(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests' / 'not_a_package')
+
+        # EXECUTE
+        modules = discover_module_names(path_to_resources,
+                                        namespace_packages=True)
+
+        # VERIFY
+        self.assertListEqual([
+            'not_a_package.is_a_package.module5',
+            'not_a_package.module3',
+        ], modules)
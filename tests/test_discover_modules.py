@@ -1,7 +1,11 @@
+import shutil
+import sys
+import tempfile
 from pathlib import Path
 from unittest import TestCase
 
-from barentsz._discover import discover_modules, _get_modules_from_source
+from barentsz._discover import discover_modules
+from barentsz._modules import _get_modules_from_source
 
 
 class TestDiscoverModules(TestCase):
@@ -46,3 +50,43 @@ class TestDiscoverModules(TestCase):
 
         # VERIFY
         self.assertTrue(a == b == c == d)
+
+    def test_discover_modules_in_namespace_packages(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+
+        # EXECUTE
+        modules = discover_modules(path_to_resources, namespace_packages=True)
+        module_names = [module.__name__ for module in modules]
+
+        # VERIFY
+        self.assertIn('examples_for_tests.not_a_package.module3',
+                      module_names)
+        self.assertIn('examples_for_tests.not_a_package.is_a_package.module5',
+                      module_names)
+
+    def test_discover_modules_in_namespace_package_outside_sys_path(self):
+        # SETUP
+        temp_dir = Path(tempfile.mkdtemp())
+        namespace = temp_dir / 'outside_namespace'
+        (namespace / 'sub').mkdir(parents=True)
+        (namespace / 'module_a.py').write_text('A = 1\n')
+        (namespace / 'sub' / 'module_b.py').write_text('B = 2\n')
+
+        # EXECUTE
+        try:
+            modules = discover_modules(namespace, namespace_packages=True,
+                                       raise_on_fail=True)
+        finally:
+            sys.path.remove(str(temp_dir))
+            sys.path.remove(str(namespace))
+            for name in list(sys.modules):
+                if name.startswith('outside_namespace'):
+                    del sys.modules[name]
+            shutil.rmtree(str(temp_dir))
+
+        # VERIFY
+        self.assertListEqual(['outside_namespace.module_a',
+                              'outside_namespace.sub.module_b'],
+                             [module.__name__ for module in modules])
@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+from barentsz import discover_modules
+from barentsz._importing import import_lazily
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+import examples_for_lazy
+
+
+class TestDiscoverModulesLazily(TestCase):
+    path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                         / 'examples_for_lazy')
+
+    def setUp(self):
+        for name in list(sys.modules):
+            if name.startswith('examples_for_lazy.'):
+                del sys.modules[name]
+                delattr(examples_for_lazy, name.rpartition('.')[2])
+        examples_for_lazy.EXECUTED.clear()
+
+    def test_discover_modules_lazily(self):
+        # EXECUTE
+        modules = discover_modules(self.path_to_resources, lazy=True)
+
+        # VERIFY
+        self.assertEqual(2, len(modules))
+        self.assertListEqual([], examples_for_lazy.EXECUTED)
+        self.assertIs(modules[1], sys.modules['examples_for_lazy.module_b'])
+        self.assertEqual('b', modules[1].value_b)
+        self.assertListEqual(['examples_for_lazy.module_b'],
+                             examples_for_lazy.EXECUTED)
+
+    def test_discover_modules_eagerly(self):
+        # EXECUTE
+        modules = discover_modules(self.path_to_resources)
+
+        # VERIFY
+        self.assertListEqual(['examples_for_lazy.module_a',
+                              'examples_for_lazy.module_b'],
+                             [module.__name__ for module in modules])
+        self.assertListEqual(['examples_for_lazy.module_a',
+                              'examples_for_lazy.module_b'],
+                             examples_for_lazy.EXECUTED)
+
+    def test_imported_modules_are_reused(self):
+        # SETUP
+        from examples_for_lazy import module_a
+
+        # EXECUTE
+        modules = discover_modules(self.path_to_resources, lazy=True)
+
+        # VERIFY
+        self.assertIs(module_a, modules[0])
+        self.assertListEqual(['examples_for_lazy.module_a'],
+                             examples_for_lazy.EXECUTED)
+
+    def test_import_lazily_reuses_imported_modules(self):
+        # EXECUTE
+        module = import_lazily('examples_for_lazy')
+
+        # VERIFY
+        self.assertIs(examples_for_lazy, module)
+
+    def test_import_lazily_without_loader(self):
+        # EXECUTE & VERIFY
+        with self.assertRaises(ImportError):
+            import_lazily('examples_for_lazy.no_such_module')
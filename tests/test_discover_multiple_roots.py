@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+from barentsz import discover_classes, discover_module_names
+from barentsz._walking import _to_package_name
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+from examples_for_readme.module_a import ClassA
+from examples_for_readme.module_b import ClassB
+from examples_for_tests.level2.module1 import Class1 as Class1_level2
+from examples_for_tests.module1 import Class1
+
+
+class TestDiscoverMultipleRoots(TestCase):
+
+    def test_discover_module_names_in_overlapping_roots(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+
+        # EXECUTE
+        module_names = discover_module_names([
+            path_to_resources / 'level2',
+            path_to_resources,
+            str(path_to_resources / 'level2'),
+        ])
+
+        # VERIFY
+        self.assertListEqual(discover_module_names(path_to_resources),
+                             module_names)
+
+    def test_discover_classes_in_multiple_roots(self):
+        # SETUP
+        path_to_resources = Path(__file__).parent.parent / 'test_resources'
+
+        # EXECUTE
+        classes = discover_classes([
+            path_to_resources / 'examples_for_tests',
+            path_to_resources / 'examples_for_readme',
+            path_to_resources / 'examples_for_tests' / 'level2',
+        ])
+
+        # VERIFY
+        self.assertListEqual([ClassA, ClassB, Class1_level2, Class1],
+                             sorted(classes, key=lambda cls: cls.__module__))
+
+    def test_package_cache_is_shared(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+        package_cache = {}
+
+        # EXECUTE
+        name = _to_package_name(path_to_resources / 'level2', package_cache)
+
+        # VERIFY
+        self.assertEqual('examples_for_tests.level2', name)
+        self.assertTrue(package_cache[path_to_resources.absolute()])
+        self.assertFalse(package_cache[path_to_resources.parent.absolute()])
@@ -2,6 +2,7 @@ from pathlib import Path
 from unittest import TestCase
 
 from barentsz._discover import discover_packages
+from barentsz._walking import _iter_modules
 
 
 class TestDiscoverPackages(TestCase):
@@ -37,3 +38,27 @@ class TestDiscoverPackages(TestCase):
         # EXECUTE & VERIFY
         with self.assertRaises(ValueError):
             discover_packages(path_to_resources)
+
+    def test_discover_namespace_packages(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+
+        # EXECUTE
+        packages = discover_packages(path_to_resources,
+                                     namespace_packages=True)
+
+        # VERIFY
+        self.assertListEqual([
+            'examples_for_tests',
+            'examples_for_tests.level2',
+            'examples_for_tests.not_a_package',
+            'examples_for_tests.not_a_package.is_a_package',
+        ], packages)
+
+    def test_iter_modules_without_importer(self):
+        # EXECUTE
+        modules = list(_iter_modules(Path('no_such_directory'), 'package'))
+
+        # VERIFY
+        self.assertListEqual([], modules)
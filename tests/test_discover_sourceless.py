@@ -0,0 +1,126 @@
+import py_compile
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from barentsz import (
+    Query,
+    decorated_with,
+    discover_attributes,
+    discover_classes,
+    discover_decorated,
+    discover_functions,
+    discover_module_names,
+)
+from barentsz._static import describe_code
+
+
+class TestDiscoverSourceless(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = Path(tempfile.mkdtemp())
+        cls.package = cls.temp_dir / 'compiled_plugins'
+        sources = {
+            '__init__.py': '',
+            'plugin.py': ('from functools import lru_cache\n'
+                          'ANSWER: int = 42\n'
+                          'NAMES = [\'a\', \'b\', \'c\']\n'
+                          '_PRIVATE = -1\n'
+                          'SEP = lru_cache.__name__\n\n\n'
+                          'class CompiledPlugin:\n'
+                          '    LIMIT = 3\n\n'
+                          '    def run(self):\n'
+                          '        ...\n\n\n'
+                          'def compiled_function():\n'
+                          '    ...\n\n\n'
+                          '@lru_cache()\n'
+                          'def cached_function():\n'
+                          '    ...\n'),
+        }
+        cls.package.mkdir()
+        for name, source in sources.items():
+            path = cls.package / name
+            path.write_text(source)
+            # Compile next to the source (legacy location) and drop the source.
+            py_compile.compile(str(path), str(path) + 'c', doraise=True)
+            path.unlink()
+
+    @classmethod
+    def tearDownClass(cls):
+        for name in list(sys.modules):
+            if name.startswith('compiled_plugins'):
+                del sys.modules[name]
+        shutil.rmtree(str(cls.temp_dir))
+
+    def test_discover_module_names(self):
+        # EXECUTE
+        names = discover_module_names(self.package)
+
+        # VERIFY
+        self.assertListEqual(['compiled_plugins.plugin'], names)
+
+    def test_discover_classes_and_functions(self):
+        # EXECUTE
+        classes = discover_classes(self.package)
+        functions = discover_functions(self.package,
+                                       only_defined_in_module=True)
+
+        # VERIFY
+        self.assertListEqual(['CompiledPlugin'],
+                             [cls.__name__ for cls in classes])
+        self.assertListEqual(['compiled_function'],
+                             [func.__name__ for func in functions])
+
+    def test_discover_attributes(self):
+        # EXECUTE
+        attributes = discover_attributes(self.package)
+        query_result = Query(self.package).attributes(key='attrs').run()
+
+        # VERIFY
+        self.assertListEqual(['ANSWER', 'NAMES'],
+                             [attr.name for attr in attributes])
+        answer, names = attributes
+        self.assertEqual(42, answer.value)
+        self.assertEqual('int', answer.hint)
+        self.assertEqual('42', answer.assigned_value)
+        self.assertEqual(2, answer.line_nr)
+        self.assertEqual(['a', 'b', 'c'], names.value)
+        self.assertListEqual(attributes, query_result['attrs'])
+
+    def test_discover_decorated_without_decorators(self):
+        # EXECUTE
+        decorated = discover_decorated(self.package, 'lru_cache')
+
+        # VERIFY
+        # Decorators cannot be recovered from compiled code.
+        self.assertListEqual([], decorated)
+
+    def test_decorated_with_on_sourceless_module(self):
+        # EXECUTE
+        classes = discover_classes(self.package,
+                                   where=~decorated_with('lru_cache'))
+
+        # VERIFY
+        self.assertListEqual(['CompiledPlugin'],
+                             [cls.__name__ for cls in classes])
+
+    def test_describe_code(self):
+        # SETUP
+        code = compile('X = {"a": (1, 2)}\n'
+                       'Y = [X, 1]\n'
+                       'f = lambda: 1\n'
+                       'class C:\n'
+                       '    Z = -1.5\n', 'mod', 'exec')
+
+        # EXECUTE
+        descriptors = describe_code(code, 'mod')
+
+        # VERIFY
+        self.assertListEqual(['X', 'C', 'C.Z'],
+                             [d.qualname for d in descriptors])
+        self.assertEqual({'a': (1, 2)}, descriptors[0].literal_value)
+        self.assertEqual(-1.5, descriptors[2].literal_value)
+        self.assertEqual(4, descriptors[1].line_nr)
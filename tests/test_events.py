@@ -0,0 +1,119 @@
+import sys
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from barentsz import (
+    Walker,
+    clear_failed_imports,
+    discover_classes,
+    discover_module_names,
+    discover_paths,
+    subscribe,
+    unsubscribe,
+)
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+import examples_for_memory
+
+
+class TestEvents(TestCase):
+    path_to_resources = Path(__file__).parent.parent / 'test_resources'
+
+    def setUp(self):
+        clear_failed_imports()
+        for name in list(sys.modules):
+            if name.startswith('examples_for_memory.'):
+                del sys.modules[name]
+                delattr(examples_for_memory, name.rpartition('.')[2])
+        self.events = []
+        subscribe(self._listener)
+
+    def tearDown(self):
+        unsubscribe(self._listener)
+
+    def _listener(self, event, subject, detail):
+        self.events.append((event, subject, detail))
+
+    def _subjects(self, event):
+        return [subject for event_, subject, _ in self.events
+                if event_ == event]
+
+    def test_discover_classes_emits_events(self):
+        # EXECUTE
+        classes = discover_classes(self.path_to_resources
+                                   / 'examples_for_readme')
+
+        # VERIFY
+        self.assertListEqual(
+            [self.path_to_resources / 'examples_for_readme'],
+            self._subjects('directory_entered'))
+        self.assertListEqual(['examples_for_readme.module_a',
+                              'examples_for_readme.module_b'],
+                             self._subjects('module_found'))
+        self.assertSetEqual(set(classes),
+                            set(self._subjects('element_matched')))
+
+    def test_import_events(self):
+        # EXECUTE
+        discover_classes(self.path_to_resources / 'examples_for_memory')
+
+        # VERIFY
+        self.assertListEqual(['examples_for_memory.a_importer',
+                              'examples_for_memory.broken'],
+                             self._subjects('import_started'))
+        finished = [(subject, detail) for event, subject, detail
+                    in self.events if event == 'import_finished']
+        self.assertListEqual(['examples_for_memory.a_importer'],
+                             [subject for subject, _ in finished])
+        self.assertIsInstance(finished[0][1], float)
+        failed = [(subject, detail) for event, subject, detail
+                  in self.events if event == 'import_failed']
+        self.assertEqual('examples_for_memory.broken', failed[0][0])
+        self.assertIsInstance(failed[0][1], Exception)
+
+    def test_walker_emits_directory_entered(self):
+        # EXECUTE
+        discover_paths(self.path_to_resources / 'examples_for_readme',
+                       '**/*.py', walker=Walker())
+
+        # VERIFY
+        self.assertListEqual(
+            [self.path_to_resources / 'examples_for_readme'],
+            self._subjects('directory_entered'))
+
+    def test_discover_paths_emits_directory_entered(self):
+        # EXECUTE
+        discover_paths(self.path_to_resources / 'examples_for_readme',
+                       '**/*.py')
+
+        # VERIFY
+        self.assertListEqual(
+            [self.path_to_resources / 'examples_for_readme'],
+            self._subjects('directory_entered'))
+
+    def test_cached_walk_emits_directory_entered(self):
+        # SETUP
+        discover_module_names('examples_for_readme')
+        self.events.clear()
+
+        # EXECUTE
+        with patch('barentsz._walking._walk_packages_from',
+                   side_effect=AssertionError('Should not walk')):
+            discover_module_names('examples_for_readme')
+
+        # VERIFY
+        self.assertListEqual(
+            [self.path_to_resources / 'examples_for_readme'],
+            self._subjects('directory_entered'))
+
+    def test_unsubscribe(self):
+        # SETUP
+        unsubscribe(self._listener)
+
+        # EXECUTE
+        discover_classes(self.path_to_resources / 'examples_for_readme')
+
+        # VERIFY
+        self.assertListEqual([], self.events)
@@ -0,0 +1,100 @@
+import os
+import sys
+import traceback
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from barentsz import (
+    Report,
+    clear_failed_imports,
+    discover_modules,
+    failed_imports,
+)
+from barentsz._importing import _source_mtime
+
+
+class TestFailedImports(TestCase):
+
+    def setUp(self):
+        clear_failed_imports()
+
+    def test_failed_imports_are_skipped_until_modified(self):
+        # SETUP
+        with TemporaryDirectory() as tmp:
+            sys.path.append(tmp)
+            package = Path(tmp) / 'failing_package_in_tmp'
+            package.mkdir()
+            (package / '__init__.py').write_text('ATTEMPTS = []\n')
+            (package / 'failing.py').write_text(
+                'from failing_package_in_tmp import ATTEMPTS\n'
+                'ATTEMPTS.append(1)\n'
+                'raise RuntimeError("failed")\n')
+            report1 = Report()
+            report2 = Report()
+            report3 = Report()
+
+            # EXECUTE
+            discover_modules(package, report=report1)
+            discover_modules(package, report=report2)
+            failed = failed_imports()
+            (package / 'failing.py').write_text('SUCCESS = True\n')
+            os.utime(str(package / 'failing.py'), (1, 1))
+            modules = discover_modules(package, report=report3)
+            sys.path.remove(tmp)
+
+        # VERIFY
+        from failing_package_in_tmp import ATTEMPTS
+        self.assertListEqual([1], ATTEMPTS)
+        self.assertListEqual(['failing_package_in_tmp.failing'],
+                             list(report1.failed))
+        self.assertListEqual([], list(report2.failed))
+        self.assertListEqual(['failing_package_in_tmp.failing'],
+                             report2.skipped)
+        self.assertIsInstance(failed['failing_package_in_tmp.failing'],
+                              RuntimeError)
+        self.assertTrue(modules[0].SUCCESS)
+        self.assertListEqual(['failing_package_in_tmp.failing'],
+                             report3.imported)
+        self.assertDictEqual({}, failed_imports())
+
+    def test_skipped_imports_raise_on_fail(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_warmup')
+        discover_modules(path_to_resources)
+
+        # EXECUTE & VERIFY
+        with self.assertRaises(ImportError):
+            discover_modules(path_to_resources, raise_on_fail=True)
+        self.assertIn('examples_for_warmup.zeta_broken', failed_imports())
+
+    def test_skipped_imports_raise_new_errors(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_warmup')
+        discover_modules(path_to_resources)
+        failure = failed_imports()['examples_for_warmup.zeta_broken']
+        frames = len(traceback.extract_tb(failure.__traceback__))
+        errors = []
+
+        # EXECUTE
+        for _ in range(2):
+            with self.assertRaises(ImportError) as context:
+                discover_modules(path_to_resources, raise_on_fail=True)
+            errors.append(context.exception.__cause__)
+
+        # VERIFY
+        self.assertIsNot(errors[0], errors[1])
+        self.assertIs(failure, errors[0].__cause__)
+        self.assertEqual(frames,
+                         len(traceback.extract_tb(failure.__traceback__)))
+
+    def test_source_mtime_of_unfindable_module(self):
+        # EXECUTE
+        mtime = _source_mtime('os.path.does_not_exist')
+        no_parent = _source_mtime('not_imported_package.module')
+
+        # VERIFY
+        self.assertIsNone(mtime)
+        self.assertIsNone(no_parent)
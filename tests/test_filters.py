@@ -0,0 +1,126 @@
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+from barentsz import (
+    Query,
+    decorated_with,
+    discover_classes,
+    discover_functions,
+    has_attribute,
+    in_module,
+    is_abstract,
+    name_matches,
+    predicate,
+)
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+from examples_for_filters.handlers import (
+    BaseHandler,
+    Helper,
+    OrderHandler,
+    UserHandler,
+    registered_function,
+)
+
+
+class TestFilters(TestCase):
+    path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                         / 'examples_for_filters')
+
+    def test_discover_with_combined_filters(self):
+        # SETUP
+        where = name_matches('.*Handler$') & ~is_abstract()
+
+        # EXECUTE
+        classes = discover_classes(self.path_to_resources, where=where)
+
+        # VERIFY
+        self.assertListEqual([OrderHandler, UserHandler], classes)
+
+    def test_discover_with_or_filters(self):
+        # SETUP
+        where = has_attribute('route') | is_abstract()
+
+        # EXECUTE
+        classes = discover_classes(self.path_to_resources, where=where)
+
+        # VERIFY
+        self.assertListEqual([BaseHandler, Helper, UserHandler], classes)
+
+    def test_filters_are_combined_with_signature_and_exclude(self):
+        # EXECUTE
+        classes = discover_classes(self.path_to_resources,
+                                   signature=BaseHandler,
+                                   exclude=UserHandler,
+                                   where=in_module('*.handlers'))
+
+        # VERIFY
+        self.assertListEqual([BaseHandler, OrderHandler], classes)
+
+    def test_exclude_predicates_are_evaluated_after_signature(self):
+        # EXECUTE
+        classes = discover_classes(
+            self.path_to_resources, signature=BaseHandler,
+            exclude=lambda cls: cls.handle is UserHandler.handle)
+
+        # VERIFY
+        self.assertListEqual([BaseHandler, OrderHandler], classes)
+
+    def test_decorated_with(self):
+        # EXECUTE
+        classes = discover_classes(self.path_to_resources,
+                                   where=decorated_with('register'))
+        functions = discover_functions(self.path_to_resources,
+                                       where=decorated_with('register'))
+
+        # VERIFY
+        self.assertListEqual([UserHandler], classes)
+        self.assertListEqual([registered_function], functions)
+
+    def test_cheapest_filters_are_evaluated_first(self):
+        # SETUP
+        calls = []
+        expensive = predicate(lambda elem: calls.append(elem) or True, 10)
+        where = expensive & name_matches('^User')
+
+        # EXECUTE
+        classes = discover_classes(self.path_to_resources, where=where)
+
+        # VERIFY
+        self.assertListEqual([UserHandler], classes)
+        self.assertListEqual([UserHandler], calls)
+
+    def test_query_with_filters(self):
+        # EXECUTE
+        result = (Query(self.path_to_resources)
+                  .classes(where=~is_abstract() & name_matches('.*Handler'))
+                  .functions(where=name_matches('plain'))
+                  .run())
+
+        # VERIFY
+        self.assertListEqual([OrderHandler, UserHandler], result['classes'])
+        self.assertListEqual(['plain_function'],
+                             [f.__name__ for f in result['functions']])
+
+    def test_repr(self):
+        # SETUP
+        where = decorated_with('register') & name_matches('x')
+
+        # EXECUTE
+        representation = repr(where)
+
+        # VERIFY
+        self.assertEqual('Filter(name matches x and decorated with register)',
+                         representation)
+
+    def test_call(self):
+        # SETUP
+        where = name_matches('^User') & ~is_abstract()
+
+        # EXECUTE
+        results = [where(UserHandler), where(OrderHandler)]
+
+        # VERIFY
+        self.assertListEqual([True, False], results)
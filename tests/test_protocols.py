@@ -0,0 +1,77 @@
+import sys
+from pathlib import Path
+from unittest import TestCase, skipIf
+
+from barentsz import discover_classes
+from barentsz._protocols import (
+    _MEMBERS,
+    conforms,
+    is_runtime_protocol,
+    members_of,
+    protocol_members,
+)
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+from examples_for_protocols import shapes
+
+if sys.version_info >= (3, 8):
+    from examples_for_protocols.protocols import (
+        ExplicitShape,
+        HasArea,
+        HasNamedArea,
+        NotRuntimeCheckable,
+    )
+
+# typing.Protocol and runtime_checkable exist from Python 3.8 on.
+_requires_protocols = skipIf(sys.version_info < (3, 8),
+                             'typing.Protocol requires Python 3.8+')
+
+
+class TestProtocols(TestCase):
+
+    @_requires_protocols
+    def test_is_runtime_protocol(self):
+        # VERIFY
+        self.assertTrue(is_runtime_protocol(HasArea))
+        self.assertFalse(is_runtime_protocol(NotRuntimeCheckable))
+        self.assertFalse(is_runtime_protocol(ExplicitShape))
+        self.assertFalse(is_runtime_protocol(int))
+
+    @_requires_protocols
+    def test_protocol_members(self):
+        # VERIFY
+        self.assertSetEqual({'area'}, protocol_members(HasArea))
+        self.assertSetEqual({'area', 'name'}, protocol_members(HasNamedArea))
+
+    def test_members_of_are_cached(self):
+        # EXECUTE
+        members1 = members_of(shapes.NamedSquare)
+        members2 = members_of(shapes.NamedSquare)
+
+        # VERIFY
+        self.assertIs(members1, members2)
+        self.assertIs(members1, _MEMBERS[shapes.NamedSquare])
+        self.assertIn('name', members1)
+        self.assertNotIn('area', members_of(shapes.Unmeasurable))
+
+    @_requires_protocols
+    def test_conforms(self):
+        # VERIFY
+        self.assertTrue(conforms(shapes.Circle, HasNamedArea))
+        self.assertFalse(conforms(shapes.Square, HasNamedArea))
+        self.assertTrue(conforms(shapes.Square, HasArea))
+        self.assertFalse(conforms(shapes.Unmeasurable, HasArea))
+        self.assertTrue(conforms(ExplicitShape, HasNamedArea))
+
+    @_requires_protocols
+    def test_discover_classes_with_protocol(self):
+        # EXECUTE
+        has_area = discover_classes(shapes, signature=HasArea)
+        has_named_area = discover_classes(shapes, signature=HasNamedArea)
+
+        # VERIFY
+        self.assertListEqual([shapes.Circle, shapes.NamedSquare,
+                              shapes.Square], has_area)
+        self.assertListEqual([shapes.Circle, shapes.NamedSquare],
+                             has_named_area)
@@ -0,0 +1,84 @@
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+from unittest import TestCase
+
+from barentsz import (
+    Query,
+    discover_attributes,
+    discover_classes,
+    discover_functions,
+)
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+from examples_for_tests.level2.module1 import Class1 as Class1_level2
+from examples_for_tests.module1 import Class1
+
+
+class TestQuery(TestCase):
+
+    def test_query_equals_separate_discoveries(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+
+        # EXECUTE
+        result = (Query(path_to_resources, in_private_modules=True)
+                  .classes()
+                  .functions()
+                  .attributes()
+                  .run())
+
+        # VERIFY
+        self.assertListEqual(
+            discover_classes(path_to_resources, in_private_modules=True),
+            result['classes'])
+        self.assertListEqual(
+            discover_functions(path_to_resources, in_private_modules=True),
+            result['functions'])
+        self.assertListEqual(
+            discover_attributes(path_to_resources, in_private_modules=True),
+            result['attributes'])
+
+    def test_query_with_multiple_signatures(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+
+        # EXECUTE
+        result = (Query(path_to_resources, include_privates=True)
+                  .classes(signature=str, key='strs')
+                  .classes(exclude=Class1, key='no_class1')
+                  .functions(signature=Callable[[int], str], key='none')
+                  .attributes(signature=int, key='ints')
+                  .attributes(signature=str, key='strs_attrs')
+                  .run())
+
+        # VERIFY
+        self.assertListEqual([Class1], result['strs'])
+        self.assertIn(Class1_level2, result['no_class1'])
+        self.assertNotIn(Class1, result['no_class1'])
+        self.assertListEqual([], result['none'])
+        self.assertTrue(all(isinstance(a.value, int) for a in result['ints']))
+        self.assertEqual(1, len(result['strs_attrs']))
+
+    def test_query_with_duplicate_key(self):
+        # EXECUTE & VERIFY
+        with self.assertRaises(ValueError):
+            Query('.').classes().classes()
+
+    def test_query_skips_private_modules(self):
+        # SETUP
+        module = ModuleType('_private_module')
+        module.PrivateModuleClass = type('PrivateModuleClass', (), {
+            '__module__': '_private_module'})
+
+        # EXECUTE
+        hidden = Query(module).classes().run()
+        shown = Query(module, in_private_modules=True).classes().run()
+
+        # VERIFY
+        self.assertListEqual([], hidden['classes'])
+        self.assertListEqual([module.PrivateModuleClass], shown['classes'])
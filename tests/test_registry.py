@@ -0,0 +1,134 @@
+import os
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from barentsz import Registry
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+from examples_for_filters.handlers import (
+    BaseHandler,
+    OrderHandler,
+    UserHandler,
+)
+
+
+class TestRegistry(TestCase):
+    path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                         / 'examples_for_filters')
+
+    def test_lookups(self):
+        # SETUP
+        registry = Registry(self.path_to_resources)
+
+        # EXECUTE & VERIFY
+        self.assertIs(UserHandler,
+                      registry.get('examples_for_filters.handlers.UserHandler'))
+        self.assertIsNone(registry.get('examples_for_filters.Unknown'))
+        self.assertListEqual([OrderHandler], registry.by_name('OrderHandler'))
+        self.assertListEqual([], registry.by_name('Unknown'))
+        self.assertListEqual([OrderHandler, UserHandler],
+                             registry.subclasses_of(BaseHandler))
+        self.assertIn(BaseHandler,
+                      registry.in_module('examples_for_filters.handlers'))
+        self.assertIn(UserHandler, registry)
+        self.assertNotIn(TestRegistry, registry)
+        self.assertEqual(5, len(registry))
+
+    def test_registry_with_signature(self):
+        # EXECUTE
+        registry = Registry(self.path_to_resources, signature=BaseHandler)
+
+        # VERIFY
+        self.assertSetEqual({BaseHandler, OrderHandler, UserHandler},
+                            set(registry))
+
+    def test_refresh_only_changed_modules(self):
+        # SETUP
+        with TemporaryDirectory() as tmp:
+            package = Path(tmp) / 'registry_package_in_tmp'
+            package.mkdir()
+            (package / '__init__.py').write_text('')
+            (package / 'module_a.py').write_text('class A:\n    ...\n')
+            (package / 'module_b.py').write_text('class B:\n    ...\n')
+            registry = Registry(package)
+            snapshot = registry.snapshot()
+            unchanged = registry.refresh()
+
+            (package / 'module_a.py').write_text(
+                'class A:\n    ...\n\n\nclass A2(A):\n    ...\n')
+            os.utime(str(package / 'module_a.py'), (1, 1))
+            (package / 'module_c.py').write_text('class C:\n    ...\n')
+            (package / 'module_b.py').unlink()
+
+            # EXECUTE
+            changed = registry.refresh()
+
+        # VERIFY
+        self.assertListEqual([], unchanged)
+        self.assertListEqual(['registry_package_in_tmp.module_a',
+                              'registry_package_in_tmp.module_b',
+                              'registry_package_in_tmp.module_c'], changed)
+        self.assertListEqual(['A', 'A2', 'C'],
+                             sorted(cls.__name__ for cls in registry))
+        self.assertListEqual(
+            ['A2'], [cls.__name__ for cls in registry.subclasses_of(
+                registry.get('registry_package_in_tmp.module_a.A'))])
+        self.assertListEqual(['A', 'B'],
+                             sorted(cls.__name__ for cls in snapshot))
+
+    def test_refresh_with_failing_reload(self):
+        # SETUP
+        with TemporaryDirectory() as tmp:
+            package = Path(tmp) / 'failing_registry_package_in_tmp'
+            package.mkdir()
+            (package / '__init__.py').write_text('')
+            (package / 'module_a.py').write_text('class A:\n    ...\n')
+            registry = Registry(package)
+            strict_registry = Registry(package, raise_on_fail=True)
+            (package / 'module_a.py').write_text('class A(:\n')
+            os.utime(str(package / 'module_a.py'), (1, 1))
+
+            # EXECUTE
+            changed = registry.refresh()
+            unchanged = registry.refresh()
+            failed = list(registry.failed)
+            snapshot = registry.snapshot()
+            with self.assertRaises(ImportError):
+                strict_registry.refresh()
+
+            (package / 'module_a.py').write_text('class B:\n    ...\n')
+            os.utime(str(package / 'module_a.py'), (2, 2))
+            fixed = registry.refresh()
+
+        # VERIFY
+        self.assertListEqual([], changed)
+        self.assertListEqual([], unchanged)
+        self.assertListEqual(['failing_registry_package_in_tmp.module_a'],
+                             failed)
+        self.assertListEqual(['failing_registry_package_in_tmp.module_a'],
+                             fixed)
+        self.assertIn('B', [cls.__name__ for cls in registry])
+        self.assertDictEqual({}, registry.failed)
+        self.assertListEqual(failed, list(snapshot.failed))
+
+    def test_classes_imported_into_other_modules_are_registered_once(self):
+        # SETUP
+        with TemporaryDirectory() as tmp:
+            package = Path(tmp) / 'importing_registry_package_in_tmp'
+            package.mkdir()
+            (package / '__init__.py').write_text('')
+            (package / 'module_a.py').write_text('class A:\n    ...\n')
+            (package / 'module_b.py').write_text(
+                'from importing_registry_package_in_tmp.module_a import A\n')
+
+            # EXECUTE
+            registry = Registry(package)
+
+        # VERIFY
+        self.assertEqual(1, len(registry))
+        self.assertListEqual(
+            ['A'], [cls.__name__ for cls in registry.in_module(
+                'importing_registry_package_in_tmp.module_a')])
@@ -0,0 +1,62 @@
+import sys
+import tracemalloc
+from pathlib import Path
+from unittest import TestCase
+
+from barentsz import (
+    Report,
+    clear_failed_imports,
+    discover_modules,
+)
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+import examples_for_memory
+
+
+class TestReport(TestCase):
+    path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                         / 'examples_for_memory')
+
+    def setUp(self):
+        clear_failed_imports()
+        for name in list(sys.modules):
+            if name.startswith('examples_for_memory.'):
+                del sys.modules[name]
+                delattr(examples_for_memory, name.rpartition('.')[2])
+
+    def test_discover_modules_with_report(self):
+        # SETUP
+        report = Report()
+
+        # EXECUTE
+        modules = discover_modules(self.path_to_resources, report=report)
+
+        # VERIFY
+        self.assertEqual(2, len(modules))
+        self.assertListEqual(['examples_for_memory.a_importer'],
+                             report.imported)
+        self.assertListEqual(['examples_for_memory.big'],
+                             report.already_imported)
+        self.assertListEqual(['examples_for_memory.broken'],
+                             list(report.failed))
+        self.assertListEqual(['examples_for_memory.a_importer'],
+                             list(report.durations))
+        self.assertDictEqual({}, report.memory)
+
+    def test_discover_modules_with_memory_profile(self):
+        # SETUP
+        report = Report()
+
+        # EXECUTE
+        discover_modules(self.path_to_resources, report=report,
+                         profile_memory=True)
+
+        # VERIFY
+        self.assertFalse(tracemalloc.is_tracing())
+        transitive = report.memory['examples_for_memory.a_importer']
+        self_ = report.self_memory['examples_for_memory.a_importer']
+        self.assertGreater(transitive, 1000000)
+        self.assertLess(self_, 1000000)
+        self.assertEqual(sum(report.self_memory.values()),
+                         report.total_memory)
@@ -0,0 +1,178 @@
+import sys
+import time
+from pathlib import Path
+from threading import Thread
+from unittest import TestCase
+from unittest.mock import patch
+
+from barentsz import (
+    Report,
+    Session,
+    discover_attributes,
+    discover_classes,
+    discover_decorated,
+    discover_functions,
+    discover_module_names,
+    discover_modules,
+    discover_paths,
+)
+from barentsz._session import _Flight
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+
+class TestSession(TestCase):
+    path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                         / 'examples_for_tests')
+
+    def test_session_results_equal_discovery(self):
+        # SETUP
+        session = Session()
+
+        # EXECUTE
+        classes = session.discover_classes(self.path_to_resources,
+                                           include_privates=True)
+
+        # VERIFY
+        self.assertListEqual(
+            discover_classes(self.path_to_resources, include_privates=True),
+            classes)
+
+    def test_concurrent_identical_discoveries_are_coalesced(self):
+        # SETUP
+        session = Session()
+        calls = []
+        results = []
+
+        def _slow_discover_packages(*args, **kwargs):
+            calls.append(args)
+            time.sleep(0.1)
+            return ['some_package']
+
+        def _discover():
+            results.append(session.discover_packages(self.path_to_resources))
+
+        threads = [Thread(target=_discover) for _ in range(8)]
+
+        # EXECUTE
+        with patch('barentsz._session.discover_packages',
+                   _slow_discover_packages):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # VERIFY
+        self.assertEqual(1, len(calls))
+        self.assertListEqual([['some_package']] * 8, results)
+
+    def test_results_are_shared_until_cleared(self):
+        # SETUP
+        session = Session()
+        calls = []
+
+        def _discover_packages(*args, **kwargs):
+            calls.append(args)
+            return ['some_package']
+
+        # EXECUTE
+        with patch('barentsz._session.discover_packages', _discover_packages):
+            result = session.discover_packages('.')
+            result.append('mutated')
+            session.discover_packages('.')
+            session.discover_packages('other')
+            session.clear()
+            result_after_clear = session.discover_packages('.')
+
+        # VERIFY
+        self.assertEqual(3, len(calls))
+        self.assertListEqual(['some_package'], result_after_clear)
+
+    def test_failures_are_not_kept(self):
+        # SETUP
+        session = Session()
+
+        # EXECUTE & VERIFY
+        with self.assertRaises(ValueError):
+            session.discover_packages('non/existing/dir')
+        with self.assertRaises(ValueError):
+            session.discover_packages('non/existing/dir')
+
+    def test_discoveries_share_modules(self):
+        # SETUP
+        session = Session()
+        calls = []
+
+        def _discover_modules(*args, **kwargs):
+            calls.append(args)
+            return discover_modules(*args, **kwargs)
+
+        # EXECUTE
+        with patch('barentsz._session.discover_modules', _discover_modules):
+            classes = session.discover_classes(self.path_to_resources)
+            functions = session.discover_functions(self.path_to_resources)
+            attributes = session.discover_attributes(self.path_to_resources)
+            session.discover_classes(self.path_to_resources,
+                                     report=Report())
+
+        # VERIFY
+        self.assertEqual(1, len(calls))
+        self.assertListEqual(discover_classes(self.path_to_resources),
+                             classes)
+        self.assertListEqual(discover_functions(self.path_to_resources),
+                             functions)
+        self.assertListEqual(discover_attributes(self.path_to_resources),
+                             attributes)
+
+    def test_session_wraps_discoveries(self):
+        # SETUP
+        session = Session()
+
+        # EXECUTE
+        paths = session.discover_paths(self.path_to_resources, '**/*.py')
+        module_names = session.discover_module_names(self.path_to_resources)
+        modules = session.discover_modules(self.path_to_resources)
+        decorated = session.discover_decorated(self.path_to_resources,
+                                               'staticmethod')
+
+        # VERIFY
+        self.assertListEqual(
+            discover_paths(self.path_to_resources, '**/*.py'), paths)
+        self.assertListEqual(
+            discover_module_names(self.path_to_resources), module_names)
+        self.assertListEqual(discover_modules(self.path_to_resources),
+                             modules)
+        self.assertListEqual(
+            discover_decorated(self.path_to_resources, 'staticmethod'),
+            decorated)
+
+    def test_unhashable_arguments_are_not_shared(self):
+        # SETUP
+        session = Session()
+        calls = []
+
+        def _discover_packages(*args, **kwargs):
+            calls.append(args)
+            return ['some_package']
+
+        # EXECUTE
+        with patch('barentsz._session.discover_packages', _discover_packages):
+            session.discover_packages({'unhashable': True})
+            session.discover_packages({'unhashable': True})
+            session.discover_packages({'hashable'})
+            session.discover_packages({'hashable'})
+
+        # VERIFY
+        self.assertEqual(3, len(calls))
+
+    def test_waiting_threads_receive_failure(self):
+        # SETUP
+        flight = _Flight()
+
+        # EXECUTE
+        flight.land(error=ValueError('Failed'))
+
+        # VERIFY
+        self.assertTrue(flight.landed())
+        with self.assertRaises(ValueError):
+            flight.outcome()
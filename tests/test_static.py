@@ -0,0 +1,256 @@
+import ast
+import py_compile
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from pkgutil import get_importer
+from types import ModuleType
+from unittest import TestCase
+from unittest.mock import Mock
+
+from barentsz._static import (
+    _annotation,
+    _code_without_source,
+    _evaluate,
+    _load_code,
+    decorators_of,
+    describe_code,
+    describe_module,
+    dotted_name,
+    import_aliases,
+    source_or_code,
+    static_descriptor,
+)
+
+
+def _instruction(opname, arg=None, argval=None):
+    # Mimic a dis.Instruction, as the instructions differ per Python version.
+    return Mock(opname=opname, arg=arg, argval=argval)
+
+
+def _load(value):
+    return _instruction('LOAD_CONST', argval=value)
+
+
+class TestStatic(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = Path(tempfile.mkdtemp())
+        (cls.temp_dir / 'broken_module.py').write_text('def broken(:\n')
+        (cls.temp_dir / 'plain_module.py').write_text('X = 1\n')
+        compiled = cls.temp_dir / 'compiled_module.py'
+        compiled.write_text('X = 1\n\n\ndef f():\n    ...\n')
+        py_compile.compile(str(compiled), str(compiled) + 'c', doraise=True)
+        compiled.unlink()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(str(cls.temp_dir))
+
+    def test_describe_code_with_literals(self):
+        # SETUP
+        code = compile('D = {"a": 1, "b": [2]}\n'
+                       'E = {}\n'
+                       'S = {1, 2, 3}\n'
+                       'L = [1, 2, 3]\n'
+                       'N = -1\n'
+                       'H: int = 2\n', 'mod', 'exec')
+
+        # EXECUTE
+        descriptors = describe_code(code, 'mod')
+
+        # VERIFY
+        self.assertListEqual(['D', 'E', 'S', 'L', 'N', 'H'],
+                             [d.qualname for d in descriptors])
+        self.assertListEqual([{'a': 1, 'b': [2]}, {}, {1, 2, 3}, [1, 2, 3],
+                              -1, 2],
+                             [d.literal_value for d in descriptors])
+        self.assertEqual('int', descriptors[-1].hint)
+
+    def test_evaluate_build_ops(self):
+        # SETUP
+        build_map = [_load('a'), _load(1), _instruction('BUILD_MAP', 1)]
+        build_key_map = [_load(1), _load(('a',)),
+                         _instruction('BUILD_CONST_KEY_MAP', 1)]
+        build_set = [_load(1), _instruction('BUILD_SET', 1)]
+        negative = [_load(2.5), _instruction('UNARY_NEGATIVE')]
+
+        # EXECUTE
+        results = [_evaluate(instructions) for instructions
+                   in (build_map, build_key_map, build_set, negative)]
+
+        # VERIFY
+        self.assertListEqual([({'a': 1},), ({'a': 1},), ({1},), (-2.5,)],
+                             results)
+
+    def test_evaluate_update_ops(self):
+        # SETUP
+        list_extend = [_instruction('BUILD_LIST', 0), _load((1, 2)),
+                       _instruction('LIST_EXTEND', 1)]
+        set_update = [_instruction('BUILD_SET', 0), _load(frozenset({1})),
+                      _instruction('SET_UPDATE', 1)]
+
+        # EXECUTE
+        results = [_evaluate(list_extend), _evaluate(set_update)]
+
+        # VERIFY
+        self.assertListEqual([([1, 2],), ({1},)], results)
+
+    def test_evaluate_non_literals(self):
+        # SETUP
+        non_literals = [
+            [_instruction('LOAD_NAME', argval='x')],
+            [_instruction('BUILD_TUPLE', 1)],
+            [_load('a'), _instruction('UNARY_NEGATIVE')],
+            [_load((1,)), _load((2,)), _instruction('LIST_EXTEND', 1)],
+            [_load((1,)), _load((2,)), _instruction('SET_UPDATE', 1)],
+            [_load(1), _load(2)],
+            [_load(compile('', 'mod', 'exec'))],
+        ]
+
+        # EXECUTE
+        results = [_evaluate(instructions) for instructions in non_literals]
+
+        # VERIFY
+        self.assertListEqual([None] * len(non_literals), results)
+
+    def test_annotation_with_store_annotation(self):
+        # SETUP
+        # Python 3.6 stores the hint of X: int = 1 with STORE_ANNOTATION.
+        store = _instruction('STORE_ANNOTATION', argval='X')
+
+        # EXECUTE
+        hints = _annotation([_instruction('LOAD_NAME', argval='int')], store)
+        no_hints = _annotation([], store)
+
+        # VERIFY
+        self.assertDictEqual({'X': 'int'}, hints)
+        self.assertDictEqual({}, no_hints)
+
+    def test_annotation_without_hint(self):
+        # SETUP
+        statement = [_instruction('LOAD_NAME', argval='int'),
+                     _instruction('LOAD_NAME', argval='d'), _load('X')]
+
+        # EXECUTE
+        hints = _annotation(statement, _instruction('STORE_SUBSCR'))
+        too_short = _annotation(statement[1:], _instruction('STORE_SUBSCR'))
+
+        # VERIFY
+        self.assertDictEqual({}, hints)
+        self.assertDictEqual({}, too_short)
+
+    def test_source_or_code_without_loader(self):
+        # SETUP
+        module = ModuleType('plain_module')
+        module.__file__ = str(self.temp_dir / 'plain_module.py')
+
+        # EXECUTE
+        source = source_or_code(module)
+
+        # VERIFY
+        self.assertEqual('X = 1\n', source)
+
+    def test_static_descriptor_of_unreadable_module(self):
+        # SETUP
+        module = ModuleType('unreadable_module')
+        module.__file__ = str(self.temp_dir / 'does_not_exist.py')
+        cls = type('C', (), {'__module__': 'unreadable_module'})
+        sys.modules['unreadable_module'] = module
+
+        # EXECUTE
+        descriptor = static_descriptor(cls)
+        no_descriptor = static_descriptor(42)
+        del sys.modules['unreadable_module']
+
+        # VERIFY
+        self.assertIsNone(descriptor)
+        self.assertIsNone(no_descriptor)
+
+    def test_static_descriptor_of_module_without_file(self):
+        # SETUP
+        module = ModuleType('module_without_file')
+        cls = type('C', (), {'__module__': 'module_without_file'})
+        sys.modules['module_without_file'] = module
+
+        # EXECUTE
+        descriptor = static_descriptor(cls)
+        del sys.modules['module_without_file']
+
+        # VERIFY
+        self.assertIsNone(descriptor)
+
+    def test_decorators_of_unknown_class(self):
+        # SETUP
+        cls = type('Dynamic', (), {'__module__': __name__})
+
+        # EXECUTE
+        decorators = decorators_of(cls)
+
+        # VERIFY
+        self.assertEqual(frozenset(), decorators)
+
+    def test_describe_module_without_source(self):
+        # SETUP
+        importer = get_importer(str(self.temp_dir))
+
+        # EXECUTE
+        descriptors = describe_module(importer, 'compiled_module')
+
+        # VERIFY
+        self.assertListEqual([('f', 4)], [(d.qualname, d.line_nr)
+                                          for d in descriptors])
+
+    def test_describe_module_that_cannot_be_read(self):
+        # SETUP
+        importer = get_importer(str(self.temp_dir))
+
+        # EXECUTE
+        broken = describe_module(importer, 'broken_module')
+        without_importer = describe_module(None, 'plain_module')
+
+        # VERIFY
+        self.assertListEqual([], broken)
+        self.assertListEqual([], without_importer)
+
+    def test_code_without_source_with_failing_loader(self):
+        # SETUP
+        failing_loader = Mock()
+        failing_loader.get_source.side_effect = ImportError
+        failing_loader.get_code.side_effect = EOFError
+
+        # EXECUTE
+        code = _code_without_source(failing_loader, 'some_module')
+        loaded_code = _load_code(failing_loader, 'some_module')
+        no_code = _load_code(object(), 'some_module')
+
+        # VERIFY
+        self.assertIsNone(code)
+        self.assertIsNone(loaded_code)
+        self.assertIsNone(no_code)
+
+    def test_import_aliases(self):
+        # SETUP
+        tree = ast.parse('import os.path\n'
+                         'import xml.dom as d\n'
+                         'from .sibling import f as g\n')
+
+        # EXECUTE
+        aliases = import_aliases(tree, 'package.module')
+
+        # VERIFY
+        self.assertDictEqual({'os': 'os', 'd': 'xml.dom',
+                              'g': 'package.sibling.f'}, aliases)
+
+    def test_dotted_name_without_name(self):
+        # SETUP
+        subscript = ast.parse('x[0]', mode='eval').body
+        attribute = ast.parse('x[0].y', mode='eval').body
+
+        # EXECUTE
+        names = [dotted_name(subscript), dotted_name(attribute)]
+
+        # VERIFY
+        self.assertListEqual([None, None], names)
@@ -0,0 +1,99 @@
+import gc
+import pickle
+import shutil
+import sys
+import tempfile
+import weakref
+from pathlib import Path
+from unittest import TestCase
+
+from barentsz import (
+    Descriptor,
+    discover_attributes,
+    discover_classes,
+    discover_functions,
+    to_descriptors,
+)
+from barentsz._describe import _signature_text
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+from examples_for_filters.handlers import UserHandler, registered_function
+
+
+class TestToDescriptors(TestCase):
+    path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                         / 'examples_for_readme')
+
+    def test_descriptors_can_be_pickled_and_rehydrated(self):
+        # SETUP
+        elements = (discover_classes(self.path_to_resources)
+                    + discover_functions(self.path_to_resources))
+
+        # EXECUTE
+        descriptors = pickle.loads(pickle.dumps(to_descriptors(elements)))
+
+        # VERIFY
+        self.assertListEqual(elements, [d.rehydrate() for d in descriptors])
+
+    def test_descriptors_of_classes_and_functions(self):
+        # EXECUTE
+        cls, func = to_descriptors([UserHandler, registered_function])
+
+        # VERIFY
+        self.assertEqual(Descriptor('examples_for_filters.handlers',
+                                    'UserHandler', 'class', 15), cls)
+        self.assertTupleEqual(('register',), cls.decorators)
+        self.assertEqual('()', cls.signature)
+        self.assertEqual('function', func.kind)
+        self.assertEqual('()', func.signature)
+        self.assertTrue(func.path.endswith('handlers.py'))
+
+    def test_descriptors_of_attributes(self):
+        # SETUP
+        attributes = discover_attributes(self.path_to_resources)
+
+        # EXECUTE
+        descriptors = to_descriptors(attributes)
+
+        # VERIFY
+        self.assertListEqual(['attr_a', 'attr_b'],
+                             [d.name for d in descriptors])
+        self.assertEqual('attribute', descriptors[0].kind)
+        self.assertEqual(1, descriptors[0].line_nr)
+        self.assertEqual('some attr', descriptors[0].literal_value)
+        self.assertEqual('some attr', descriptors[0].rehydrate())
+
+    def test_literal_value_without_literal(self):
+        # SETUP
+        descriptor = Descriptor('some.module', 'SomeClass', 'class', 1)
+
+        # EXECUTE & VERIFY
+        with self.assertRaises(ValueError):
+            descriptor.literal_value
+
+    def test_descriptors_do_not_keep_modules_alive(self):
+        # SETUP
+        temp_dir = Path(tempfile.mkdtemp())
+        (temp_dir / 'short_lived_module.py').write_text(
+            'class ShortLived:\n    ...\n')
+        sys.path.append(str(temp_dir))
+        module = __import__('short_lived_module')
+        to_descriptors([module.ShortLived])
+        module_ref = weakref.ref(module)
+
+        # EXECUTE
+        del sys.modules['short_lived_module'], module
+        gc.collect()
+        sys.path.remove(str(temp_dir))
+        shutil.rmtree(str(temp_dir))
+
+        # VERIFY
+        self.assertIsNone(module_ref())
+
+    def test_signature_text_of_element_without_signature(self):
+        # EXECUTE
+        text = _signature_text(42)
+
+        # VERIFY
+        self.assertIsNone(text)
@@ -0,0 +1,226 @@
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from barentsz import (
+    Walker,
+    discover_classes,
+    discover_module_names,
+    discover_packages,
+    discover_paths,
+)
+from barentsz._walker import match_path
+from barentsz._walking import _iter_modules
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+from examples_for_tests.module1 import Class1
+
+
+class TestWalker(TestCase):
+
+    def test_allows(self):
+        # SETUP
+        walker1 = Walker(exclude=['level2', 'a/b*'])
+        walker2 = Walker(include=['not_a_package/is_a_package'])
+        walker3 = Walker(max_depth=1)
+
+        # VERIFY
+        self.assertTrue(walker1.allows(()))
+        self.assertFalse(walker1.allows(('level2',)))
+        self.assertFalse(walker1.allows(('x', 'level2')))
+        self.assertFalse(walker1.allows(('a', 'bc')))
+        self.assertTrue(walker1.allows(('b', 'bc')))
+        self.assertTrue(walker2.allows(('not_a_package',)))
+        self.assertTrue(walker2.allows(('not_a_package', 'is_a_package')))
+        self.assertTrue(walker2.allows(('not_a_package', 'is_a_package', 'x')))
+        self.assertFalse(walker2.allows(('level2',)))
+        self.assertTrue(walker3.allows(('level2',)))
+        self.assertFalse(walker3.allows(('level2', 'level3')))
+
+    def test_walker_equality(self):
+        # VERIFY
+        self.assertEqual(Walker(exclude=['x']), Walker(exclude=('x',)))
+        self.assertEqual(hash(Walker(max_depth=2)), hash(Walker(max_depth=2)))
+        self.assertNotEqual(Walker(exclude=['x']), Walker(include=['x']))
+
+    def test_match_path(self):
+        # VERIFY
+        self.assertTrue(match_path(('a.py',), ['**', '*.py']))
+        self.assertTrue(match_path(('a', 'b', 'c.py'), ['**', '*.py']))
+        self.assertTrue(match_path(('a', 'c.py'), ['a', '*.py']))
+        self.assertFalse(match_path(('a', 'b', 'c.py'), ['a', '*.py']))
+        self.assertFalse(match_path(('.a', 'c.py'), ['**', '*.py']))
+        self.assertFalse(match_path(('.c.py',), ['*.py']))
+
+    def test_walk_never_lists_pruned_directories(self):
+        # SETUP
+        listed = []
+
+        def lister(relative):
+            listed.append(relative)
+            if not relative:
+                return ['keep', 'node_modules'], []
+            return [], ['file.py']
+
+        # EXECUTE
+        walked = list(Walker(exclude=['node_modules']).walk(lister))
+
+        # VERIFY
+        self.assertListEqual([(), ('keep',)], listed)
+        self.assertListEqual([((), ['keep'], []),
+                              (('keep',), [], ['file.py'])], walked)
+
+    def test_walk_with_workers_equals_serial_walk(self):
+        # SETUP
+        tree = _tree(depth=3, width=3)
+
+        def lister(relative):
+            return tree[relative]
+
+        walker = Walker(exclude=['d1'], max_depth=2)
+
+        # EXECUTE
+        serial = list(walker.walk(lister))
+        concurrent = list(Walker(exclude=['d1'], max_depth=2,
+                                 workers=4).walk(lister))
+
+        # VERIFY
+        self.assertListEqual(serial, concurrent)
+        self.assertEqual(walker, Walker(exclude=['d1'], max_depth=2,
+                                        workers=4))
+
+    def test_walk_with_workers_lists_concurrently(self):
+        # SETUP
+        tree = _tree(depth=2, width=5)
+        lock = threading.Lock()
+        active = []
+        overlaps = []
+
+        def slow_lister(relative):
+            # A shim for a file system with slow round-trips (e.g. NFS).
+            with lock:
+                active.append(relative)
+                overlaps.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(relative)
+            return tree[relative]
+
+        # EXECUTE
+        serial = list(Walker().walk(slow_lister))
+        serial_overlaps = max(overlaps)
+        overlaps.clear()
+        concurrent = list(Walker(workers=8).walk(slow_lister))
+
+        # VERIFY
+        self.assertEqual(31, len(serial))
+        self.assertListEqual(serial, concurrent)
+        self.assertEqual(1, serial_overlaps)
+        self.assertGreater(max(overlaps), 1)
+
+    def test_closing_walk_with_workers_cancels_listings(self):
+        # SETUP
+        tree = _tree(depth=2, width=5)
+        listed = []
+
+        def lister(relative):
+            listed.append(relative)
+            return tree[relative]
+
+        walk = Walker(workers=1).walk(lister)
+
+        # EXECUTE
+        next(walk)
+        second = next(walk)
+        walk.close()
+
+        # VERIFY
+        self.assertEqual(('d0',), second[0])
+        # Only the subdirectories of the root were ever to be listed.
+        self.assertLessEqual(len(listed), 6)
+
+    def test_walk_with_workers_raises_listing_errors(self):
+        # SETUP
+        def lister(relative):
+            if relative:
+                raise PermissionError(relative)
+            return ['locked'], []
+
+        # EXECUTE & VERIFY
+        with self.assertRaises(PermissionError):
+            list(Walker(workers=2).walk(lister))
+
+    def test_discover_paths_with_walker(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+
+        # EXECUTE
+        paths_all = discover_paths(path_to_resources, '**/*.py', Walker())
+        paths_glob = discover_paths(path_to_resources, '**/*.py')
+        paths_pruned = discover_paths(path_to_resources, '**/*.py',
+                                      Walker(exclude=['not_a_package']))
+        paths_shallow = discover_paths(path_to_resources, '**/*.py',
+                                       Walker(max_depth=0))
+        paths_top = discover_paths(path_to_resources, '*.py', Walker())
+        paths_concurrent = discover_paths(path_to_resources, '**/*.py',
+                                          Walker(workers=4))
+
+        # VERIFY
+        self.assertListEqual(paths_glob, paths_all)
+        self.assertListEqual(paths_glob, paths_concurrent)
+        self.assertEqual(6, len(paths_pruned))
+        self.assertTrue(all('not_a_package' not in str(p)
+                            for p in paths_pruned))
+        self.assertListEqual(paths_top, paths_shallow)
+        self.assertEqual(3, len(paths_top))
+
+    def test_discover_with_walker(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+        walker = Walker(exclude=['level2'])
+
+        # EXECUTE
+        packages = discover_packages(path_to_resources, walker=walker)
+        module_names = discover_module_names(path_to_resources, walker=walker)
+        classes = discover_classes(path_to_resources, walker=walker)
+
+        # VERIFY
+        self.assertListEqual(['examples_for_tests'], packages)
+        self.assertListEqual(['examples_for_tests.module1'], module_names)
+        self.assertListEqual([Class1], classes)
+
+    def test_discover_module_names_with_workers(self):
+        # SETUP
+        path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                             / 'examples_for_tests')
+        threads = set()
+
+        def iter_modules(*args, **kwargs):
+            threads.add(threading.current_thread())
+            return _iter_modules(*args, **kwargs)
+
+        # EXECUTE
+        serial = discover_module_names(path_to_resources)
+        with patch('barentsz._walking._iter_modules', iter_modules):
+            concurrent = discover_module_names(path_to_resources,
+                                               walker=Walker(workers=4))
+
+        # VERIFY
+        self.assertListEqual(serial, concurrent)
+        # Subpackages are listed ahead by the workers.
+        self.assertTrue(threads - {threading.main_thread()})
+
+
+def _tree(depth, width, relative=()):
+    # Return the listings of a tree of directories with a file in each.
+    dirs = ['d{}'.format(index) for index in range(width)] if depth else []
+    result = {relative: (dirs, ['file.py'])}
+    for name in dirs:
+        result.update(_tree(depth - 1, width, relative + (name,)))
+    return result
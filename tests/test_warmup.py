@@ -0,0 +1,69 @@
+import gc
+import sys
+from pathlib import Path
+from unittest import TestCase, skipIf
+
+from barentsz import clear_failed_imports, warmup
+
+sys.path.append(str(Path(__file__).parent.parent / 'test_resources'))
+
+
+class TestWarmup(TestCase):
+    path_to_resources = (Path(__file__).parent.parent / 'test_resources'
+                         / 'examples_for_warmup')
+
+    def setUp(self):
+        clear_failed_imports()
+        for name in list(sys.modules):
+            if name.startswith('examples_for_warmup.'):
+                del sys.modules[name]
+
+    def test_warmup_imports_in_dependency_order(self):
+        # EXECUTE
+        report = warmup(self.path_to_resources)
+
+        # VERIFY
+        self.assertListEqual(['examples_for_warmup.gamma',
+                              'examples_for_warmup.beta',
+                              'examples_for_warmup.alpha'], report.imported)
+        self.assertSetEqual(set(report.imported), set(report.durations))
+        self.assertIn('examples_for_warmup.zeta_broken', report.failed)
+        self.assertIn('examples_for_warmup.alpha', sys.modules)
+        self.assertFalse(report.frozen)
+
+    def test_warmup_reports_modules_that_were_imported_already(self):
+        # SETUP
+        warmup(self.path_to_resources)
+
+        # EXECUTE
+        report = warmup(self.path_to_resources)
+
+        # VERIFY
+        self.assertListEqual([], report.imported)
+        self.assertEqual(3, len(report.already_imported))
+
+    @skipIf(not hasattr(gc, 'freeze'), 'gc.freeze requires Python 3.7+')
+    def test_warmup_with_freeze(self):
+        # EXECUTE
+        try:
+            report = warmup(self.path_to_resources, freeze=True)
+        finally:
+            gc.unfreeze()
+
+        # VERIFY
+        self.assertTrue(report.frozen)
+
+    def test_warmup_with_raise_on_fail(self):
+        # EXECUTE & VERIFY
+        with self.assertRaises(ImportError):
+            warmup(self.path_to_resources, raise_on_fail=True)
+
+    def test_warmup_report_totals(self):
+        # EXECUTE
+        report = warmup(self.path_to_resources)
+
+        # VERIFY
+        self.assertEqual(sum(report.durations.values()), report.total_duration)
+        self.assertTrue(repr(report).startswith(
+            'Report(imported=3, already_imported=0, failed=1, skipped=0, '
+            'pending=0, total_duration='))